@@ -4,6 +4,14 @@
 # modules depend on the global config dict for initialization.
 from .config import *
 
+import pkg_resources
+
+try:
+    __version__ = pkg_resources.get_distribution("manimlib").version
+except pkg_resources.DistributionNotFound:
+    # Run from a checkout that was not installed
+    __version__ = "unknown"
+
 from .constants import *
 
 from .container import *
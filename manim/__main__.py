@@ -10,8 +10,9 @@ import types
 
 from . import constants, logger, console, file_writer_config
 from .config.config import args
-from .config import cfg_subcmds
+from .config import cfg_subcmds, cache_subcmds
 from .scene.scene import Scene
+from .mobject.svg.tex_mobject import prefetch_tex_from_file
 from .utils.sounds import play_error_sound, play_finish_sound
 from .utils.file_ops import open_file as open_media_file
 
@@ -154,9 +155,23 @@ def main():
                     cfg_subcmds.export(args.dir)
             else:
                 logger.error("No argument provided; Exiting...")
+        elif "cache" in args.subcommands:
+            if args.cache_subcommand is not None:
+                subcommand = args.cache_subcommand
+                if subcommand == "stats":
+                    cache_subcmds.stats()
+                elif subcommand == "prune":
+                    cache_subcmds.prune(args.max_size)
+            else:
+                logger.error("No argument provided; Exiting...")
 
     else:
         module = get_module(file_writer_config["input_file"])
+        if (
+            file_writer_config["prefetch_tex"]
+            and file_writer_config["input_file"] != "-"
+        ):
+            prefetch_tex_from_file(file_writer_config["input_file"])
         all_scene_classes = get_scene_classes_from_module(module)
         scene_classes_to_render = get_scenes_to_render(all_scene_classes)
         sound_on = file_writer_config["sound"]
@@ -4,14 +4,17 @@
 __all__ = ["Camera", "BackgroundColoredVMobjectDisplayer"]
 
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
+import hashlib
 import itertools as it
 import operator as op
+import queue
 import time
 import copy
+from weakref import WeakKeyDictionary
 
 from PIL import Image
-from scipy.spatial.distance import pdist
 import cairo
 import numpy as np
 
@@ -31,6 +34,10 @@ from ..utils.space_ops import angle_of_vector
 from ..utils.space_ops import get_norm
 
 
+# Shared by all cameras, so that a background version is never reused.
+BACKGROUND_VERSION_COUNTER = it.count()
+
+
 class Camera(object):
     """
     Base Camera class.
@@ -63,8 +70,21 @@ class Camera(object):
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
         "use_z_index": True,
+        # Number of pixel arrays the camera draws into in turn, see
+        # swap_pixel_array and release_pixel_array.
+        "n_pixel_array_buffers": 1,
+        # Whether capture_mobjects_over_background may only restore the
+        # region that changed since the previous frame.
+        "use_dirty_rectangles": True,
+        # Whether get_mobjects_to_display leaves out the mobjects whose
+        # bounding box is entirely outside the frame.
+        "cull_offscreen_mobjects": True,
     }
 
+    # The corners of the bounding box of the points of each mobject, with the
+    # version of the mobject they were computed for.
+    mobject_bounds = WeakKeyDictionary()
+
     def __init__(self, background=None, **kwargs):
         """Initialises the Camera.
 
@@ -95,9 +115,16 @@ class Camera(object):
         # This one is in the same boat as the above, but it doesn't have the
         # same name as the corresponding key so it has to be handled on its own
         self.max_allowable_norm = config["frame_width"]
+        # Number of horizontal bands of the frame in which VMobjects are
+        # rasterized in parallel, see display_multiple_vmobjects_in_bands
+        self.raster_threads = kwargs.get(
+            "raster_threads", config.get("raster_threads", 1)
+        )
+        self.raster_executor = None
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        self.dirty_rectangles = {}
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -222,6 +249,7 @@ class Camera(object):
                 (height, width, self.n_channels), dtype=self.pixel_array_dtype
             )
             self.background[:, :] = background_rgba
+        self.increment_background_version()
 
     def get_image(self, pixel_array=None):
         """Returns an image from the passed
@@ -277,6 +305,16 @@ class Camera(object):
         convert_from_floats : bool, optional
             Whether or not to convert float values to proper RGB values, by default False
         """
+        if hasattr(self, "pixel_array"):
+            self.dirty_rectangles.pop(id(self.pixel_array), None)
+        if (
+            not convert_from_floats
+            and hasattr(self, "pixel_array")
+            and self.pixel_array.shape == np.shape(pixel_array)
+        ):
+            # Set in place, without going through an intermediate copy
+            self.pixel_array[:, :, :] = pixel_array
+            return
         converted_array = self.convert_pixel_array(pixel_array, convert_from_floats)
         if not (
             hasattr(self, "pixel_array")
@@ -287,6 +325,47 @@ class Camera(object):
             # Set in place
             self.pixel_array[:, :, :] = converted_array[:, :, :]
 
+    def swap_pixel_array(self):
+        """Makes the camera draw into another of its n_pixel_array_buffers
+        pixel arrays.
+
+        This lets the current pixel array be handed over (e.g. to the
+        frame writer thread) without copying it, while the next frame is
+        drawn into another buffer.  The pixel array handed over is only
+        drawn into again once it is given back with
+        :meth:`release_pixel_array`, so this blocks while every buffer is
+        still in use.  The new pixel array holds a stale frame, so it has to
+        be reset or set from a background before capturing mobjects into it.
+        """
+        if self.n_pixel_array_buffers <= 1:
+            return
+        buffers = getattr(self, "pixel_array_buffers", [])
+        if not any(buffer is self.pixel_array for buffer in buffers):
+            # The pixel array was replaced, e.g. by a reset at another size,
+            # the buffers still in use are simply not reused.
+            buffers = [self.pixel_array]
+            self.pixel_array_buffers = buffers
+            self.free_pixel_arrays = queue.SimpleQueue()
+        if self.free_pixel_arrays.empty() and len(buffers) < self.n_pixel_array_buffers:
+            buffers.append(np.empty_like(self.pixel_array))
+            self.pixel_array = buffers[-1]
+        else:
+            self.pixel_array = self.free_pixel_arrays.get()
+
+    def release_pixel_array(self, pixel_array):
+        """Gives back a pixel array handed over before a call to
+        :meth:`swap_pixel_array`, once it is no longer used.  This may be
+        called from another thread.
+
+        Parameters
+        ----------
+        pixel_array : np.array
+            The pixel array that was handed over.
+        """
+        buffers = getattr(self, "pixel_array_buffers", [])
+        if any(buffer is pixel_array for buffer in buffers):
+            self.free_pixel_arrays.put(pixel_array)
+
     def set_background(self, pixel_array, convert_from_floats=False):
         """Sets the background to the passed pixel_array after converting
         to valid RGB values.
@@ -299,6 +378,16 @@ class Camera(object):
             Whether or not to convert floats values to proper RGB valid ones, by default False
         """
         self.background = self.convert_pixel_array(pixel_array, convert_from_floats)
+        self.increment_background_version()
+
+    def increment_background_version(self):
+        """Marks the background as changed, so that the frames captured over
+        the previous background are not reused (see :meth:`get_display_key`).
+
+        This is done by :meth:`init_background` and :meth:`set_background`,
+        and has to be called after modifying the background in place.
+        """
+        self.background_version = next(BACKGROUND_VERSION_COUNTER)
 
     # TODO, this should live in utils, not as a method of Camera
     def make_background_from_func(self, coords_to_colors_func):
@@ -413,8 +502,71 @@ class Camera(object):
             if excluded_mobjects:
                 all_excluded = self.extract_mobject_family_members(excluded_mobjects)
                 mobjects = list_difference_update(mobjects, all_excluded)
+            if self.cull_offscreen_mobjects:
+                mobjects = [m for m in mobjects if self.is_mobject_on_screen(m)]
         return mobjects
 
+    def get_mobject_bounds(self, mobject):
+        """Returns the corners of the bounding box of the points of a mobject
+        (without its submobjects).
+
+        The corners are cached until the version of the mobject changes, so
+        a mobject which is not modified is not measured again on each frame.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject, which must have points.
+
+        Returns
+        -------
+        np.array
+            The 8 corners of the box.
+        """
+        cached = self.mobject_bounds.get(mobject)
+        if cached is not None and cached[0] == mobject.version:
+            return cached[1]
+        points = mobject.points
+        bounds = np.array([points.min(axis=0), points.max(axis=0)])
+        corners = np.array(
+            [
+                [bounds[i, 0], bounds[j, 1], bounds[k, 2]]
+                for i, j, k in it.product([0, 1], repeat=3)
+            ]
+        )
+        self.mobject_bounds[mobject] = (mobject.version, corners)
+        return corners
+
+    def is_mobject_on_screen(self, mobject):
+        """Checks whether the points of a mobject (without its submobjects)
+        can paint some pixel of the frame.
+
+        The corners of the bounding box of the points are projected like the
+        points themselves, so this takes the frame of a moving camera and the
+        projection of a 3D camera into account.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject, which must have points.
+
+        Returns
+        -------
+        bool
+            False if the mobject is sure to be out of the frame.
+        """
+        corners = self.get_mobject_bounds(mobject)
+        coords = self.points_to_pixel_coords(mobject, corners)
+        margin = self.get_pixel_margin(mobject)
+        x_min, y_min = coords.min(axis=0) - margin
+        x_max, y_max = coords.max(axis=0) + margin
+        return (
+            x_max >= 0
+            and y_max >= 0
+            and x_min < self.pixel_width
+            and y_min < self.pixel_height
+        )
+
     def is_in_frame(self, mobject):
         """Checks whether the passed mobject is in
         frame or not.
@@ -429,17 +581,8 @@ class Camera(object):
         bool
             True if in frame, False otherwise.
         """
-        fc = self.frame_center
-        fh = self.frame_height
-        fw = self.frame_width
-        return not reduce(
-            op.or_,
-            [
-                mobject.get_right()[0] < fc[0] - fw,
-                mobject.get_bottom()[1] > fc[1] + fh,
-                mobject.get_left()[0] > fc[0] + fw,
-                mobject.get_top()[1] < fc[1] - fh,
-            ],
+        return any(
+            self.is_mobject_on_screen(m) for m in mobject.family_members_with_points()
         )
 
     def capture_mobject(
@@ -477,6 +620,165 @@ class Camera(object):
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
             self.display_funcs[group_type](list(group), self.pixel_array)
 
+    def capture_mobjects_over_background(self, mobjects, background, **kwargs):
+        """Sets the pixel array to `background` and captures `mobjects` on top.
+
+        When the previous frame drawn into the same pixel array used the same
+        background, only the union of the screen-space bounding boxes of the
+        mobjects in that frame and in this one is restored, instead of the
+        whole frame.  Everything outside of it is still untouched background.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects to capture, typically the moving ones.
+        background : np.ndarray
+            The pixel array to draw the mobjects over, e.g. a static image of
+            the other mobjects.
+        kwargs : Any
+            Keyword arguments to be passed to :meth:`get_mobjects_to_display`.
+        """
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        if not self.use_dirty_rectangles:
+            self.set_pixel_array(background)
+            self.capture_mobjects(mobjects, include_submobjects=False)
+            return
+        box = self.get_pixel_bounding_box(mobjects)
+        previous = self.dirty_rectangles.get(id(self.pixel_array))
+        if previous is None or previous[0] is not background:
+            self.set_pixel_array(background)
+        else:
+            region = self.get_bounding_box_union(previous[1], box)
+            if region is not None:
+                x0, y0, x1, y1 = region
+                self.pixel_array[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+        self.capture_mobjects(mobjects, include_submobjects=False)
+        self.dirty_rectangles[id(self.pixel_array)] = (background, box)
+
+    def get_view_key(self):
+        """Returns what determines where the camera displays points.
+
+        Returns
+        -------
+        tuple
+            The pixel shape, the frame shape and the frame center.
+        """
+        return (
+            self.pixel_width,
+            self.pixel_height,
+            self.frame_width,
+            self.frame_height,
+            tuple(self.frame_center),
+        )
+
+    def get_display_key(self, mobjects):
+        """Returns a digest of everything that capturing `mobjects` over the
+        background depends on.
+
+        Two calls return the same digest only if the background version, the
+        view and the versions of the mobjects are the same, so a frame
+        rendered for one can be reused for the other.  See
+        :meth:`increment_background_version` and :attr:`.Mobject.version`.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects, as returned by :meth:`get_mobjects_to_display`.
+
+        Returns
+        -------
+        bytes
+            The digest.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr((type(self).__name__, self.get_view_key())).encode())
+        hasher.update(f"{getattr(self, 'background_version', None)};".encode())
+        for mobject in mobjects:
+            hasher.update(f"{type(mobject).__name__}:{mobject.version};".encode())
+        return hasher.digest()
+
+    def get_pixel_bounding_box(self, mobjects):
+        """Returns the pixel region that displaying `mobjects` can change.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects, as returned by :meth:`get_mobjects_to_display`.
+
+        Returns
+        -------
+        tuple or None
+            The region as (x0, y0, x1, y1), upper bounds excluded, clipped to
+            the frame.  None if the mobjects don't touch any pixel.
+        """
+        box = None
+        for mobject in mobjects:
+            if len(mobject.points) == 0:
+                continue
+            coords = self.points_to_pixel_coords(mobject, mobject.points)
+            margin = self.get_pixel_margin(mobject)
+            mobject_box = (
+                coords[:, 0].min() - margin,
+                coords[:, 1].min() - margin,
+                coords[:, 0].max() + margin + 1,
+                coords[:, 1].max() + margin + 1,
+            )
+            box = self.get_bounding_box_union(box, mobject_box)
+        if box is None:
+            return None
+        x0, y0, x1, y1 = box
+        box = (
+            int(max(x0, 0)),
+            int(max(y0, 0)),
+            int(min(x1, self.pixel_width)),
+            int(min(y1, self.pixel_height)),
+        )
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return None
+        return box
+
+    def get_pixel_margin(self, mobject):
+        """Returns how many pixels around its points a mobject can paint.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject
+
+        Returns
+        -------
+        int
+            The margin in pixels, including room for antialiasing.
+        """
+        if isinstance(mobject, VMobject):
+            width = max(
+                mobject.get_stroke_width(), mobject.get_stroke_width(background=True)
+            )
+            pixel_width = (
+                width * self.cairo_line_width_multiple * self.pixel_width
+            ) / self.frame_width
+            # Cairo's miter joins can stick out up to 5 line widths
+            return int(np.ceil(5 * pixel_width)) + 2
+        if isinstance(mobject, PMobject):
+            return int(self.adjusted_thickness(mobject.stroke_width)) + 2
+        return 2
+
+    @staticmethod
+    def get_bounding_box_union(box1, box2):
+        """Returns the smallest (x0, y0, x1, y1) box containing both boxes,
+        either of which can be None.
+        """
+        if box1 is None:
+            return box2
+        if box2 is None:
+            return box1
+        return (
+            min(box1[0], box2[0]),
+            min(box1[1], box2[1]),
+            max(box1[2], box2[2]),
+            max(box1[3], box2[3]),
+        )
+
     # Methods associated with svg rendering
 
     # NOTE: None of the methods below have been mentioned outside of their definitions. Their DocStrings are not as
@@ -531,27 +833,70 @@ class Camera(object):
             return cached_ctx
         pw = self.pixel_width
         ph = self.pixel_height
-        fw = self.frame_width
-        fh = self.frame_height
-        fc = self.frame_center
         surface = cairo.ImageSurface.create_for_data(
             pixel_array, cairo.FORMAT_ARGB32, pw, ph
         )
         ctx = cairo.Context(surface)
         ctx.scale(pw, ph)
-        ctx.set_matrix(
-            cairo.Matrix(
-                fdiv(pw, fw),
-                0,
-                0,
-                -fdiv(ph, fh),
-                (pw / 2) - fc[0] * fdiv(pw, fw),
-                (ph / 2) + fc[1] * fdiv(ph, fh),
-            )
-        )
+        ctx.set_matrix(self.get_cairo_matrix())
         self.cache_cairo_context(pixel_array, ctx)
         return ctx
 
+    def get_cairo_matrix(self):
+        """Returns the transformation from frame coordinates to pixel
+        coordinates used by cairo contexts.
+
+        Returns
+        -------
+        cairo.Matrix
+            The matrix.
+        """
+        pw = self.pixel_width
+        ph = self.pixel_height
+        fw = self.frame_width
+        fh = self.frame_height
+        fc = self.frame_center
+        return cairo.Matrix(
+            fdiv(pw, fw),
+            0,
+            0,
+            -fdiv(ph, fh),
+            (pw / 2) - fc[0] * fdiv(pw, fw),
+            (ph / 2) + fc[1] * fdiv(ph, fh),
+        )
+
+    def get_band_cairo_contexts(self, pixel_array):
+        """Returns cairo contexts drawing into horizontal bands of a pixel array.
+
+        Each context has its own surface, over a view of the rows of its
+        band, so it can only paint these rows.  Its matrix is shifted so
+        that it draws exactly what :meth:`get_cairo_context` would draw there.
+
+        Parameters
+        ----------
+        pixel_array : np.array
+            The pixel array, which the surfaces share.
+
+        Returns
+        -------
+        list
+            One cairo context per band, from top to bottom.
+        """
+        pw = self.pixel_width
+        ph = self.pixel_height
+        n_bands = max(min(self.raster_threads, ph), 1)
+        edges = np.linspace(0, ph, n_bands + 1).astype(int)
+        contexts = []
+        for top, bottom in zip(edges, edges[1:]):
+            surface = cairo.ImageSurface.create_for_data(
+                pixel_array[top:bottom], cairo.FORMAT_ARGB32, pw, bottom - top
+            )
+            ctx = cairo.Context(surface)
+            ctx.translate(0, -top)
+            ctx.transform(self.get_cairo_matrix())
+            contexts.append(ctx)
+        return contexts
+
     def display_multiple_vectorized_mobjects(self, vmobjects, pixel_array):
         """Displays multiple VMobjects in the pixel_array
 
@@ -586,10 +931,79 @@ class Camera(object):
         pixel_array : np.ndarray
             The Pixel array to add the VMobjects to.
         """
+        if self.raster_threads > 1:
+            self.display_multiple_vmobjects_in_bands(vmobjects, pixel_array)
+            return
         ctx = self.get_cairo_context(pixel_array)
         for vmobject in vmobjects:
             self.display_vectorized(vmobject, ctx)
 
+    def display_multiple_vmobjects_in_bands(self, vmobjects, pixel_array):
+        """Displays VMobjects by rasterizing horizontal bands of the frame
+        on several threads.
+
+        The path and the colors of each VMobject are computed once, and each
+        thread then fills and strokes all the paths, in order, into its own
+        band (see :meth:`get_band_cairo_contexts`).  pycairo releases the
+        GIL while cairo fills and strokes, which lets the bands be drawn in
+        parallel; how much faster this is depends on the frame, see
+        ``scripts/benchmark_raster_threads.py``.
+
+        Parameters
+        ----------
+        vmobjects : list
+            list of the VMobjects, which don't have background images
+        pixel_array : np.ndarray
+            The Pixel array to add the VMobjects to.
+        """
+        # The paths are built in user space on a scratch context, to be
+        # appended to each band context as they are
+        path_ctx = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        drawings = []
+        for vmobject in vmobjects:
+            path_data = self.get_cairo_path_data(vmobject)
+            if path_data is None:
+                continue
+            self.draw_cairo_path(path_ctx, path_data)
+            # (source, line width) of the strokes, or (source, None) for the
+            # fill, in the order of display_vectorized
+            operations = []
+            for background in [True, False]:
+                width = self.get_cairo_line_width(vmobject, background)
+                if width != 0:
+                    source = self.get_stroke_cairo_source(vmobject, background)
+                    operations.append((source, width))
+                if background:
+                    operations.append((self.get_fill_cairo_source(vmobject), None))
+            drawings.append((path_ctx.copy_path(), operations))
+
+        def display_band(ctx):
+            for path, operations in drawings:
+                ctx.new_path()
+                ctx.append_path(path)
+                for source, line_width in operations:
+                    ctx.set_source(source)
+                    if line_width is None:
+                        ctx.fill_preserve()
+                    else:
+                        ctx.set_line_width(line_width)
+                        ctx.stroke_preserve()
+
+        if self.raster_executor is None:
+            self.raster_executor = ThreadPoolExecutor(
+                self.raster_threads, thread_name_prefix="manim_raster"
+            )
+        contexts = self.get_band_cairo_contexts(pixel_array)
+        # list() waits for all the bands, and raises their exceptions
+        list(self.raster_executor.map(display_band, contexts))
+
+    def shutdown_raster_executor(self):
+        """Stops the threads of :meth:`display_multiple_vmobjects_in_bands`,
+        which are started again when needed."""
+        if self.raster_executor is not None:
+            self.raster_executor.shutdown(wait=True)
+            self.raster_executor = None
+
     def display_vectorized(self, vmobject, ctx):
         """Displays a VMobject in the cairo context
 
@@ -626,24 +1040,79 @@ class Camera(object):
         Camera
             Camera object after setting cairo_context_path
         """
+        path_data = self.get_cairo_path_data(vmobject)
+        if path_data is None:
+            return
+        self.draw_cairo_path(ctx, path_data)
+        return self
+
+    def get_cairo_path_data(self, vmobject):
+        """Returns the path of a VMobject, as the arguments of the calls
+        drawing it in a cairo context.
+
+        The path is split into subpaths where a curve doesn't start at the end
+        of the previous one, as in :meth:`~.VMobject.gen_subpaths_from_points_2d`,
+        and each subpath is closed if it ends at its start.  This is all
+        computed on the whole points array at once.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+
+        Returns
+        -------
+        Optional[List[Tuple[List[float], List[List[float]], bool]]]
+            For each subpath, its start, the control points and end of each of
+            its curves, and whether it is closed.  ``None`` if the VMobject has
+            no points.
+        """
         points = self.transform_points_pre_display(vmobject, vmobject.points)
         # TODO, shouldn't this be handled in transform_points_pre_display?
         # points = points - self.get_frame_center()
         if len(points) == 0:
-            return
+            return None
+
+        nppcc = vmobject.n_points_per_cubic_curve
+        rtol = 1.0e-5  # As in consider_points_equals_2d
+        atol = vmobject.tolerance_for_point_equality
+        points = points[:, :2]
+        num_points = len(points)
+        curve_starts = np.arange(nppcc, num_points, nppcc)
+        gaps = np.abs(points[curve_starts - 1] - points[curve_starts])
+        is_split = np.any(gaps > atol + rtol * np.abs(points[curve_starts]), axis=1)
+        split_indices = [0, *curve_starts[is_split], num_points]
+
+        path_data = []
+        for start, end in zip(split_indices, split_indices[1:]):
+            if end - start < nppcc:
+                continue
+            subpath = points[start:end]
+            curves = subpath[: len(subpath) - len(subpath) % nppcc]
+            curves = curves.reshape((-1, nppcc, 2))[:, 1:].reshape((-1, 2 * nppcc - 2))
+            gap = np.abs(subpath[0] - subpath[-1])
+            is_closed = bool(np.all(gap <= atol + rtol * np.abs(subpath[-1])))
+            path_data.append((subpath[0].tolist(), curves.tolist(), is_closed))
+        return path_data
+
+    def draw_cairo_path(self, ctx, path_data):
+        """Sets the path of a cairo context.
 
+        Parameters
+        ----------
+        ctx : cairo.Context
+            The cairo context
+        path_data : List[Tuple[List[float], List[List[float]], bool]]
+            The path, as returned by :meth:`get_cairo_path_data`.
+        """
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        for start, curves, is_closed in path_data:
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*start)
+            for curve in curves:
+                ctx.curve_to(*curve)
+            if is_closed:
                 ctx.close_path()
-        return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
         """Sets the color of the cairo context
@@ -662,20 +1131,70 @@ class Camera(object):
         Camera
             The camera object
         """
+        ctx.set_source(self.get_cairo_source(rgbas, vmobject))
+        return self
+
+    def get_cairo_source(self, rgbas, vmobject):
+        """Returns the cairo pattern painting the colors of a VMobject.
+
+        Parameters
+        ----------
+        rgbas : np.ndarray
+            The RGBA array of the colors, as a solid color if it has only one.
+        vmobject : VMobject
+            The VMobject, whose gradient points are used for several colors.
+
+        Returns
+        -------
+        cairo.Pattern
+            The pattern.
+        """
         if len(rgbas) == 1:
             # Use reversed rgb because cairo surface is
             # encodes it in reverse order
-            ctx.set_source_rgba(*rgbas[0][2::-1], rgbas[0][3])
-        else:
-            points = vmobject.get_gradient_start_and_end_points()
-            points = self.transform_points_pre_display(vmobject, points)
-            pat = cairo.LinearGradient(*it.chain(*[point[:2] for point in points]))
-            step = 1.0 / (len(rgbas) - 1)
-            offsets = np.arange(0, 1 + step, step)
-            for rgba, offset in zip(rgbas, offsets):
-                pat.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
-            ctx.set_source(pat)
-        return self
+            return cairo.SolidPattern(*rgbas[0][2::-1], rgbas[0][3])
+        points = vmobject.get_gradient_start_and_end_points()
+        points = self.transform_points_pre_display(vmobject, points)
+        pat = cairo.LinearGradient(*it.chain(*[point[:2] for point in points]))
+        step = 1.0 / (len(rgbas) - 1)
+        offsets = np.arange(0, 1 + step, step)
+        for rgba, offset in zip(rgbas, offsets):
+            pat.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+        return pat
+
+    def get_fill_cairo_source(self, vmobject):
+        """Returns the cairo pattern filling a VMobject."""
+        return self.get_cairo_source(self.get_fill_rgbas(vmobject), vmobject)
+
+    def get_stroke_cairo_source(self, vmobject, background=False):
+        """Returns the cairo pattern stroking a VMobject."""
+        return self.get_cairo_source(
+            self.get_stroke_rgbas(vmobject, background=background), vmobject
+        )
+
+    def get_cairo_line_width(self, vmobject, background=False):
+        """Returns the width of the stroke of a VMobject, in frame units.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+        background : bool, optional
+            Whether to return the width of the background stroke.
+
+        Returns
+        -------
+        float
+            The line width, 0 if there is no stroke.
+        """
+        return (
+            vmobject.get_stroke_width(background)
+            * self.cairo_line_width_multiple
+            *
+            # This ensures lines have constant width
+            # as you zoom in on them.
+            (self.frame_width / self.frame_width)
+        )
 
     def apply_fill(self, ctx, vmobject):
         """Fills the cairo context
@@ -692,7 +1211,7 @@ class Camera(object):
         Camera
             The camera object.
         """
-        self.set_cairo_context_color(ctx, self.get_fill_rgbas(vmobject), vmobject)
+        ctx.set_source(self.get_fill_cairo_source(vmobject))
         ctx.fill_preserve()
         return self
 
@@ -714,20 +1233,11 @@ class Camera(object):
         Camera
             The camera object with the stroke applied.
         """
-        width = vmobject.get_stroke_width(background)
+        width = self.get_cairo_line_width(vmobject, background)
         if width == 0:
             return self
-        self.set_cairo_context_color(
-            ctx, self.get_stroke_rgbas(vmobject, background=background), vmobject
-        )
-        ctx.set_line_width(
-            width
-            * self.cairo_line_width_multiple
-            *
-            # This ensures lines have constant width
-            # as you zoom in on them.
-            (self.frame_width / self.frame_width)
-        )
+        ctx.set_source(self.get_stroke_cairo_source(vmobject, background=background))
+        ctx.set_line_width(width)
         ctx.stroke_preserve()
         return self
 
@@ -809,6 +1319,9 @@ class Camera(object):
     def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
         """Displays multiple PMobjects by modifying the passed pixel array.
 
+        The points of consecutive PMobjects drawn with the same thickness are
+        splatted together, see :meth:`splat_pixel_coords`.
+
         Parameters
         ----------
         pmobjects : list
@@ -816,18 +1329,24 @@ class Camera(object):
         pixel_array : np.array
             The pixel array to modify.
         """
-        for pmobject in pmobjects:
-            self.display_point_cloud(
-                pmobject,
-                pmobject.points,
-                pmobject.rgbas,
-                self.adjusted_thickness(pmobject.stroke_width),
+        for thickness, batch in it.groupby(
+            pmobjects, lambda pm: self.adjusted_thickness(pm.stroke_width)
+        ):
+            batch = [pm for pm in batch if len(pm.points) > 0]
+            if not batch:
+                continue
+            self.splat_pixel_coords(
+                np.concatenate(
+                    [self.points_to_pixel_coords(pm, pm.points) for pm in batch]
+                ),
+                np.concatenate([pm.rgbas for pm in batch]),
+                thickness,
                 pixel_array,
             )
 
     def display_point_cloud(self, pmobject, points, rgbas, thickness, pixel_array):
         """Displays a PMobject by modifying the Pixel array suitably..
-        TODO: Write a description for the rgbas argument.
+
         Parameters
         ----------
         pmobject : PMobject
@@ -835,7 +1354,7 @@ class Camera(object):
         points : list
             The points to display in the point cloud mobject
         rgbas : np.array
-
+            The color and opacity of each point, between 0 and 1.
         thickness : int, float
             The thickness of each point of the PMobject
         pixel_array : np.array
@@ -844,29 +1363,107 @@ class Camera(object):
         if len(points) == 0:
             return
         pixel_coords = self.points_to_pixel_coords(pmobject, points)
-        pixel_coords = self.thickened_coordinates(pixel_coords, thickness)
-        rgba_len = pixel_array.shape[2]
+        self.splat_pixel_coords(pixel_coords, rgbas, thickness, pixel_array)
 
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
+    def splat_pixel_coords(self, pixel_coords, rgbas, thickness, pixel_array):
+        """Paints squares of pixels centered on pixel coordinates, with alpha
+        blending, in the order of the coordinates.
 
-        on_screen_indices = self.on_screen_pixels(pixel_coords)
-        pixel_coords = pixel_coords[on_screen_indices]
-        rgbas = rgbas[on_screen_indices]
+        The points falling on the same pixel are first composited together
+        (later points over earlier ones), all at once with segmented sums
+        over the points sorted by pixel.  The square around each pixel is
+        then painted by one pass per offset in the square, each of which
+        touches every pixel at most once.  Only the painted pixels of the
+        pixel array are read and written.
 
+        Parameters
+        ----------
+        pixel_coords : np.array
+            The (x, y) pixel coordinates of the points.
+        rgbas : np.array
+            The color and opacity of each point, between 0 and 1.
+        thickness : int, float
+            The width of the squares, in pixels.
+        pixel_array : np.array
+            The pixel array to modify, with premultiplied alpha.
+        """
         ph = self.pixel_height
         pw = self.pixel_width
+        rgba_len = pixel_array.shape[2]
+        nudges = self.get_thickening_nudges(thickness)
+        # Keep the points whose square can reach the frame
+        pad = int(np.abs(nudges).max()) + 1
+        on_screen = reduce(
+            op.and_,
+            [
+                pixel_coords[:, 0] >= -pad,
+                pixel_coords[:, 0] < pw + pad,
+                pixel_coords[:, 1] >= -pad,
+                pixel_coords[:, 1] < ph + pad,
+            ],
+        )
+        pixel_coords = pixel_coords[on_screen]
+        rgbas = rgbas[on_screen]
+        if len(pixel_coords) == 0:
+            return
 
-        flattener = np.array([1, pw], dtype="int")
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype("int")
-
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+        # Sort the points by pixel, keeping their order within each pixel
+        keys = (pixel_coords[:, 1] + pad) * (pw + 2 * pad) + pixel_coords[:, 0] + pad
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        rgbas = rgbas[order]
+        starts = np.flatnonzero(np.diff(keys, prepend=-1))
+        ends = np.append(starts[1:], len(keys))
+        group_ends = np.repeat(ends, ends - starts)
+
+        # Each point is seen through the points after it on the same pixel:
+        # weight it by the product of their transparencies, computed as the
+        # exponential of a sum of logarithms.
+        alphas = rgbas[:, 3]
+        log_transparencies = np.log(np.maximum(1 - alphas, 1e-30))
+        suffix_sums = np.append(np.cumsum(log_transparencies[::-1])[::-1], 0)
+        weights = np.exp(suffix_sums[1:] - suffix_sums[group_ends])
+        premultiplied = np.column_stack([rgbas[:, :3] * alphas[:, None], alphas])
+        colors = np.add.reduceat(premultiplied * weights[:, None], starts)
+        transparencies = np.exp(suffix_sums[starts] - suffix_sums[ends])
+        colors *= self.rgb_max_val
+        xs, ys = pixel_coords[order[starts]].T
+
+        # Whole pixels are gathered and scattered as single values
+        pixel_dtype = np.dtype((np.void, rgba_len * pixel_array.itemsize))
+        flat_pixel_array = pixel_array.reshape((ph * pw, rgba_len))
+        pixels = flat_pixel_array.view(pixel_dtype)[:, 0]
+
+        def blend(indices, transparencies, colors):
+            old = pixels[indices].view(pixel_array.dtype).reshape((-1, rgba_len))
+            new = old * transparencies[:, None]
+            new += colors
+            np.minimum(new, self.rgb_max_val, out=new)
+            pixels[indices] = new.astype(pixel_array.dtype).view(pixel_dtype)[:, 0]
+
+        # The squares of most pixels are entirely on screen, only those of
+        # the others need to be clipped
+        low, high = nudges.min(axis=0), nudges.max(axis=0)
+        inside = reduce(
+            op.and_,
+            [xs + low[0] >= 0, xs + high[0] < pw, ys + low[1] >= 0, ys + high[1] < ph],
+        )
+        inside_indices = ys[inside] * pw + xs[inside]
+        inside_transparencies = transparencies[inside]
+        inside_colors = colors[inside]
+        border = ~inside
+        xs, ys = xs[border], ys[border]
+        transparencies, colors = transparencies[border], colors[border]
+        for dx, dy in nudges:
+            blend(inside_indices + (dy * pw + dx), inside_transparencies, inside_colors)
+            x = xs + dx
+            y = ys + dy
+            visible = (x >= 0) & (x < pw) & (y >= 0) & (y < ph)
+            blend(
+                y[visible] * pw + x[visible], transparencies[visible], colors[visible]
+            )
+        if not np.shares_memory(flat_pixel_array, pixel_array):
+            pixel_array[:, :] = flat_pixel_array.reshape((ph, pw, rgba_len))
 
     def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
         """Displays multiple image mobjects by modifiying the passed pixel_array.
@@ -899,44 +1496,55 @@ class Camera(object):
 
         sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
 
+        pixel_width = max(int(get_norm(right_vect)), 1)
+        pixel_height = max(int(get_norm(down_vect)), 1)
+        angle = angle_of_vector(right_vect)
+        adjusted_angle = -int(360 * angle / TAU)
+        if adjusted_angle == 0:
+            # Only resample the part of the image which lands in the frame
+            new_ul_coords = center_coords - np.array([pixel_width, pixel_height]) / 2
+            x, y = new_ul_coords.astype(int)
+            x0, y0 = max(x, 0), max(y, 0)
+            x1 = min(x + pixel_width, self.pixel_width)
+            y1 = min(y + pixel_height, self.pixel_height)
+            if x0 >= x1 or y0 >= y1:
+                return
+            x_scale = sub_image.size[0] / pixel_width
+            y_scale = sub_image.size[1] / pixel_height
+            sub_image = sub_image.resize(
+                (x1 - x0, y1 - y0),
+                resample=Image.BICUBIC,
+                box=(
+                    (x0 - x) * x_scale,
+                    (y0 - y) * y_scale,
+                    (x1 - x) * x_scale,
+                    (y1 - y) * y_scale,
+                ),
+            )
+            self.blend_rgba_array(pixel_array, np.array(sub_image), x0, y0)
+            return
+
         # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
         sub_image = sub_image.resize(
             (pixel_width, pixel_height), resample=Image.BICUBIC
         )
 
         # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
-            )
+        sub_image = sub_image.rotate(adjusted_angle, resample=Image.BICUBIC, expand=1)
 
         # TODO, there is no accounting for a shear...
 
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)), mode="RGBA"
-        )
+        # Paint on top of existing pixel array
         new_ul_coords = center_coords - np.array(sub_image.size) / 2
         new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
-        )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        self.blend_rgba_array(pixel_array, np.array(sub_image), *new_ul_coords)
 
     def overlay_rgba_array(self, pixel_array, new_array):
         """Overlays an RGBA array on top of the given Pixel array.
 
+        Only the region of the array which is not fully transparent is
+        composited.
+
         Parameters
         ----------
         pixel_array : np.array
@@ -944,7 +1552,14 @@ class Camera(object):
         new_array : np.array
             The new pixel array to overlay.
         """
-        self.overlay_PIL_image(pixel_array, self.get_image(new_array))
+        visible = new_array[:, :, 3] > 0
+        rows = np.flatnonzero(visible.any(axis=1))
+        columns = np.flatnonzero(visible.any(axis=0))
+        if len(rows) == 0:
+            return
+        y0, y1 = rows[0], rows[-1] + 1
+        x0, x1 = columns[0], columns[-1] + 1
+        self.blend_rgba_array(pixel_array, new_array[y0:y1, x0:x1], x0, y0)
 
     def overlay_PIL_image(self, pixel_array, image):
         """Overlays a PIL image on the passed pixel array.
@@ -956,9 +1571,41 @@ class Camera(object):
         image : PIL.Image
             The Image to overlay.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
-        )
+        self.overlay_rgba_array(pixel_array, np.array(image.convert("RGBA")))
+
+    def blend_rgba_array(self, pixel_array, new_array, x, y):
+        """Alpha composites an RGBA array over a region of a pixel array.
+
+        The result is the same as with :func:`PIL.Image.alpha_composite`,
+        but only the pixels under `new_array` are read and written, and
+        opaque arrays are simply copied.
+
+        Parameters
+        ----------
+        pixel_array : np.ndarray
+            The pixel array to modify.
+        new_array : np.ndarray
+            The RGBA array to put on top.
+        x, y : int
+            The pixel coordinates of the top left corner of `new_array` in
+            `pixel_array`.  The parts of `new_array` out of the frame are
+            left out.
+        """
+        height, width = new_array.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + width, pixel_array.shape[1])
+        y1 = min(y + height, pixel_array.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        new_array = new_array[y0 - y : y1 - y, x0 - x : x1 - x]
+        alphas = new_array[:, :, 3]
+        if alphas.min() == self.rgb_max_val:
+            pixel_array[y0:y1, x0:x1] = new_array
+        elif alphas.max() > 0:
+            region = pixel_array[y0:y1, x0:x1]
+            region[:, :] = Image.alpha_composite(
+                self.get_image(region), self.get_image(new_array)
+            )
 
     def adjust_out_of_range_points(self, points):
         """If any of the points in the passed array are out of
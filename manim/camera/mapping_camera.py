@@ -21,6 +21,9 @@ class MappingCamera(Camera):
         "mapping_func": lambda p: p,
         "min_num_curves": 50,
         "allow_object_intrusion": False,
+        # Mobjects are displayed through mapping_func, away from their points
+        "use_dirty_rectangles": False,
+        "cull_offscreen_mobjects": False,
     }
 
     def points_to_pixel_coords(self, points):
@@ -53,6 +56,11 @@ class MappingCamera(Camera):
 
 # TODO, the classes below should likely be deleted
 class OldMultiCamera(Camera):
+    CONFIG = {
+        "use_dirty_rectangles": False,
+        "cull_offscreen_mobjects": False,
+    }
+
     def __init__(self, *cameras_with_start_positions, **kwargs):
         self.shifted_cameras = [
             DictAsObject(
@@ -109,6 +109,13 @@ class MovingCamera(Camera):
         """
         self.frame.move_to(frame_center)
 
+    def get_view_key(self):
+        return Camera.get_view_key(self) + (
+            tuple(self.get_frame_center()),
+            self.get_frame_width(),
+            self.get_frame_height(),
+        )
+
     def capture_mobjects(self, mobjects, **kwargs):
         # self.reset_frame_center()
         # self.realign_frame_shape()
@@ -65,6 +65,22 @@ class ThreeDCamera(Camera):
         self.reset_rotation_matrix()
         Camera.capture_mobjects(self, mobjects, **kwargs)
 
+    def capture_mobjects_over_background(self, mobjects, background, **kwargs):
+        # The bounding boxes have to be projected with the current rotation
+        self.reset_rotation_matrix()
+        Camera.capture_mobjects_over_background(self, mobjects, background, **kwargs)
+
+    def get_view_key(self):
+        return Camera.get_view_key(self) + (
+            self.get_phi(),
+            self.get_theta(),
+            self.get_distance(),
+            self.get_gamma(),
+            tuple(self.light_source.get_center()),
+            tuple(sorted(id(m) for m in self.fixed_in_frame_mobjects)),
+            tuple(sorted(id(m) for m in self.fixed_orientation_mobjects)),
+        )
+
     def get_value_trackers(self):
         """Returns list of ValueTrackers of phi, theta, distance and gamma
 
@@ -115,6 +131,9 @@ class ThreeDCamera(Camera):
         return self.modified_rgbas(vmobject, vmobject.get_fill_rgbas())
 
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
+        # The projection used to cull the mobjects out of the frame depends on
+        # the current orientation of the camera
+        self.reset_rotation_matrix()
         mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
         rot_matrix = self.get_rotation_matrix()
 
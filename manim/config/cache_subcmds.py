@@ -0,0 +1,73 @@
+"""
+cache_subcmds.py
+----------------
+
+Partial Movie Cache Managing Utilities.
+The functions below can be called via the `manim cache` subcommand.
+
+"""
+import os
+
+from rich.console import Console
+from rich.table import Table
+
+from .config import file_writer_config
+from ..utils.partial_movie_cache import get_partial_movie_cache
+
+__all__ = ["stats", "prune"]
+
+console = Console()
+
+
+def _format_size(size):
+    return f"{size / 2 ** 20:.1f} MB"
+
+
+def stats():
+    """Prints the number of files, the size and the number of reuses of the
+    cached partial movie files, by directory."""
+    cache = get_partial_movie_cache()
+    cache.synchronize(file_writer_config["video_dir"])
+    table = Table(title=f"Partial movie cache of {file_writer_config['media_dir']}")
+    table.add_column("Directory")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Hits", justify="right")
+    rows = cache.get_stats()
+    for directory, number_files, size, hits in rows:
+        table.add_row(
+            os.path.relpath(directory), str(number_files), _format_size(size), str(hits)
+        )
+    table.add_row(
+        "Total",
+        str(sum(row[1] for row in rows)),
+        _format_size(sum(row[2] for row in rows)),
+        str(sum(row[3] for row in rows)),
+        style="bold",
+    )
+    console.print(table)
+    max_size = file_writer_config["max_cache_size"]
+    if max_size != float("inf"):
+        console.print(f"max_cache_size : {_format_size(max_size)}")
+
+
+def prune(max_size=None):
+    """Removes the partial movie files used the longest ago, until they take
+    at most `max_size` megabytes.
+
+    Parameters
+    ----------
+    max_size : Optional[:class:`int`]
+        The size to prune the cache to, in megabytes.  Defaults to
+        max_cache_size.
+    """
+    cache = get_partial_movie_cache()
+    cache.synchronize(file_writer_config["video_dir"])
+    max_size = (
+        file_writer_config["max_cache_size"] if max_size is None else max_size * 2 ** 20
+    )
+    number_files, size = cache.evict(max_size=max_size)
+    console.print(
+        f"Removed {number_files} partial movie file(s) ({_format_size(size)}).",
+        style="green",
+    )
@@ -110,6 +110,15 @@ def _parse_config(config_parser, args):
         background_color = colour.Color(default["background_color"])
     config["background_color"] = background_color
 
+    # max_template_cache_size is given in megabytes, but stored in bytes
+    config["max_template_cache_size"] = default.getint("max_template_cache_size", 64)
+    if config["max_template_cache_size"] == -1:
+        config["max_template_cache_size"] = float("inf")
+    else:
+        config["max_template_cache_size"] *= 2 ** 20
+
+    config["raster_threads"] = default.getint("raster_threads", 1)
+
     # Set the rest of the frame properties
     config["frame_height"] = 8.0
     config["frame_width"] = (
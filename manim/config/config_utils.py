@@ -153,6 +153,22 @@ def _parse_file_writer_config(config_parser, args):
     fw_config["max_files_cached"] = default.getint("max_files_cached")
     if fw_config["max_files_cached"] == -1:
         fw_config["max_files_cached"] = float("inf")
+    # max_cache_size is given in megabytes, but stored in bytes
+    fw_config["max_cache_size"] = default.getint("max_cache_size", 2048)
+    if fw_config["max_cache_size"] == -1:
+        fw_config["max_cache_size"] = float("inf")
+    else:
+        fw_config["max_cache_size"] *= 2 ** 20
+    fw_config["partial_movie_store"] = default.getboolean("partial_movie_store", False)
+    fw_config["prefetch_tex"] = default.getboolean("prefetch_tex", False)
+
+    # Parse the --render_processes flag.  A value of 0 means one process per CPU.
+    render_processes = getattr(args, "render_processes")
+    if render_processes is None:
+        render_processes = default.getint("render_processes")
+    if render_processes == 0:
+        render_processes = os.cpu_count() or 1
+    fw_config["render_processes"] = render_processes
     # Parse the verbosity flag to read in the log level
     verbosity = getattr(args, "verbosity")
     verbosity = default["verbosity"] if verbosity is None else verbosity
@@ -165,6 +181,12 @@ def _parse_file_writer_config(config_parser, args):
         if ffmpeg_loglevel is None
         else ffmpeg_loglevel
     )
+    fw_config["frame_queue_size"] = config_parser["ffmpeg"].getint(
+        "frame_queue_size", 8
+    )
+    fw_config["pixel_array_buffers"] = config_parser["ffmpeg"].getint(
+        "pixel_array_buffers", 3
+    )
 
     # Parse the progress_bar flag
     progress_bar = getattr(args, "progress_bar")
@@ -193,6 +215,8 @@ def _parse_cli(arg_list, input=True):
             # subcommand's subparser.
             if only_manim or _subcommand_name() in ["cfg", "--help", "-h"]:
                 cfg_related = _init_cfg_subcmd(subparsers)
+            if only_manim or _subcommand_name() in ["cache", "--help", "-h"]:
+                cache_related = _init_cache_subcmd(subparsers)
 
         if only_manim or not _subcommand_name(ignore=["--help", "-h"]):
             parser.add_argument(
@@ -296,6 +320,12 @@ def _parse_cli(arg_list, input=True):
         const=True,
         help="Log terminal output to file",
     )
+    parser.add_argument(
+        "--render_processes",
+        type=int,
+        help="Number of processes used to render the animations of a scene "
+        "(0 uses one process per CPU)",
+    )
     # The default value of the following is set in manim.cfg
     parser.add_argument(
         "-c", "--background_color", help="Specify background color",
@@ -413,6 +443,12 @@ def _parse_cli(arg_list, input=True):
                 "cfg_subcommand",
                 cfg_related.parse_args(sys.argv[2:]).cfg_subcommand,
             )
+        elif _subcommand_name() == "cache":
+            setattr(
+                parsed,
+                "cache_subcommand",
+                cache_related.parse_args(sys.argv[2:]).cache_subcommand,
+            )
 
     return parsed
 
@@ -532,7 +568,7 @@ def _subcommand_name(ignore=()):
         If a subcommand is found, returns the string of its name. Returns None if no
         subcommand is found.
     """
-    NON_ANIM_UTILS = ["cfg", "--help", "-h"]
+    NON_ANIM_UTILS = ["cfg", "cache", "--help", "-h"]
     NON_ANIM_UTILS = [util for util in NON_ANIM_UTILS if util not in ignore]
 
     # If a subcommand is found, break out of the inner loop, and hit the break of the outer loop
@@ -586,3 +622,32 @@ def _init_cfg_subcmd(subparsers):
     cfg_export_parser.add_argument("--dir", default=os.getcwd())
 
     return cfg_related
+
+
+def _init_cache_subcmd(subparsers):
+    """Initialises the subparser for the `cache` subcommand.
+
+    Parameters
+    ----------
+    subparsers : :class:`argparse._SubParsersAction`
+        The subparser object for which to add the sub-subparser for the cache subcommand.
+
+    Returns
+    -------
+    :class:`argparse.ArgumentParser`
+        The parser that parses anything cache subcommand related.
+    """
+    cache_related = subparsers.add_parser("cache",)
+    cache_subparsers = cache_related.add_subparsers(dest="cache_subcommand")
+
+    cache_subparsers.add_parser("stats")
+
+    cache_prune_parser = cache_subparsers.add_parser("prune")
+    cache_prune_parser.add_argument(
+        "--max_size",
+        type=int,
+        default=None,
+        help="Size in megabytes to prune the partial movie cache to (defaults to max_cache_size).",
+    )
+
+    return cache_related
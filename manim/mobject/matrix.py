@@ -16,7 +16,8 @@ from ..constants import *
 from ..mobject.numbers import DecimalNumber
 from ..mobject.numbers import Integer
 from ..mobject.shape_matchers import BackgroundRectangle
-from ..mobject.svg.tex_mobject import MathTex
+from ..mobject.svg.tex_mobject import MathTex, SingleStringMathTex
+from ..mobject.svg.tex_mobject import compile_tex_strings
 from ..mobject.svg.tex_mobject import Tex
 from ..mobject.types.vectorized_mobject import VGroup
 from ..mobject.types.vectorized_mobject import VMobject
@@ -96,6 +97,15 @@ class Matrix(VMobject):
             self.add_background_rectangle()
 
     def matrix_to_mob_matrix(self, matrix):
+        if isinstance(self.element_to_mobject, type) and issubclass(
+            self.element_to_mobject, SingleStringMathTex
+        ):
+            # Typeset all the entries with a single LaTeX run
+            compile_tex_strings(
+                matrix.flatten(),
+                self.element_to_mobject,
+                **self.element_to_mobject_config,
+            )
         return np.vectorize(self.element_to_mobject)(
             matrix, **self.element_to_mobject_config
         )
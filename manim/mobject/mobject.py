@@ -31,6 +31,34 @@ from ..utils.space_ops import rotation_matrix
 
 # TODO: Explain array_attrs
 
+# Shared by all mobjects, so that a version number is never reused, not even by
+# another mobject.  Copies keep the version of the mobject they were copied from.
+VERSION_COUNTER = it.count()
+
+# Attributes that are bookkeeping rather than state, like the private ones:
+# assigning them doesn't change the version of a mobject, and they are left out
+# of its hash.
+UNVERSIONED_ATTRIBUTES = frozenset(["version", "updating_suspended"])
+
+
+def is_state_attribute(name):
+    """Returns whether an attribute of mobjects is part of their state, i.e.
+    whether assigning it changes their :attr:`~.Mobject.version`.
+
+    Parameters
+    ----------
+    name : :class:`str`
+        The name of the attribute.
+
+    Returns
+    -------
+    :class:`bool`
+        False for private attributes and the ones in UNVERSIONED_ATTRIBUTES.
+    """
+    return name == "__dict__" or not (
+        name.startswith("_") or name in UNVERSIONED_ATTRIBUTES
+    )
+
 
 class Mobject(Container):
     """Mathematical Object: base class for objects that can be displayed on screen.
@@ -39,6 +67,10 @@ class Mobject(Container):
     ----------
     submobjects : :class:`list`
         The contained objects.
+    version : :class:`int`
+        A number that changes every time the mobject is modified.  Two mobjects
+        with the same version have the same points, style and updaters (their
+        submobjects aside).
 
     """
 
@@ -65,6 +97,28 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Inlined is_state_attribute, this is called for every assignment
+        if name[0] != "_" and name not in UNVERSIONED_ATTRIBUTES or name == "__dict__":
+            self.__dict__["version"] = next(VERSION_COUNTER)
+
+    def increment_version(self):
+        """Marks the mobject as modified.
+
+        Assigning an attribute of a mobject does this automatically, except
+        for bookkeeping attributes (see :func:`is_state_attribute`).  This
+        has to be called by methods that modify an attribute in place, e.g.
+        ``self.points[:, 0] = 0`` or ``self.updaters.append(updater)``.
+
+        Returns
+        -------
+        :class:`Mobject`
+            :code:`self`
+        """
+        self.__dict__["version"] = next(VERSION_COUNTER)
+        return self
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -162,6 +216,7 @@ class Mobject(Container):
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+        self.increment_version()
         return self
 
     def get_array_attrs(self):
@@ -248,6 +303,7 @@ class Mobject(Container):
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
+        self.increment_version()
         if call_updater:
             self.update(0)
         return self
@@ -255,6 +311,7 @@ class Mobject(Container):
     def remove_updater(self, update_function):
         while update_function in self.updaters:
             self.updaters.remove(update_function)
+        self.increment_version()
         return self
 
     def clear_updaters(self, recursive=True):
@@ -1011,6 +1068,7 @@ class Mobject(Container):
         if submob_func is None:
             submob_func = lambda m: point_to_num_func(m.get_center())
         self.submobjects.sort(key=submob_func)
+        self.increment_version()
         return self
 
     def shuffle(self, recursive=False):
@@ -1018,6 +1076,7 @@ class Mobject(Container):
             for submob in self.submobjects:
                 submob.shuffle(recursive=True)
         random.shuffle(self.submobjects)
+        self.increment_version()
 
     # Just here to keep from breaking old scenes.
     def arrange_submobjects(self, *args, **kwargs):
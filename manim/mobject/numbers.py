@@ -1,11 +1,20 @@
 __all__ = ["DecimalNumber", "Integer", "Variable"]
 
 
+from collections import OrderedDict
+
+from .. import config
 from ..constants import *
 from ..mobject.svg.tex_mobject import MathTex, SingleStringMathTex, Tex
+from ..mobject.svg.tex_mobject import compile_tex_strings
 from ..mobject.svg.text_mobject import Text
 from ..mobject.types.vectorized_mobject import VDict, VMobject
 from ..mobject.value_tracker import ValueTracker
+from ..utils.hashing import get_hash
+
+# Number of glyphs kept in DecimalNumber.glyph_atlas, e.g. the 16 characters of
+# numbers for 16 different templates or configurations.
+GLYPH_ATLAS_SIZE = 256
 
 
 class DecimalNumber(VMobject):
@@ -18,26 +27,26 @@ class DecimalNumber(VMobject):
         "unit": None,  # Aligned to bottom unless it starts with "^"
         "include_background_rectangle": False,
         "edge_to_fix": LEFT,
+        # Update the characters in place when the value changes, instead of
+        # building a new number (see set_value_from_glyphs)
+        "use_glyph_atlas": True,
     }
 
+    # (hash of the tex template and configuration, character) -> mobject of the
+    # character, shared by all decimal numbers.  The glyphs used the longest
+    # ago are forgotten past GLYPH_ATLAS_SIZE glyphs.
+    glyph_atlas = OrderedDict()
+
     def __init__(self, number=0, **kwargs):
         super().__init__(**kwargs)
         self.number = number
         self.initial_config = kwargs
+        self.glyph_atlas_key = get_hash(
+            (config["tex_template"].body, self.initial_config)
+        )
 
-        if isinstance(number, complex):
-            formatter = self.get_complex_formatter()
-        else:
-            formatter = self.get_formatter()
-        num_string = formatter.format(number)
-
-        rounded_num = np.round(number, self.num_decimal_places)
-        if num_string.startswith("-") and rounded_num == 0:
-            if self.include_sign:
-                num_string = "+" + num_string[1:]
-            else:
-                num_string = num_string[1:]
-
+        num_string = self.get_num_string(number)
+        compile_tex_strings(num_string, **kwargs)
         self.add(*[SingleStringMathTex(char, **kwargs) for char in num_string])
 
         # Add non-numerical bits
@@ -52,10 +61,33 @@ class DecimalNumber(VMobject):
             self.unit_sign = SingleStringMathTex(self.unit, color=self.color)
             self.add(self.unit_sign)
 
-        self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
+        self.num_string = num_string
+        self.arrange_num_string(self.digit_to_digit_buff)
+        #
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def get_num_string(self, number):
+        if isinstance(number, complex):
+            formatter = self.get_complex_formatter()
+        else:
+            formatter = self.get_formatter()
+        num_string = formatter.format(number)
+
+        rounded_num = np.round(number, self.num_decimal_places)
+        if num_string.startswith("-") and rounded_num == 0:
+            if self.include_sign:
+                num_string = "+" + num_string[1:]
+            else:
+                num_string = num_string[1:]
+        return num_string
+
+    def arrange_num_string(self, buff):
+        self.arrange(buff=buff, aligned_edge=DOWN)
 
         # Handle alignment of parts that should be aligned
         # to the bottom
+        num_string = self.num_string
         for i, c in enumerate(num_string):
             if c == "-" and len(num_string) > i + 1:
                 self[i].align_to(self[i + 1], UP)
@@ -64,9 +96,6 @@ class DecimalNumber(VMobject):
                 self[i].shift(self[i].get_height() * DOWN / 2)
         if self.unit and self.unit.startswith("^"):
             self.unit_sign.align_to(self, UP)
-        #
-        if self.include_background_rectangle:
-            self.add_background_rectangle()
 
     def get_formatter(self, **kwargs):
         """
@@ -113,6 +142,9 @@ class DecimalNumber(VMobject):
         )
 
     def set_value(self, number, **config):
+        if self.use_glyph_atlas and not config and self.set_value_from_glyphs(number):
+            self.number = number
+            return self
         full_config = dict(self.CONFIG)
         full_config.update(self.initial_config)
         full_config.update(config)
@@ -124,13 +156,108 @@ class DecimalNumber(VMobject):
 
         old_family = self.get_family()
         self.submobjects = new_decimal.submobjects
+        self.num_string = new_decimal.num_string
         for mob in old_family:
             # Dumb hack...due to how scene handles families
             # of animated mobjects
             mob.points[:] = 0
+            mob.increment_version()
         self.number = number
         return self
 
+    def get_glyph(self, char, config_hash):
+        """Returns the mobject of a character, parsed once for all the decimal
+        numbers built with the same configuration and tex template.
+
+        Parameters
+        ----------
+        char : :class:`str`
+            The character.
+        config_hash : :class:`str`
+            The hash of the tex template and of the configuration of the
+            number.
+
+        Returns
+        -------
+        :class:`~.SingleStringMathTex`
+            The mobject, which must not be modified.
+        """
+        key = (config_hash, char)
+        glyph_atlas = DecimalNumber.glyph_atlas
+        glyph = glyph_atlas.get(key)
+        if glyph is not None:
+            glyph_atlas.move_to_end(key)
+            return glyph
+        glyph = SingleStringMathTex(char, **self.initial_config)
+        glyph_atlas[key] = glyph
+        if len(glyph_atlas) > GLYPH_ATLAS_SIZE:
+            glyph_atlas.popitem(last=False)
+        return glyph
+
+    def set_value_from_glyphs(self, number):
+        """Updates the characters in place, by copying the points of their
+        glyphs instead of building a new number.
+
+        The characters are kept at their current scale, and the edge
+        ``edge_to_fix`` of the number stays in place.
+
+        Parameters
+        ----------
+        number : Union[:class:`float`, :class:`complex`]
+            The new value.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the number could be updated this way.  This isn't the
+            case for numbers with a background rectangle, or whose characters
+            have been removed or flattened.
+        """
+        old_string = self.num_string
+        num_chars = len(old_string)
+        if (
+            self.include_background_rectangle
+            or len(self.submobjects) < num_chars
+            or num_chars == 0
+        ):
+            return False
+        chars = self.submobjects[:num_chars]
+        config_hash = self.glyph_atlas_key
+        last_glyph = self.get_glyph(old_string[-1], config_hash)
+        if last_glyph.get_height() == 0 or chars[-1].get_height() == 0:
+            return False
+        scale_factor = chars[-1].get_height() / last_glyph.get_height()
+        fixed_point = self.get_critical_point(self.edge_to_fix)
+
+        num_string = self.get_num_string(number)
+        new_chars = []
+        for i, char in enumerate(num_string):
+            glyph = self.get_glyph(char, config_hash)
+            glyph_family = glyph.get_family()
+            mob = chars[i] if i < num_chars else None
+            if mob is None or len(mob.get_family()) != len(glyph_family):
+                new_mob = glyph.copy().scale(scale_factor, about_point=ORIGIN)
+                new_mob.match_style(chars[-1] if mob is None else mob)
+                new_chars.append(new_mob)
+                continue
+            for submob, glyph_submob in zip(mob.get_family(), glyph_family):
+                submob.points = glyph_submob.points * scale_factor
+            mob.tex_string = char
+            new_chars.append(mob)
+
+        kept_chars = set(map(id, new_chars))
+        for mob in chars:
+            if id(mob) not in kept_chars:
+                for submob in mob.get_family():
+                    # See set_value
+                    submob.points[:] = 0
+                    submob.increment_version()
+        self.submobjects = new_chars + self.submobjects[num_chars:]
+        self.num_string = num_string
+        self.arrange_num_string(self.digit_to_digit_buff * scale_factor)
+        self.move_to(fixed_point, self.edge_to_fix)
+        return True
+
     def get_value(self):
         return self.number
 
@@ -25,20 +25,31 @@ __all__ = [
 ]
 
 
+import hashlib
 import html
 import os
+import tempfile
+from ... import __version__, file_writer_config, logger
 from ...constants import *
 from ...container import Container
 from ...mobject.geometry import RoundedRectangle
 from ...mobject.shape_matchers import SurroundingRectangle
-from ...mobject.svg.text_mobject import Paragraph
-from ...mobject.types.vectorized_mobject import VGroup
+from ...mobject.svg.text_mobject import Paragraph, get_font_identity
+from ...mobject.types.vectorized_mobject import VGroup, VMobject
+from ...utils.hashing import get_hash
 
 import re
 from pygments import highlight
 from pygments.lexers import get_lexer_by_name
 from pygments.formatters.html import HtmlFormatter
 
+# Change this whenever the mobjects built by Code change, so that the ones
+# cached by older versions are not used.
+CODE_CACHE_VERSION = 2
+
+# Arrays of rows saved for each mobject of the family of a cached Code mobject
+CACHED_ARRAYS = ["points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+
 
 class Code(VGroup):
     CONFIG = {
@@ -58,6 +69,12 @@ class Code(VGroup):
         "style": "vim",
         "language": "cpp",
         "generate_html_file": False,
+        # The backend of the Text mobjects of the lines, "svg" or "outline"
+        "text_backend": "svg",
+        # If True, the built mobject is saved to the text directory, and loaded
+        # instead of being built again as long as the file and the
+        # configuration are the same.
+        "cache_mobject": True,
     }
 
     def __init__(self, file_name=None, **kwargs):
@@ -65,7 +82,14 @@ class Code(VGroup):
         self.file_name = file_name or self.file_name
         self.ensure_valid_file()
         self.style = self.style.lower()
+        cache_file = None
+        if self.cache_mobject and not self.generate_html_file:
+            cache_file = self.get_cache_file_path()
+            if self.load_from_cache(cache_file, **kwargs):
+                return
         self.gen_html_string()
+        # Modified by gen_code_json
+        html_string = self.html_string
         strati = self.html_string.find("background:")
         self.background_color = self.html_string[strati + 12 : strati + 19]
         self.gen_code_json()
@@ -136,6 +160,144 @@ class Code(VGroup):
             )
 
         self.move_to(np.array([0, 0, 0]))
+        if cache_file is not None:
+            self.save_to_cache(cache_file, html_string)
+
+    def get_cache_file_path(self):
+        """Returns the path of the file caching this mobject.
+
+        It is named after a hash of the content of the code file, of the
+        configuration of the mobject (language, style, font, line spacing,
+        ...), of the font actually installed and of the version of manim, but
+        not of the name of the code file.
+
+        Returns
+        -------
+        :class:`str`
+            The path of the .npz file.
+        """
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(str(CODE_CACHE_VERSION).encode())
+        hasher.update(__version__.encode())
+        with open(self.file_path, "rb") as code_file:
+            hasher.update(code_file.read())
+        config = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("file_name", "file_path", "version")
+        }
+        hasher.update(get_hash(config).encode())
+        hasher.update(get_font_identity(self.font).encode())
+        return os.path.join(
+            file_writer_config["text_dir"], "code_" + hasher.hexdigest() + ".npz"
+        )
+
+    def load_from_cache(self, cache_file, **kwargs):
+        """Creates the submobjects from the data saved by :meth:`save_to_cache`.
+
+        The mobjects with submobjects are created as :class:`~.VGroup`
+        instances, the others as plain :class:`~.VMobject` instances, so
+        :attr:`code` and :attr:`line_numbers` are VGroups of lines instead of
+        :class:`~.Paragraph` instances.
+
+        Parameters
+        ----------
+        cache_file : :class:`str`
+            The path of the .npz file.
+        **kwargs
+            The keyword arguments of the mobject.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the mobject could be loaded.
+        """
+        if not os.path.exists(cache_file):
+            return False
+        try:
+            with np.load(cache_file) as cached:
+                cached = dict(cached)
+        except Exception as error:
+            logger.debug(f"Could not load {cache_file}: {error}")
+            return False
+        self.html_string = str(cached["html_string"])
+        strati = self.html_string.find("background:")
+        self.background_color = self.html_string[strati + 12 : strati + 19]
+        self.gen_code_json()
+
+        n_submobjects = cached["n_submobjects"]
+        family = [self] + [VGroup() if n else VMobject() for n in n_submobjects[1:]]
+        # The family is in depth first order, each mobject being followed by
+        # the families of its submobjects.
+        indices = iter(range(1, len(family)))
+
+        def get_submobjects(n):
+            submobjects = []
+            for _ in range(n):
+                index = next(indices)
+                family[index].add(*get_submobjects(n_submobjects[index]))
+                submobjects.append(family[index])
+            return submobjects
+
+        VGroup.__init__(self, *get_submobjects(n_submobjects[0]), **kwargs)
+        for name in CACHED_ARRAYS:
+            ends = np.cumsum(cached[name + "_lengths"])
+            for mob, rows in zip(family, np.split(cached[name], ends[:-1])):
+                setattr(mob, name, rows)
+        for mob, width, background_width in zip(
+            family, cached["stroke_width"], cached["background_stroke_width"]
+        ):
+            mob.stroke_width = float(width)
+            mob.background_stroke_width = float(background_width)
+
+        self.background_mobject = self[0]
+        if self.insert_line_no:
+            self.line_numbers = self[1]
+        self.code = VGroup(*self[2:])
+        return True
+
+    def save_to_cache(self, cache_file, html_string):
+        """Saves the data of this mobject to `cache_file`.
+
+        Only arrays are saved: the html string of the code, and for each
+        mobject of the family, in depth first order, its number of
+        submobjects, its points, its colors and its stroke widths.
+
+        Parameters
+        ----------
+        cache_file : :class:`str`
+            The path of the .npz file.
+        html_string : :class:`str`
+            The html string of the code, as generated by :meth:`gen_html_string`.
+        """
+
+        def get_family(mob):
+            return [mob] + [
+                submob_family
+                for submob in mob.submobjects
+                for submob_family in get_family(submob)
+            ]
+
+        family = get_family(self)
+        arrays = {
+            "html_string": np.array(html_string),
+            "n_submobjects": np.array([len(mob.submobjects) for mob in family]),
+            "stroke_width": np.array([mob.stroke_width for mob in family]),
+            "background_stroke_width": np.array(
+                [mob.background_stroke_width for mob in family]
+            ),
+        }
+        for name in CACHED_ARRAYS:
+            rows = [getattr(mob, name) for mob in family]
+            arrays[name] = np.concatenate(rows)
+            arrays[name + "_lengths"] = np.array([len(r) for r in rows], dtype=int)
+        # Written to a temporary file first, as other renders may read it.
+        file_descriptor, temp_file = tempfile.mkstemp(
+            suffix=".npz", dir=os.path.dirname(cache_file)
+        )
+        with os.fdopen(file_descriptor, "wb") as outfile:
+            np.savez(outfile, **arrays)
+        os.replace(temp_file, cache_file)
 
     def apply_points_function_about_point(
         self, func, about_point=None, about_edge=None
@@ -174,6 +336,7 @@ class Code(VGroup):
             alignment="right",
             font=self.font,
             stroke_width=self.stroke_width,
+            backend=self.text_backend,
         ).scale(self.scale_factor)
         return line_numbers
 
@@ -191,6 +354,7 @@ class Code(VGroup):
             alignment="left",
             font=self.font,
             stroke_width=self.stroke_width,
+            backend=self.text_backend,
         ).scale(self.scale_factor)
         for line_no in range(code.__len__()):
             line = code[line_no]
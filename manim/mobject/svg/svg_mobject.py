@@ -4,18 +4,21 @@
 __all__ = ["SVGMobject", "VMobjectFromSVGPathstring", "string_to_numbers"]
 
 
-import itertools as it
+import hashlib
 import re
 import os
 import string
+import tempfile
 import warnings
+from collections import OrderedDict
 
-from xml.dom import minidom
+from xml.etree import ElementTree
 
 from ...constants import *
 from ...mobject.geometry import Circle
 from ...mobject.geometry import Rectangle
 from ...mobject.geometry import RoundedRectangle
+from ...mobject.svg.svg_path import path_string_to_points
 from ...mobject.types.vectorized_mobject import VGroup
 from ...mobject.types.vectorized_mobject import VMobject
 from ...utils.color import *
@@ -23,6 +26,17 @@ from ...utils.config_ops import digest_config
 from ...utils.config_ops import digest_locals
 
 
+# Change this whenever the points generated from an svg file change, so that
+# geometry cached by older versions is not used.
+GEOMETRY_CACHE_VERSION = 2
+
+# (class, path string) -> points of the path, shared by all the paths with the
+# same description, e.g. a glyph of a font used by many formulas.  The paths
+# used the longest ago are forgotten past PATH_CACHE_SIZE paths.
+parsed_paths = OrderedDict()
+PATH_CACHE_SIZE = 4096
+
+
 def string_to_numbers(num_string):
     num_string = num_string.replace("-", ",-")
     num_string = num_string.replace("e,-", "e-")
@@ -37,6 +51,10 @@ class SVGMobject(VMobject):
         # Must be filled in in a subclass, or when called
         "file_name": None,
         "unpack_groups": True,  # if False, creates a hierarchy of VGroups
+        # If True, the points of the submobjects are saved to a .npz file next
+        # to the svg file, and loaded from it instead of parsing the svg file
+        # the next time.
+        "cache_geometry": False,
         "stroke_width": DEFAULT_STROKE_WIDTH,
         "fill_opacity": 1.0,
         # "fill_color" : LIGHT_GREY,
@@ -65,45 +83,206 @@ class SVGMobject(VMobject):
         raise IOError("No file matching %s in image directory" % self.file_name)
 
     def generate_points(self):
-        doc = minidom.parse(self.file_path)
+        if self.cache_geometry and self.unpack_groups:
+            geometry_file = self.get_geometry_file_path()
+            if os.path.exists(geometry_file):
+                self.load_geometry(geometry_file)
+                return
+        mobjects = self.parse_svg_file()
+        if self.unpack_groups:
+            self.add(*mobjects)
+        elif mobjects:
+            self.add(*mobjects[0].submobjects)
+        if self.cache_geometry and self.unpack_groups:
+            self.save_geometry(geometry_file)
+
+    def get_geometry_file_path(self):
+        """Returns the path of the file caching the points of the submobjects.
+
+        It is named after a hash of the content of the svg file, so that it
+        is not used if the svg file changes.
+
+        Returns
+        -------
+        :class:`str`
+            The path of the .npz file.
+        """
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(str(GEOMETRY_CACHE_VERSION).encode())
+        with open(self.file_path, "rb") as svg_file:
+            hasher.update(svg_file.read())
+        return "{}_{}.npz".format(
+            os.path.splitext(self.file_path)[0], hasher.hexdigest()
+        )
+
+    def save_geometry(self, geometry_file):
+        """Saves the points of the submobjects to `geometry_file`.
+
+        Nothing is saved if a submobject has submobjects of its own.
+
+        Parameters
+        ----------
+        geometry_file : :class:`str`
+            The path of the .npz file.
+        """
+        if any(submob.submobjects for submob in self.submobjects):
+            return
+        points = [submob.points for submob in self.submobjects]
+        is_path = [
+            isinstance(submob, VMobjectFromSVGPathstring) for submob in self.submobjects
+        ]
+        path_strings = [
+            submob.path_string if path else ""
+            for submob, path in zip(self.submobjects, is_path)
+        ]
+        # Written to a temporary file first, as other renders may read it.
+        file_descriptor, temp_file = tempfile.mkstemp(
+            suffix=".npz", dir=os.path.dirname(geometry_file)
+        )
+        with os.fdopen(file_descriptor, "wb") as outfile:
+            np.savez(
+                outfile,
+                points=np.concatenate(points) if points else np.zeros((0, self.dim)),
+                lengths=np.array([len(p) for p in points], dtype=int),
+                is_path=np.array(is_path, dtype=bool),
+                path_strings=np.array(path_strings, dtype=str),
+            )
+        os.replace(temp_file, geometry_file)
+
+    def load_geometry(self, geometry_file):
+        """Creates the submobjects from the points saved by :meth:`save_geometry`.
+
+        Paths are created with :meth:`path_string_to_mobject` (from an empty
+        path, so nothing is parsed), other shapes as plain
+        :class:`~.VMobject` instances.
+
+        Parameters
+        ----------
+        geometry_file : :class:`str`
+            The path of the .npz file.
+        """
+        with np.load(geometry_file) as geometry:
+            points = geometry["points"]
+            lengths = geometry["lengths"]
+            is_path = geometry["is_path"]
+            path_strings = geometry["path_strings"]
+        submobjects = []
+        start = 0
+        for length, path, path_string in zip(lengths, is_path, path_strings):
+            if path:
+                submob = self.path_string_to_mobject("")
+                submob.path_string = str(path_string)
+            else:
+                submob = VMobject()
+            submob.points = points[start : start + length].copy()
+            submobjects.append(submob)
+            start += length
+        self.add(*submobjects)
+
+    def parse_svg_file(self):
+        """Returns the mobjects of the svg file, reading it as a stream.
+
+        Each element is converted when its end tag is read, and then removed
+        from the document, so the memory used doesn't grow with the size of
+        the file.  Only the content of ``<defs>`` elements is kept, to be
+        converted each time a ``<use>`` element refers to it.
+
+        Returns
+        -------
+        List[:class:`~.VMobject`]
+            The mobjects of the root ``<svg>`` element.
+        """
         self.ref_to_element = {}
-        for svg in doc.getElementsByTagName("svg"):
-            mobjects = self.get_mobjects_from(svg)
-            if self.unpack_groups:
-                self.add(*mobjects)
+        # (element, mobjects of its children) for each open element, except
+        # the ones in <defs>
+        stack = []
+        defs_depth = 0
+        mobjects = []
+        for event, element in ElementTree.iterparse(
+            self.file_path, events=("start", "end")
+        ):
+            if event == "start":
+                self.strip_namespaces(element)
+                if defs_depth or element.tag == "defs":
+                    defs_depth += 1
+                else:
+                    stack.append((element, []))
+                continue
+            if defs_depth:
+                defs_depth -= 1
+                if defs_depth > 0:
+                    continue
+                self.update_ref_to_element(element)
+                mobjects = []
             else:
-                self.add(*mobjects[0].submobjects)
-        doc.unlink()
+                _, children_mobjects = stack.pop()
+                mobjects = self.element_to_mobjects(element, children_mobjects)
+                element.clear()
+            if stack:
+                parent, siblings_mobjects = stack[-1]
+                siblings_mobjects.extend(mobjects)
+                del parent[-1]
+        return mobjects
+
+    @staticmethod
+    def strip_namespaces(element):
+        # e.g. "{http://www.w3.org/2000/svg}path" -> "path" and
+        # "{http://www.w3.org/1999/xlink}href" -> "href"
+        element.tag = element.tag.rpartition("}")[2]
+        if any(key.startswith("{") for key in element.attrib):
+            element.attrib = {
+                key.rpartition("}")[2]: value for key, value in element.attrib.items()
+            }
 
     def get_mobjects_from(self, element):
-        result = []
-        if not isinstance(element, minidom.Element):
-            return result
-        if element.tagName == "defs":
+        """Converts an element and its descendants, e.g. an element of
+        ``<defs>`` referred to by a ``<use>`` element."""
+        if element.tag == "defs":
             self.update_ref_to_element(element)
-        elif element.tagName == "style":
+            return []
+        children_mobjects = []
+        if element.tag in ["g", "svg", "symbol"]:
+            for child in element:
+                children_mobjects += self.get_mobjects_from(child)
+        return self.element_to_mobjects(element, children_mobjects)
+
+    def element_to_mobjects(self, element, children_mobjects):
+        """Converts an element, given the mobjects of its children.
+
+        Parameters
+        ----------
+        element : :class:`xml.etree.ElementTree.Element`
+            The element, without namespaces.
+        children_mobjects : List[:class:`~.VMobject`]
+            The mobjects of its children, if it is a group.
+
+        Returns
+        -------
+        List[:class:`~.VMobject`]
+            The mobjects of the element.
+        """
+        result = []
+        if element.tag == "style":
             pass  # TODO, handle style
-        elif element.tagName in ["g", "svg", "symbol"]:
-            result += it.chain(
-                *[self.get_mobjects_from(child) for child in element.childNodes]
-            )
-        elif element.tagName == "path":
-            temp = element.getAttribute("d")
+        elif element.tag in ["g", "svg", "symbol"]:
+            result += children_mobjects
+        elif element.tag == "path":
+            temp = element.get("d", "")
             if temp != "":
                 result.append(self.path_string_to_mobject(temp))
-        elif element.tagName == "use":
+        elif element.tag == "use":
             result += self.use_to_mobjects(element)
-        elif element.tagName == "rect":
+        elif element.tag == "rect":
             result.append(self.rect_to_mobject(element))
-        elif element.tagName == "circle":
+        elif element.tag == "circle":
             result.append(self.circle_to_mobject(element))
-        elif element.tagName == "ellipse":
+        elif element.tag == "ellipse":
             result.append(self.ellipse_to_mobject(element))
-        elif element.tagName in ["polygon", "polyline"]:
+        elif element.tag in ["polygon", "polyline"]:
             result.append(self.polygon_to_mobject(element))
         else:
             pass  # TODO
-            # warnings.warn("Unknown element type: " + element.tagName)
+            # warnings.warn("Unknown element type: " + element.tag)
         result = [m for m in result if m is not None]
         self.handle_transforms(element, VGroup(*result))
         if len(result) > 1 and not self.unpack_groups:
@@ -121,7 +300,7 @@ class SVGMobject(VMobject):
 
     def use_to_mobjects(self, use_element):
         # Remove initial "#" character
-        ref = use_element.getAttribute("xlink:href")[1:]
+        ref = use_element.get("href", "")[1:]
         if ref not in self.ref_to_element:
             warnings.warn("%s not recognized" % ref)
             return VGroup()
@@ -135,7 +314,7 @@ class SVGMobject(VMobject):
 
     def polygon_to_mobject(self, polygon_element):
         # TODO, This seems hacky...
-        path_string = polygon_element.getAttribute("points")
+        path_string = polygon_element.get("points", "")
         for digit in string.digits:
             path_string = path_string.replace(" " + digit, " L" + digit)
         path_string = "M" + path_string
@@ -145,8 +324,8 @@ class SVGMobject(VMobject):
 
     def circle_to_mobject(self, circle_element):
         x, y, r = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key, ""))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "r")
         ]
@@ -154,18 +333,18 @@ class SVGMobject(VMobject):
 
     def ellipse_to_mobject(self, circle_element):
         x, y, rx, ry = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key, ""))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "rx", "ry")
         ]
         return Circle().scale(rx * RIGHT + ry * UP).shift(x * RIGHT + y * DOWN)
 
     def rect_to_mobject(self, rect_element):
-        fill_color = rect_element.getAttribute("fill")
-        stroke_color = rect_element.getAttribute("stroke")
-        stroke_width = rect_element.getAttribute("stroke-width")
-        corner_radius = rect_element.getAttribute("rx")
+        fill_color = rect_element.get("fill", "")
+        stroke_color = rect_element.get("stroke", "")
+        stroke_width = rect_element.get("stroke-width", "")
+        corner_radius = rect_element.get("rx", "")
 
         # input preprocessing
         if fill_color in ["", "none", "#FFF", "#FFFFFF"] or Color(fill_color) == Color(
@@ -192,8 +371,8 @@ class SVGMobject(VMobject):
 
         if corner_radius == 0:
             mob = Rectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 stroke_width=stroke_width,
                 stroke_color=stroke_color,
                 fill_color=fill_color,
@@ -201,8 +380,8 @@ class SVGMobject(VMobject):
             )
         else:
             mob = RoundedRectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 stroke_width=stroke_width,
                 stroke_color=stroke_color,
                 fill_color=fill_color,
@@ -216,14 +395,14 @@ class SVGMobject(VMobject):
     def handle_transforms(self, element, mobject):
         x, y = 0, 0
         try:
-            x = self.attribute_to_float(element.getAttribute("x"))
+            x = self.attribute_to_float(element.get("x", ""))
             # Flip y
-            y = -self.attribute_to_float(element.getAttribute("y"))
+            y = -self.attribute_to_float(element.get("y", ""))
             mobject.shift(x * RIGHT + y * UP)
         except:
             pass
 
-        transform = element.getAttribute("transform")
+        transform = element.get("transform", "")
 
         try:  # transform matrix
             prefix = "matrix("
@@ -274,29 +453,8 @@ class SVGMobject(VMobject):
             pass
         # TODO, ...
 
-    def flatten(self, input_list):
-        output_list = []
-        for i in input_list:
-            if isinstance(i, list):
-                output_list.extend(self.flatten(i))
-            else:
-                output_list.append(i)
-        return output_list
-
-    def get_all_childNodes_have_id(self, element):
-        all_childNodes_have_id = []
-        if not isinstance(element, minidom.Element):
-            return
-        if element.hasAttribute("id"):
-            return [element]
-        for e in element.childNodes:
-            all_childNodes_have_id.append(self.get_all_childNodes_have_id(e))
-        return self.flatten([e for e in all_childNodes_have_id if e])
-
     def update_ref_to_element(self, defs):
-        new_refs = dict(
-            [(e.getAttribute("id"), e) for e in self.get_all_childNodes_have_id(defs)]
-        )
+        new_refs = dict([(e.get("id"), e) for e in defs.iter() if "id" in e.attrib])
         self.ref_to_element.update(new_refs)
 
     def move_into_position(self):
@@ -313,113 +471,25 @@ class VMobjectFromSVGPathstring(VMobject):
         digest_locals(self)
         VMobject.__init__(self, **kwargs)
 
-    def get_path_commands(self):
-        result = [
-            "M",  # moveto
-            "L",  # lineto
-            "H",  # horizontal lineto
-            "V",  # vertical lineto
-            "C",  # curveto
-            "S",  # smooth curveto
-            "Q",  # quadratic Bezier curve
-            "T",  # smooth quadratic Bezier curveto
-            "A",  # elliptical Arc
-            "Z",  # closepath
-        ]
-        result += [s.lower() for s in result]
-        return result
-
     def generate_points(self):
-        pattern = "[%s]" % ("".join(self.get_path_commands()))
-        pairs = list(
-            zip(
-                re.findall(pattern, self.path_string),
-                re.split(pattern, self.path_string)[1:],
-            )
-        )
-        # Which mobject should new points be added to
-        self = self
-        for command, coord_string in pairs:
-            self.handle_command(command, coord_string)
-        # people treat y-coordinate differently
-        self.rotate(np.pi, RIGHT, about_point=ORIGIN)
-
-    def handle_command(self, command, coord_string):
-        isLower = command.islower()
-        command = command.upper()
-        # new_points are the points that will be added to the curr_points
-        # list. This variable may get modified in the conditionals below.
-        points = self.points
-        new_points = self.string_to_points(coord_string)
-
-        if isLower and len(points) > 0:
-            new_points += points[-1]
-
-        if command == "M":  # moveto
-            self.start_new_path(new_points[0])
-            if len(new_points) <= 1:
-                return
-
-            # Draw relative line-to values.
-            points = self.points
-            new_points = new_points[1:]
-            command = "L"
-
-            for p in new_points:
-                if isLower:
-                    # Treat everything as relative line-to until empty
-                    p[0] += self.points[-1, 0]
-                    p[1] += self.points[-1, 1]
-                self.add_line_to(p)
-            return
-
-        elif command in ["L", "H", "V"]:  # lineto
-            if command == "H":
-                new_points[0, 1] = points[-1, 1]
-            elif command == "V":
-                if isLower:
-                    new_points[0, 0] -= points[-1, 0]
-                    new_points[0, 0] += points[-1, 1]
-                new_points[0, 1] = new_points[0, 0]
-                new_points[0, 0] = points[-1, 0]
-            self.add_line_to(new_points[0])
-            return
-
-        if command == "C":  # curveto
-            pass  # Yay! No action required
-        elif command in ["S", "T"]:  # smooth curveto
-            self.add_smooth_curve_to(*new_points)
-            # handle1 = points[-1] + (points[-1] - points[-2])
-            # new_points = np.append([handle1], new_points, axis=0)
+        key = (type(self), self.path_string)
+        points = parsed_paths.get(key)
+        if points is not None:
+            parsed_paths.move_to_end(key)
+            self.points = points.copy()
             return
-        elif command == "Q":  # quadratic Bezier curve
-            # TODO, this is a suboptimal approximation
-            new_points = np.append([new_points[0]], new_points, axis=0)
-        elif command == "A":  # elliptical Arc
-            raise Exception("Not implemented")
-        elif command == "Z":  # closepath
-            return
-
-        # Add first three points
-        self.add_cubic_bezier_curve_to(*new_points[0:3])
-
-        # Handle situations where there's multiple relative control points
-        if len(new_points) > 3:
-            # Add subsequent offset points relatively.
-            for i in range(3, len(new_points), 3):
-                if isLower:
-                    new_points[i : i + 3] -= points[-1]
-                    new_points[i : i + 3] += new_points[i - 1]
-                self.add_cubic_bezier_curve_to(*new_points[i : i + 3])
-
-    def string_to_points(self, coord_string):
-        numbers = string_to_numbers(coord_string)
-        if len(numbers) % 2 == 1:
-            numbers.append(0)
-        num_points = len(numbers) // 2
-        result = np.zeros((num_points, self.dim))
-        result[:, :2] = np.array(numbers).reshape((num_points, 2))
-        return result
+        self.parse_path_string()
+        parsed_paths[key] = self.points.copy()
+        if len(parsed_paths) > PATH_CACHE_SIZE:
+            parsed_paths.popitem(last=False)
+
+    def parse_path_string(self):
+        coords = path_string_to_points(self.path_string)
+        points = np.zeros((len(coords), self.dim))
+        points[:, 0] = coords[:, 0]
+        # people treat y-coordinate differently
+        points[:, 1] = -coords[:, 1]
+        self.points = points
 
     def get_original_path_string(self):
         return self.path_string
@@ -0,0 +1,246 @@
+"""Parser of the path descriptions (the ``d`` attribute) of svg files."""
+
+
+__all__ = ["SVGPathParser", "path_string_to_points"]
+
+
+import math
+import re
+
+import numpy as np
+
+
+# A command letter, or a number
+PATH_TOKEN = re.compile(
+    r"([MmZzLlHhVvCcSsQqTtAa])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+)
+
+# Number of arguments of each command
+COMMAND_ARGUMENTS = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+
+
+class SVGPathParser(object):
+    """Converts a path description to cubic Bézier curves.
+
+    The path is read following the SVG specification: implicit commands
+    (further argument pairs after a moveto are lineto), relative commands,
+    reflected control points of ``S`` and ``T``, quadratic curves (converted
+    exactly to cubic ones), elliptical arcs (approximated by one cubic curve
+    per quarter turn at most) and ``Z`` (which draws the closing line of the
+    subpath, if needed).
+
+    The control points of all the curves are collected in a flat list, and
+    converted to an array once, at the end.
+    """
+
+    def __init__(self):
+        # x0, y0, x1, y1, x2, y2, x3, y3 for each curve
+        self.coords = []
+        self.x = self.y = 0.0
+        self.start_x = self.start_y = 0.0
+        # The control point to reflect for S and T, if the last curve was a
+        # cubic (resp. quadratic) one
+        self.cubic_control = None
+        self.quad_control = None
+
+    def parse(self, path_string):
+        """Returns the points of the curves of a path description.
+
+        Parameters
+        ----------
+        path_string : :class:`str`
+            The path description.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The anchors and handles of the curves (four points per curve), in
+            the coordinates of the svg file (so with the y axis pointing down).
+        """
+        command = None
+        args = []
+        for command_token, number in PATH_TOKEN.findall(path_string):
+            if command_token:
+                command = command_token
+                args = []
+                if command in "Zz":
+                    self.close_path()
+                    command = None
+                continue
+            if command is None:
+                # Numbers without a command, e.g. after Z: invalid, skipped
+                continue
+            pending = [number]
+            while pending:
+                text = pending.pop()
+                if command in "Aa" and len(args) in (3, 4) and len(text) > 1:
+                    # Flags can be written without separators, e.g. "01"
+                    pending.append(text[1:])
+                    text = text[0]
+                args.append(float(text))
+                if len(args) == COMMAND_ARGUMENTS[command.upper()]:
+                    self.handle_command(command, args)
+                    args = []
+                    if command in "Mm":
+                        # Further pairs of coordinates are lines
+                        command = "l" if command == "m" else "L"
+        return np.array(self.coords, dtype=float).reshape((-1, 2))
+
+    def handle_command(self, command, args):
+        upper = command.upper()
+        if command != upper:
+            # Relative command: offset the coordinates
+            if upper == "H":
+                args[0] += self.x
+            elif upper == "V":
+                args[0] += self.y
+            elif upper == "A":
+                args[5] += self.x
+                args[6] += self.y
+            else:
+                for i in range(0, len(args), 2):
+                    args[i] += self.x
+                    args[i + 1] += self.y
+        cubic_control = quad_control = None
+        if upper == "M":
+            self.x, self.y = self.start_x, self.start_y = args
+        elif upper == "L":
+            self.add_line(*args)
+        elif upper == "H":
+            self.add_line(args[0], self.y)
+        elif upper == "V":
+            self.add_line(self.x, args[0])
+        elif upper == "C":
+            self.add_cubic(*args)
+            cubic_control = args[2:4]
+        elif upper == "S":
+            x1, y1 = self.reflect(self.cubic_control)
+            self.add_cubic(x1, y1, *args)
+            cubic_control = args[0:2]
+        elif upper == "Q":
+            self.add_quadratic(*args)
+            quad_control = args[0:2]
+        elif upper == "T":
+            quad_control = self.reflect(self.quad_control)
+            self.add_quadratic(*quad_control, *args)
+        elif upper == "A":
+            self.add_arc(*args)
+        self.cubic_control = cubic_control
+        self.quad_control = quad_control
+
+    def reflect(self, control):
+        if control is None:
+            return self.x, self.y
+        return 2 * self.x - control[0], 2 * self.y - control[1]
+
+    def close_path(self):
+        if self.x != self.start_x or self.y != self.start_y:
+            self.add_line(self.start_x, self.start_y)
+        self.cubic_control = self.quad_control = None
+
+    def add_cubic(self, x1, y1, x2, y2, x, y):
+        self.coords += (self.x, self.y, x1, y1, x2, y2, x, y)
+        self.x, self.y = x, y
+
+    def add_line(self, x, y):
+        dx = (x - self.x) / 3
+        dy = (y - self.y) / 3
+        self.add_cubic(self.x + dx, self.y + dy, x - dx, y - dy, x, y)
+
+    def add_quadratic(self, qx, qy, x, y):
+        self.add_cubic(
+            self.x + 2 / 3 * (qx - self.x),
+            self.y + 2 / 3 * (qy - self.y),
+            x + 2 / 3 * (qx - x),
+            y + 2 / 3 * (qy - y),
+            x,
+            y,
+        )
+
+    def add_arc(self, rx, ry, rotation, large_arc, sweep, x, y):
+        """Approximates an elliptical arc, given as in the SVG specification,
+        by cubic curves spanning at most a quarter turn each."""
+        x0, y0 = self.x, self.y
+        if x == x0 and y == y0:
+            return
+        rx, ry = abs(rx), abs(ry)
+        if rx == 0 or ry == 0:
+            self.add_line(x, y)
+            return
+        # Conversion to center parametrization (SVG specification, F.6.5)
+        phi = math.radians(rotation)
+        cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+        dx, dy = (x0 - x) / 2, (y0 - y) / 2
+        x1 = cos_phi * dx + sin_phi * dy
+        y1 = -sin_phi * dx + cos_phi * dy
+        # Scale up radii too small to join the endpoints (F.6.6)
+        radii_scale = (x1 / rx) ** 2 + (y1 / ry) ** 2
+        if radii_scale > 1:
+            rx *= math.sqrt(radii_scale)
+            ry *= math.sqrt(radii_scale)
+        numerator = (rx * ry) ** 2 - (rx * y1) ** 2 - (ry * x1) ** 2
+        denominator = (rx * y1) ** 2 + (ry * x1) ** 2
+        coef = math.sqrt(max(numerator, 0) / denominator)
+        if large_arc == sweep:
+            coef = -coef
+        cx1 = coef * rx * y1 / ry
+        cy1 = -coef * ry * x1 / rx
+        cx = cos_phi * cx1 - sin_phi * cy1 + (x0 + x) / 2
+        cy = sin_phi * cx1 + cos_phi * cy1 + (y0 + y) / 2
+        theta = math.atan2((y1 - cy1) / ry, (x1 - cx1) / rx)
+        delta = math.atan2((-y1 - cy1) / ry, (-x1 - cx1) / rx) - theta
+        if sweep and delta < 0:
+            delta += 2 * math.pi
+        elif not sweep and delta > 0:
+            delta -= 2 * math.pi
+
+        num_curves = max(math.ceil(abs(delta) / (math.pi / 2) - 1e-9), 1)
+        step = delta / num_curves
+        handle_length = 4 / 3 * math.tan(step / 4)
+        for i in range(1, num_curves + 1):
+            start, end = theta + (i - 1) * step, theta + i * step
+            cos_start, sin_start = math.cos(start), math.sin(start)
+            cos_end, sin_end = math.cos(end), math.sin(end)
+            # Derivatives of the ellipse at both ends, scaled
+            dx1 = handle_length * (-rx * sin_start * cos_phi - ry * cos_start * sin_phi)
+            dy1 = handle_length * (-rx * sin_start * sin_phi + ry * cos_start * cos_phi)
+            dx2 = handle_length * (-rx * sin_end * cos_phi - ry * cos_end * sin_phi)
+            dy2 = handle_length * (-rx * sin_end * sin_phi + ry * cos_end * cos_phi)
+            if i == num_curves:
+                end_x, end_y = x, y
+            else:
+                end_x = cx + rx * cos_end * cos_phi - ry * sin_end * sin_phi
+                end_y = cy + rx * cos_end * sin_phi + ry * sin_end * cos_phi
+            self.add_cubic(
+                self.x + dx1, self.y + dy1, end_x - dx2, end_y - dy2, end_x, end_y
+            )
+
+
+def path_string_to_points(path_string):
+    """Returns the points of the cubic curves of a path description.
+
+    See :class:`SVGPathParser`.
+
+    Parameters
+    ----------
+    path_string : :class:`str`
+        The path description, e.g. ``"M 0 0 L 1 0 Q 1 1 0 1 Z"``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The anchors and handles of the curves (four points per curve), of
+        shape (4 * number of curves, 2), with the y axis pointing down.
+    """
+    return SVGPathParser().parse(path_string)
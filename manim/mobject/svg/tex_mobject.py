@@ -8,10 +8,14 @@ __all__ = [
     "Title",
     "TexMobject",
     "TextMobject",
+    "compile_tex_strings",
+    "prefetch_tex_strings",
+    "prefetch_tex_from_file",
 ]
 
 
 from functools import reduce
+import ast
 import operator as op
 
 from ... import config, logger
@@ -23,7 +27,8 @@ from ...mobject.types.vectorized_mobject import VGroup
 from ...mobject.types.vectorized_mobject import VectorizedPoint
 from ...utils.config_ops import digest_config
 from ...utils.strings import split_string_list_to_isolate_substrings
-from ...utils.tex_file_writing import tex_to_svg_file
+from ...utils.template_cache import template_cache
+from ...utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files, prefetch_tex
 
 TEX_MOB_SCALE_FACTOR = 0.05
 
@@ -45,18 +50,23 @@ class SingleStringMathTex(SVGMobject):
         "organize_left_to_right": False,
         "alignment": "",
         "type": "tex",
+        "cache_geometry": True,
     }
 
     def __init__(self, tex_string, **kwargs):
         digest_config(self, kwargs)
         assert isinstance(tex_string, str)
         self.tex_string = tex_string
+        template_key = template_cache.get_key(self, config["tex_template"].body)
+        if template_cache.restore(self, template_key):
+            return
         file_name = tex_to_svg_file(self.get_modified_expression(tex_string), self.type)
         SVGMobject.__init__(self, file_name=file_name, **kwargs)
         if self.height is None:
             self.scale(TEX_MOB_SCALE_FACTOR)
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
+        template_cache.store(self, template_key)
 
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
@@ -152,9 +162,18 @@ class MathTex(SingleStringMathTex):
         digest_config(self, kwargs)
         tex_strings = self.break_up_tex_strings(tex_strings)
         self.tex_strings = tex_strings
-        SingleStringMathTex.__init__(
-            self, self.arg_separator.join(tex_strings), **kwargs
+        self.tex_string = self.arg_separator.join(tex_strings)
+        # Compile the whole expression, typeset by SingleStringMathTex.__init__,
+        # and the parts used by break_up_by_substrings at once, leaving out
+        # the mobjects in the template cache.
+        expressions, source_type = get_tex_expressions(
+            self.tex_strings, **self.get_sub_tex_config()
         )
+        template_key = template_cache.get_key(self, config["tex_template"].body)
+        if template_key not in template_cache and self.type == source_type:
+            expressions.append(self.get_modified_expression(self.tex_string))
+        tex_to_svg_files(expressions, source_type)
+        SingleStringMathTex.__init__(self, self.tex_string, **kwargs)
         self.break_up_by_substrings()
         self.set_color_by_tex_to_color_map(self.tex_to_color_map)
 
@@ -182,8 +201,7 @@ class MathTex(SingleStringMathTex):
         """
         new_submobjects = []
         curr_index = 0
-        config = dict(self.CONFIG)
-        config["alignment"] = ""
+        config = self.get_sub_tex_config()
         for tex_string in self.tex_strings:
             sub_tex_mob = SingleStringMathTex(tex_string, **config)
             num_submobs = len(sub_tex_mob.submobjects)
@@ -202,6 +220,11 @@ class MathTex(SingleStringMathTex):
         self.submobjects = new_submobjects
         return self
 
+    def get_sub_tex_config(self):
+        config = dict(self.CONFIG)
+        config["alignment"] = ""
+        return config
+
     def get_parts_by_tex(self, tex, substring=True, case_sensitive=True):
         def test(tex1, tex2):
             if not case_sensitive:
@@ -248,6 +271,7 @@ class MathTex(SingleStringMathTex):
 
     def sort_alphabetically(self):
         self.submobjects.sort(key=lambda m: m.get_tex_string())
+        self.increment_version()
 
 
 class Tex(MathTex):
@@ -344,3 +368,159 @@ class TextMobject(Tex):
             "in favour of Tex. Please use Tex instead!"
         )
         Tex.__init__(self, *text_parts, **kwargs)
+
+
+def get_tex_expressions(tex_strings, tex_class=SingleStringMathTex, **kwargs):
+    """Returns what is typeset for each of several tex mobjects.
+
+    The mobjects that are in the template cache are left out, as they are
+    copied instead of being built.
+
+    Parameters
+    ----------
+    tex_strings : Iterable[:class:`str`]
+        The tex strings of the mobjects.
+    tex_class : type, optional
+        The class of the mobjects, :class:`SingleStringMathTex` or a subclass.
+    kwargs
+        The configuration the mobjects will be created with.
+
+    Returns
+    -------
+    Tuple[List[:class:`str`], :class:`str`]
+        The expressions, and whether they are typeset in "tex" or "text" mode.
+    """
+    # Only the configuration is needed to know which expression will be
+    # typeset, so the mobject isn't initialized.
+    mobject = tex_class.__new__(tex_class)
+    digest_config(mobject, kwargs)
+    tex_template_body = config["tex_template"].body
+    expressions = []
+    for tex_string in tex_strings:
+        tex_string = str(tex_string)
+        # Set like the constructor does, for the key of the template cache
+        if isinstance(mobject, MathTex):
+            mobject.tex_strings = mobject.break_up_tex_strings([tex_string])
+            tex_string = mobject.arg_separator.join(mobject.tex_strings)
+        mobject.tex_string = tex_string
+        if template_cache.get_key(mobject, tex_template_body) in template_cache:
+            continue
+        expressions.append(mobject.get_modified_expression(tex_string))
+    return expressions, mobject.type
+
+
+def compile_tex_strings(tex_strings, tex_class=SingleStringMathTex, **kwargs):
+    """Compiles the svg files of several tex mobjects with a single LaTeX run.
+
+    Creating the mobjects afterwards only reads the cached svg files.  The
+    mobjects in the template cache are left out.
+
+    Parameters
+    ----------
+    tex_strings : Iterable[:class:`str`]
+        The tex strings of the mobjects.
+    tex_class : type, optional
+        The class of the mobjects, :class:`SingleStringMathTex` or a subclass.
+    kwargs
+        The configuration the mobjects will be created with.
+
+    Examples
+    --------
+    ::
+
+        compile_tex_strings(["a^2", "b^2", "c^2"], MathTex)
+        squares = VGroup(*[MathTex(s) for s in ["a^2", "b^2", "c^2"]])
+    """
+    tex_to_svg_files(*get_tex_expressions(tex_strings, tex_class, **kwargs))
+
+
+def prefetch_tex_strings(tex_strings, tex_class=MathTex, **kwargs):
+    """Starts compiling the svg files of several tex mobjects in the background.
+
+    Unlike :func:`compile_tex_strings`, this returns immediately, and the
+    compilation is spread over several processes.  Creating one of the
+    mobjects waits for its svg file to be ready.
+
+    Parameters
+    ----------
+    tex_strings : Iterable[Union[:class:`str`, Iterable[:class:`str`]]]
+        The tex strings of the mobjects.  For :class:`MathTex`, an item can
+        also be the tex strings of a single mobject.
+    tex_class : type, optional
+        The class of the mobjects, :class:`SingleStringMathTex` or a subclass.
+    kwargs
+        The configuration the mobjects will be created with.
+
+    Examples
+    --------
+    ::
+
+        class Formulas(Scene):
+            def construct(self):
+                prefetch_tex_strings(["e^{i\\pi} = -1", ("a^2", "+", "b^2")])
+                self.play(Write(MathTex("e^{i\\pi} = -1")))
+                self.play(Write(MathTex("a^2", "+", "b^2")))
+    """
+    if not issubclass(tex_class, MathTex):
+        prefetch_tex(*get_tex_expressions(tex_strings, tex_class, **kwargs))
+        return
+    mobject = tex_class.__new__(tex_class)
+    digest_config(mobject, kwargs)
+    expressions = []
+    parts = []
+    for tex_string in tex_strings:
+        if isinstance(tex_string, str):
+            tex_string = [tex_string]
+        mobject_parts = mobject.break_up_tex_strings(list(tex_string))
+        expressions.append(
+            mobject.get_modified_expression(mobject.arg_separator.join(mobject_parts))
+        )
+        parts += mobject_parts
+    prefetch_tex(expressions, mobject.type)
+    # The parts are compiled on their own as well, see break_up_by_substrings.
+    prefetch_tex(*get_tex_expressions(parts, **mobject.get_sub_tex_config()))
+
+
+def prefetch_tex_from_file(file_name):
+    """Prefetches the tex mobjects created from string literals in a file.
+
+    Calls like ``MathTex("x^2", "+1")`` or ``Tex("Hello")``, whose arguments
+    are all strings, are found by parsing the file, and compiled in the
+    background with :func:`prefetch_tex_strings`.  Calls with keyword
+    arguments that may change what is typeset are left out.
+
+    Parameters
+    ----------
+    file_name : :class:`str`
+        The path of the python file.
+    """
+    tex_classes = {
+        "SingleStringMathTex": SingleStringMathTex,
+        "MathTex": MathTex,
+        "Tex": Tex,
+        "TexMobject": MathTex,
+        "TextMobject": Tex,
+    }
+    style_keywords = {"color", "fill_color", "stroke_color", "fill_opacity"}
+    tex_strings = {tex_class: [] for tex_class in tex_classes.values()}
+    with open(file_name, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), file_name)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = getattr(node.func, "id", getattr(node.func, "attr", None))
+        if name not in tex_classes or not node.args:
+            continue
+        if any(keyword.arg not in style_keywords for keyword in node.keywords):
+            continue
+        args = [getattr(arg, "value", getattr(arg, "s", None)) for arg in node.args]
+        if not all(isinstance(arg, str) for arg in args):
+            continue
+        tex_class = tex_classes[name]
+        if issubclass(tex_class, MathTex):
+            tex_strings[tex_class].append(args)
+        else:
+            tex_strings[tex_class] += args
+    for tex_class, strings in tex_strings.items():
+        if strings:
+            prefetch_tex_strings(strings, tex_class)
@@ -12,12 +12,59 @@ from ...constants import *
 from ...container import Container
 from ...mobject.geometry import Dot, Rectangle
 from ...mobject.svg.svg_mobject import SVGMobject
-from ...mobject.types.vectorized_mobject import VGroup
+from ...mobject.types.vectorized_mobject import VGroup, VMobject
 from ...utils.config_ops import digest_config
+from ...utils.template_cache import template_cache
 
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 
+# (font, slant, weight, size) -> {glyph index -> points of the outline of the
+# glyph}, for the "outline" backend of Text
+glyph_outlines = {}
+
+# font -> identity of the font, see get_font_identity
+font_identities = {}
+
+# Text whose outlines identify a font
+FONT_IDENTITY_SAMPLE = "AaBbGgMmQqWwYy0123456789{}()<>,.;:'\"|/_-+=*&%$#@!?~"
+
+
+def get_font_identity(font):
+    """Returns a string identifying the font cairo draws text with when asked
+    for `font`, including the versions of cairo and pycairo.
+
+    It is a hash of the outlines of a sample text, so it changes when the
+    font is installed, removed or updated, or when another font is used in
+    its place.
+
+    Parameters
+    ----------
+    font : :class:`str`
+        The name of the font.
+
+    Returns
+    -------
+    :class:`str`
+        The identity of the font.
+    """
+    identity = font_identities.get(font)
+    if identity is None:
+        surface = cairo.ImageSurface(cairo.FORMAT_A8, 1, 1)
+        context = cairo.Context(surface)
+        context.select_font_face(
+            font, cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
+        )
+        context.set_font_size(100)
+        context.text_path(FONT_IDENTITY_SAMPLE)
+        hasher = hashlib.sha256(
+            f"{cairo.cairo_version_string()} {cairo.version}".encode()
+        )
+        hasher.update(repr(list(context.copy_path())).encode())
+        identity = hasher.hexdigest()
+        font_identities[font] = identity
+    return identity
+
 
 class TextSetting(object):
     def __init__(self, start, end, font, slant, weight, line_num=-1):
@@ -39,7 +86,11 @@ class Text(SVGMobject):
         "stroke_width": 0,
         "should_center": True,
         "unpack_groups": True,
+        "cache_geometry": True,
         # Text
+        # "svg" draws the text to an svg file and parses it, "outline" builds
+        # the mobjects from the outlines of the glyphs, without any file.
+        "backend": "svg",
         "font": "",
         "gradient": None,
         "lsh": -1,
@@ -62,31 +113,23 @@ class Text(SVGMobject):
             text_without_tabs = text.replace("\t", " " * self.tab_width)
         self.text = text_without_tabs
         self.lsh = self.size if self.lsh == -1 else self.lsh
-
-        file_name = self.text2svg()
-        self.remove_last_M(file_name)
-        SVGMobject.__init__(self, file_name, **config)
+        template_key = template_cache.get_key(self, text)
+        if template_cache.restore(self, template_key):
+            return
+
+        if self.backend == "outline":
+            VMobject.__init__(self, **config)
+            self.move_into_position()
+        else:
+            file_name = self.text2svg()
+            self.remove_last_M(file_name)
+            SVGMobject.__init__(self, file_name, **config)
         self.apply_front_and_end_spaces()
         self.text = text
         self.apply_space_chars()
 
-        nppc = self.n_points_per_cubic_curve
         for each in self:
-            if len(each.points) == 0:
-                continue
-            points = each.points
-            last = points[0]
-            each.clear_points()
-            for index, point in enumerate(points):
-                each.append_points([point])
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    each.add_line_to(last)
-                    last = points[index + 1]
-            each.add_line_to(last)
+            self.close_subpaths(each)
 
         if self.t2c:
             self.set_color_by_t2c()
@@ -98,9 +141,52 @@ class Text(SVGMobject):
         # anti-aliasing
         if self.height is None and self.width is None:
             self.scale(TEXT_MOB_SCALE_FACTOR)
+        template_cache.store(self, template_key)
+
+    def close_subpaths(self, vmobject):
+        """Adds a line from the end of each subpath of `vmobject` to its start,
+        if they differ, as the glyph outlines are filled as closed shapes.
+        """
+        nppc = self.n_points_per_cubic_curve
+        points = vmobject.points
+        if len(points) == 0 or len(points) % nppc != 0:
+            return
+        curves = points.reshape((-1, nppc, self.dim))
+        # Index of the first curve of each subpath, and of the curve after it
+        starts = np.flatnonzero(np.any(curves[1:, 0] != curves[:-1, -1], axis=1)) + 1
+        starts = np.concatenate([[0], starts])
+        ends = np.append(starts[1:], len(curves))
+        alphas = np.linspace(0, 1, nppc)[:, np.newaxis]
+        pieces = []
+        for start, end in zip(starts, ends):
+            pieces.append(curves[start:end])
+            first, last = curves[start, 0], curves[end - 1, -1]
+            if np.any(first != last):
+                pieces.append([last + alphas * (first - last)])
+        if len(pieces) > len(starts):
+            vmobject.points = np.concatenate(pieces).reshape((-1, self.dim))
+
+    def generate_points(self):
+        if self.backend == "outline":
+            self.add(*self.text2mobjects())
+        else:
+            SVGMobject.generate_points(self)
 
     def get_space_width(self):
         size = self.size * 10
+        if self.backend == "outline":
+            context = cairo.Context(cairo.RecordingSurface(cairo.Content.ALPHA, None))
+            context.set_font_size(size)
+            underscore = VGroup(
+                *self.get_glyph_mobjects(
+                    context, "_", self.font, self.slant, self.weight, START_X, START_Y
+                )
+            )
+            if self.height is not None:
+                underscore.set_height(self.height)
+            if self.width is not None:
+                underscore.set_width(self.width)
+            return underscore.get_width()
 
         dir_name = file_writer_config["text_dir"]
         file_name = os.path.join(dir_name, "space") + ".svg"
@@ -345,6 +431,111 @@ class Text(SVGMobject):
 
         return file_name
 
+    def text2mobjects(self):
+        """Builds the mobjects of the glyphs of the text, as :meth:`text2svg`
+        would draw them, directly from the outlines of the fonts.
+
+        Returns
+        -------
+        List[:class:`~.VMobject`]
+            One mobject per glyph with an outline.
+        """
+        size = self.size * 10
+        lsh = self.lsh * 10
+
+        if self.font == "":
+            if NOT_SETTING_FONT_MSG != "":
+                logger.warning(NOT_SETTING_FONT_MSG)
+
+        context = cairo.Context(cairo.RecordingSurface(cairo.Content.ALPHA, None))
+        context.set_font_size(size)
+
+        mobjects = []
+        offset_x = 0
+        last_line_num = 0
+        for setting in self.text2settings():
+            text = self.text[setting.start : setting.end].replace("\n", " ")
+            if setting.line_num != last_line_num:
+                offset_x = 0
+                last_line_num = setting.line_num
+            mobjects += self.get_glyph_mobjects(
+                context,
+                text,
+                setting.font,
+                setting.slant,
+                setting.weight,
+                START_X + offset_x,
+                START_Y + lsh * setting.line_num,
+            )
+            offset_x += context.text_extents(text)[4]
+        return mobjects
+
+    def get_glyph_mobjects(self, context, text, font, slant, weight, x, y):
+        """Returns the mobjects of the glyphs of `text`, drawn from (x, y).
+
+        The outlines of the glyphs are cached by font, slant, weight and size.
+        This also selects the font face of `context`, whose font size must be
+        set.
+
+        Returns
+        -------
+        List[:class:`~.VMobject`]
+            One mobject per glyph with an outline (so none for spaces).
+        """
+        context.select_font_face(font, self.str2slant(slant), self.str2weight(weight))
+        outlines = glyph_outlines.setdefault(
+            (font, slant, weight, context.get_font_matrix().xx), {}
+        )
+        mobjects = []
+        for index, glyph_x, glyph_y in context.get_scaled_font().text_to_glyphs(
+            x, y, text, False
+        ):
+            points = outlines.get(index)
+            if points is None:
+                points = outlines[index] = self.get_glyph_outline(context, index)
+            if len(points) == 0:
+                continue
+            mob = VMobject()
+            mob.points = points + np.array([glyph_x, -glyph_y, 0])
+            mobjects.append(mob)
+        return mobjects
+
+    def get_glyph_outline(self, context, index):
+        """Returns the points of the outline of a glyph of the current font of
+        `context`, with its origin at ``ORIGIN`` and the y axis pointing up.
+
+        Closed subpaths end with a line back to their start, if they don't
+        already end there.
+        """
+        context.new_path()
+        context.glyph_path([cairo.Glyph(index, 0, 0)])
+        path = context.copy_path()
+        context.new_path()
+        curves = []
+        start = current = None
+        for kind, coords in path:
+            if kind == cairo.PathDataType.MOVE_TO:
+                start = current = np.array(coords)
+            elif kind == cairo.PathDataType.LINE_TO:
+                end = np.array(coords)
+                step = (end - current) / 3
+                curves.append([current, current + step, end - step, end])
+                current = end
+            elif kind == cairo.PathDataType.CURVE_TO:
+                handle1, handle2, end = np.reshape(coords, (3, 2))
+                curves.append([current, handle1, handle2, end])
+                current = end
+            elif kind == cairo.PathDataType.CLOSE_PATH:
+                if np.any(current != start):
+                    step = (start - current) / 3
+                    curves.append([current, current + step, start - step, start])
+                current = start
+        points = np.zeros((4 * len(curves), 3))
+        if curves:
+            points[:, :2] = np.reshape(curves, (-1, 2))
+            points[:, 1] *= -1
+        return points
+
 
 class TextWithFixHeight(Text):
     def __init__(self, text, **kwargs):
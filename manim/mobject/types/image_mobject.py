@@ -87,6 +87,7 @@ class ImageMobject(AbstractImageMobject):
 
     def set_opacity(self, alpha):
         self.pixel_array[:, :, 3] = int(255 * alpha)
+        self.increment_version()
         return self
 
     def fade(self, darkness=0.5, family=True):
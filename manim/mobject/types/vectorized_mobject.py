@@ -142,6 +142,7 @@ class VMobject(Mobject):
             curr_rgbas[:, :3] = rgbas[:, :3]
         if opacity is not None:
             curr_rgbas[:, 3] = rgbas[:, 3]
+        self.increment_version()
         return self
 
     def set_fill(self, color=None, opacity=None, family=True):
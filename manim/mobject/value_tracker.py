@@ -25,6 +25,7 @@ class ValueTracker(Mobject):
 
     def set_value(self, value):
         self.points[0, 0] = value
+        self.increment_version()
         return self
 
     def increment_value(self, d_value):
@@ -60,4 +61,5 @@ class ComplexValueTracker(ValueTracker):
     def set_value(self, z):
         z = complex(z)
         self.points[0, :2] = (z.real, z.imag)
+        self.increment_version()
         return self
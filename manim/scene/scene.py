@@ -1,7 +1,7 @@
 """A Scene is the canvas of the animation."""
 
 
-__all__ = ["Scene", "EndSceneEarlyException"]
+__all__ = ["Scene", "EndSceneEarlyException", "SegmentRenderError"]
 
 
 import inspect
@@ -9,6 +9,7 @@ import random
 import warnings
 import platform
 import copy
+import multiprocessing
 
 from tqdm import tqdm as ProgressDisplay
 import numpy as np
@@ -23,6 +24,7 @@ from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.iterables import list_update
 from ..utils.hashing import get_hash_from_play_call, get_hash_from_wait_call
+from ..utils.tex_file_writing import shutdown_prefetch_pool
 
 
 class Scene(Container):
@@ -66,12 +68,19 @@ class Scene(Container):
         Container.__init__(self, **kwargs)
         self.camera = self.camera_class(**camera_config)
         self.file_writer = SceneFileWriter(self, **file_writer_config,)
+        # Frames are handed to the file writer's queue without copying them,
+        # the camera draws into another pixel array in the meantime.
+        self.camera.n_pixel_array_buffers = file_writer_config["pixel_array_buffers"]
         self.play_hashes_list = []
         self.mobjects = []
         # TODO, remove need for foreground mobjects
         self.foreground_mobjects = []
         self.num_plays = 0
         self.time = 0
+        self.rendering_delegated = False
+        self.segment_processes = []
+        self.static_image = None
+        self.static_image_key = None
         self.original_skipping_status = file_writer_config["skip_animations"]
         if self.random_seed is not None:
             random.seed(self.random_seed)
@@ -83,6 +92,7 @@ class Scene(Container):
         except EndSceneEarlyException:
             pass
         self.tear_down()
+        self.wait_for_segment_processes()
         # We have to reset these settings in case of multiple renders.
         file_writer_config["skip_animations"] = False
         self.original_skipping_status = file_writer_config["skip_animations"]
@@ -194,15 +204,16 @@ class Scene(Container):
         """
         if file_writer_config["skip_animations"] and not ignore_skipping:
             return
+        if self.rendering_delegated:
+            return
         if mobjects is None:
             mobjects = list_update(self.mobjects, self.foreground_mobjects,)
+        kwargs["include_submobjects"] = include_submobjects
         if background is not None:
-            self.camera.set_pixel_array(background)
+            self.camera.capture_mobjects_over_background(mobjects, background, **kwargs)
         else:
             self.camera.reset()
-
-        kwargs["include_submobjects"] = include_submobjects
-        self.camera.capture_mobjects(mobjects, **kwargs)
+            self.camera.capture_mobjects(mobjects, **kwargs)
 
     def freeze_background(self):
         self.update_frame()
@@ -875,13 +886,112 @@ class Scene(Container):
         def wrapper(self, *args, **kwargs):
             self.update_skipping_status()
             allow_write = not file_writer_config["skip_animations"]
+            if allow_write and self.start_segment_process(func, args, kwargs):
+                # A forked worker renders this segment from the current state,
+                # so here the scene only steps through it without rendering.
+                allow_write = False
+                self.rendering_delegated = True
             self.file_writer.begin_animation(allow_write)
             func(self, *args, **kwargs)
             self.file_writer.end_animation(allow_write)
+            self.rendering_delegated = False
             self.num_plays += 1
 
         return wrapper
 
+    def start_segment_process(self, func, args, kwargs):
+        """
+        Renders a play() like call in a separate process, if enabled and if
+        a movie is written.
+
+        The process is forked right before the call, so that it starts
+        from a snapshot of the current state of the scene. It then renders
+        and encodes the segment into its partial movie file, exactly as the
+        main process would have done. At most ``render_processes`` of these
+        run at the same time.
+
+        A forked process only gets the thread that forked it, and a lock
+        held by another thread at that moment (e.g. by logging) would never
+        be released in the child. So the thread pools (of the Tex prefetching
+        and of the camera's raster threads) are shut down before forking, and
+        recreated when needed. The frame writer thread only runs between
+        begin_animation and end_animation, never at this point.
+
+        Parameters
+        ----------
+        func : function
+            The play() like function to render.
+        args : tuple
+            The positional arguments passed to func.
+        kwargs : dict
+            The keyword arguments passed to func.
+
+        Returns
+        -------
+        bool
+            Whether the segment is being rendered by another process.
+        """
+        if (
+            file_writer_config["render_processes"] <= 1
+            or not file_writer_config["write_to_movie"]
+        ):
+            return False
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                "Rendering with several processes is not supported on this platform"
+            )
+            file_writer_config["render_processes"] = 1
+            return False
+        self.wait_for_segment_processes(file_writer_config["render_processes"] - 1)
+        shutdown_prefetch_pool()
+        self.camera.shutdown_raster_executor()
+        process = multiprocessing.get_context("fork").Process(
+            target=self.render_segment, args=(func, args, kwargs)
+        )
+        process.start()
+        self.segment_processes.append((self.num_plays, process))
+        return True
+
+    def render_segment(self, func, args, kwargs):
+        """
+        Renders a play() like call into its partial movie file. This is the
+        entry point of the processes started by start_segment_process.
+
+        Parameters
+        ----------
+        func : function
+            The play() like function to render.
+        args : tuple
+            The positional arguments passed to func.
+        kwargs : dict
+            The keyword arguments passed to func.
+        """
+        # Several of these run at once, their progress bars would overlap.
+        file_writer_config["progress_bar"] = False
+        self.segment_processes = []
+        self.file_writer.begin_animation(True)
+        func(self, *args, **kwargs)
+        self.file_writer.end_animation(True)
+
+    def wait_for_segment_processes(self, max_running=0):
+        """
+        Waits until at most `max_running` segments are still being
+        rendered by other processes.
+
+        Parameters
+        ----------
+        max_running : int, optional
+            The number of processes allowed to keep running.
+        """
+        while len(self.segment_processes) > max_running:
+            play_number, process = self.segment_processes.pop(0)
+            process.join()
+            if process.exitcode != 0:
+                raise SegmentRenderError(
+                    f"Animation {play_number} could not be rendered "
+                    f"(process exited with code {process.exitcode})"
+                )
+
     def begin_animations(self, animations):
         """
         This method begins the list of animations that is passed,
@@ -911,8 +1021,7 @@ class Scene(Container):
         # Paint all non-moving objects onto the screen, so they don't
         # have to be rendered every frame
         moving_mobjects = self.get_moving_mobjects(*animations)
-        self.update_frame(excluded_mobjects=moving_mobjects)
-        static_image = self.get_frame()
+        static_image = self.get_static_image(moving_mobjects)
         last_t = 0
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
@@ -923,7 +1032,40 @@ class Scene(Container):
                 animation.interpolate(alpha)
             self.update_mobjects(dt)
             self.update_frame(moving_mobjects, static_image)
-            self.add_frames(self.get_frame())
+            self.add_camera_frame()
+
+    def get_static_image(self, moving_mobjects):
+        """
+        Returns a frame showing every mobject of the Scene apart from the
+        moving ones, to be used as background for an animation.
+
+        The frame is rendered again only if it would differ from the one
+        of the previous animation, i.e. if the camera, the background or
+        any of the displayed static mobjects changed in between.
+
+        Parameters
+        ----------
+        moving_mobjects : list
+            The mobjects to leave out of the frame.
+
+        Returns
+        -------
+        np.ndarray
+            The frame, as a pixel array. It must not be modified.
+        """
+        if self.rendering_delegated:
+            # Nothing is drawn anyway
+            return self.camera.pixel_array
+        static_mobjects = self.camera.get_mobjects_to_display(
+            list_update(self.mobjects, self.foreground_mobjects),
+            excluded_mobjects=moving_mobjects,
+        )
+        key = self.camera.get_display_key(static_mobjects)
+        if self.static_image is None or key != self.static_image_key:
+            self.update_frame(static_mobjects, include_submobjects=False)
+            self.static_image = self.get_frame()
+            self.static_image_key = key
+        return self.static_image
 
     def finish_animations(self, animations):
         """
@@ -1067,7 +1209,7 @@ class Scene(Container):
                 last_t = t
                 self.update_mobjects(dt)
                 self.update_frame()
-                self.add_frames(self.get_frame())
+                self.add_camera_frame()
                 if stop_condition is not None and stop_condition():
                     time_progression.close()
                     break
@@ -1078,8 +1220,7 @@ class Scene(Container):
             self.update_frame()
             dt = 1 / self.camera.frame_rate
             n_frames = int(duration / dt)
-            frame = self.get_frame()
-            self.add_frames(*[frame] * n_frames)
+            self.hold_frame(self.camera.pixel_array, n_frames)
         return self
 
     def wait_until(self, stop_condition, max_time=60):
@@ -1142,9 +1283,59 @@ class Scene(Container):
         self.increment_time(len(frames) * dt)
         if file_writer_config["skip_animations"]:
             return
+        if self.rendering_delegated:
+            self.file_writer.count_delegated_frames(len(frames))
+            return
         for frame in frames:
             self.file_writer.write_frame(frame)
 
+    def hold_frame(self, frame, n_frames=1):
+        """
+        Adds a frame to the video_file_stream n_frames times. Unlike
+        add_frames, the frame is only rendered once by the file writer,
+        see :meth:`SceneFileWriter.hold_frame`.
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame to add, as a pixel array.
+        n_frames : int, optional
+            How many times the frame is shown.
+        """
+        dt = 1 / self.camera.frame_rate
+        self.increment_time(n_frames * dt)
+        if file_writer_config["skip_animations"]:
+            return
+        if self.rendering_delegated:
+            self.file_writer.count_delegated_frames(n_frames)
+            return
+        self.file_writer.hold_frame(frame, n_frames)
+
+    def add_camera_frame(self):
+        """
+        Adds the frame currently drawn by the camera to the video_file_stream.
+
+        Unlike add_frames(self.get_frame()), this doesn't copy the frame: the
+        camera's pixel array itself is handed over, and the camera moves on
+        to another of its pixel arrays for the next frame, waiting for one
+        to be written if none is free.
+        """
+        if self.camera.n_pixel_array_buffers <= 1:
+            # e.g. the camera was replaced, it would overwrite queued frames
+            self.add_frames(self.get_frame())
+            return
+        dt = 1 / self.camera.frame_rate
+        self.increment_time(dt)
+        if file_writer_config["skip_animations"]:
+            return
+        if self.rendering_delegated:
+            self.file_writer.count_delegated_frames(1)
+            return
+        self.file_writer.write_frame(
+            self.camera.pixel_array, self.camera.release_pixel_array
+        )
+        self.camera.swap_pixel_array()
+
     def add_sound(self, sound_file, time_offset=0, gain=None, **kwargs):
         """
         This method is used to add a sound to the animation.
@@ -1177,3 +1368,7 @@ class Scene(Container):
 
 class EndSceneEarlyException(Exception):
     pass
+
+
+class SegmentRenderError(Exception):
+    """Raised when a process rendering a segment of the scene failed."""
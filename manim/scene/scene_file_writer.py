@@ -6,9 +6,12 @@ from pydub import AudioSegment
 import shutil
 import subprocess
 import os
+import queue
+import threading
 import _thread as thread
-from time import sleep
+from time import sleep, perf_counter
 import datetime
+import hashlib
 from PIL import Image
 
 from .. import file_writer_config, logger, console
@@ -16,7 +19,7 @@ from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
 from ..utils.config_ops import digest_config
 from ..utils.file_ops import guarantee_existence
 from ..utils.file_ops import add_extension_if_not_present
-from ..utils.file_ops import modify_atime
+from ..utils.partial_movie_cache import get_partial_movie_cache
 from ..utils.sounds import get_full_sound_file_path
 
 
@@ -44,6 +47,10 @@ class SceneFileWriter(object):
         self.init_output_directories()
         self.init_audio()
         self.frame_count = 0
+        self.held_frame = None
+        self.held_frame_count = 0
+        self.partial_movie_cache = get_partial_movie_cache()
+        self.cached_partial_movie_files = set()
 
     # Output directories and files
     def init_output_directories(self):
@@ -104,6 +111,10 @@ class SceneFileWriter(object):
                         scene_name,
                     )
                 )
+            if file_writer_config["partial_movie_store"]:
+                self.partial_movie_store_directory = guarantee_existence(
+                    os.path.join(file_writer_config["video_dir"], "partial_movie_store")
+                )
 
     def get_default_module_directory(self):
         """
@@ -188,14 +199,69 @@ class SceneFileWriter(object):
         str
             The path of the next partial movie.
         """
-        result = os.path.join(
+        return self.get_partial_movie_path(
+            self.scene.play_hashes_list[self.scene.num_plays]
+        )
+
+    def get_partial_movie_path(self, hash_invocation):
+        """Returns the path of the partial movie of a play-like call.
+
+        If partial_movie_store is enabled, cached partial movies are stored
+        in a directory shared by all scenes, under a name that only depends
+        on `hash_invocation` and the render settings (see
+        :meth:`get_partial_movie_store_key`).  Otherwise, they are stored in
+        the partial movie directory of the scene.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash corresponding to an invocation to either `scene.play` or `scene.wait`.
+
+        Returns
+        -------
+        :class:`str`
+            The path of the partial movie.
+        """
+        if file_writer_config["partial_movie_store"] and not hash_invocation.startswith(
+            "uncached_"
+        ):
+            return os.path.join(
+                self.partial_movie_store_directory,
+                "{}{}".format(
+                    self.get_partial_movie_store_key(hash_invocation),
+                    file_writer_config["movie_file_extension"],
+                ),
+            )
+        return os.path.join(
             self.partial_movie_directory,
-            "{}{}".format(
-                self.scene.play_hashes_list[self.scene.num_plays],
-                file_writer_config["movie_file_extension"],
-            ),
+            "{}{}".format(hash_invocation, file_writer_config["movie_file_extension"]),
         )
-        return result
+
+    def get_partial_movie_store_key(self, hash_invocation):
+        """Returns the name of a partial movie in the partial movie store.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash corresponding to an invocation to either `scene.play` or `scene.wait`.
+
+        Returns
+        -------
+        :class:`str`
+            A digest of `hash_invocation`, the resolution, the frame rate, the
+            codec and the file extension.
+        """
+        camera = self.scene.camera
+        settings = [
+            hash_invocation,
+            camera.pixel_width,
+            camera.pixel_height,
+            camera.frame_rate,
+            file_writer_config["png_mode"],
+            file_writer_config["movie_file_extension"],
+            *self.get_codec_args(),
+        ]
+        return hashlib.blake2b(repr(settings).encode(), digest_size=16).hexdigest()
 
     def get_movie_file_path(self):
         """
@@ -313,7 +379,7 @@ class SceneFileWriter(object):
         if file_writer_config["write_to_movie"] and allow_write:
             self.close_movie_pipe()
 
-    def write_frame(self, frame):
+    def write_frame(self, frame, release=None):
         """
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
@@ -322,13 +388,82 @@ class SceneFileWriter(object):
         ----------
         frame : np.array
             Pixel array of the frame.
+        release : Callable[[np.array], None], optional
+            Called with the frame once it has been written, after which the
+            pixel array can be drawn into again.
         """
         if file_writer_config["write_to_movie"]:
-            self.writing_process.stdin.write(frame.tostring())
+            self.flush_held_frame()
+            self.queue_frame(frame, release)
+            release = None
         if file_writer_config["save_pngs"]:
-            path, extension = os.path.splitext(self.image_file_path)
-            Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
-            self.frame_count += 1
+            self.save_png(frame)
+        if release is not None:
+            release(frame)
+
+    def hold_frame(self, frame, n_frames=1):
+        """
+        Writes a frame n_frames times, for a scene that doesn't change.
+
+        The frame is only sent to FFMPEG once another frame comes in or the
+        partial movie is closed. If a whole partial movie consists of one
+        held frame, FFMPEG gets that frame only once and repeats it itself.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+        n_frames : int, optional
+            How many times the frame is shown.
+        """
+        if file_writer_config["save_pngs"]:
+            for _ in range(n_frames):
+                self.save_png(frame)
+        if not file_writer_config["write_to_movie"] or n_frames <= 0:
+            return
+        self.flush_held_frame()
+        # Keep a copy, the camera may draw over `frame` in the meantime
+        self.held_frame = np.array(frame)
+        self.held_frame_count = n_frames
+
+    def flush_held_frame(self):
+        """
+        Sends the held frame, if any, to FFMPEG as many times as it was held.
+        """
+        if self.held_frame is None:
+            return
+        frame, n_frames = self.held_frame, self.held_frame_count
+        self.held_frame = None
+        self.held_frame_count = 0
+        for _ in range(n_frames):
+            self.queue_frame(frame)
+
+    def count_delegated_frames(self, n_frames):
+        """
+        Accounts for frames written by a process rendering a segment of the
+        scene (see :meth:`.Scene.start_segment_process`), so that the pngs of
+        the following segments are numbered after them.
+
+        Parameters
+        ----------
+        n_frames : int
+            The number of frames.
+        """
+        if file_writer_config["save_pngs"]:
+            self.frame_count += n_frames
+
+    def save_png(self, frame):
+        """
+        Saves a frame as the next numbered png in the image directory.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+        """
+        path, extension = os.path.splitext(self.image_file_path)
+        Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
+        self.frame_count += 1
 
     def save_final_image(self, image):
         """
@@ -369,7 +504,7 @@ class SceneFileWriter(object):
         frame in the default image directory.
         """
         if file_writer_config["write_to_movie"]:
-            if hasattr(self, "writing_process"):
+            if getattr(self, "writing_process", None) is not None:
                 self.writing_process.terminate()
             self.combine_movie_files()
             if file_writer_config["flush_cache"]:
@@ -382,58 +517,222 @@ class SceneFileWriter(object):
 
     def open_movie_pipe(self):
         """
-        Used internally by Manim to initalise
-        FFMPEG and begin writing to FFMPEG's input
-        buffer.
+        Used internally by Manim to prepare writing the next partial movie
+        file. FFMPEG itself is only started by the first frame that is sent
+        to it, see start_movie_pipe, or when the movie is made of a single
+        held frame, see encode_held_frame.
         """
         file_path = self.get_next_partial_movie_path()
-        temp_file_path = (
-            os.path.splitext(file_path)[0]
-            + "_temp"
-            + file_writer_config["movie_file_extension"]
+        # The process id avoids clashes with other renders writing the same
+        # partial movie in the partial movie store.
+        temp_file_path = "{}_temp{}{}".format(
+            os.path.splitext(file_path)[0],
+            os.getpid(),
+            file_writer_config["movie_file_extension"],
         )
         self.partial_movie_file_path = file_path
         self.temp_partial_movie_file_path = temp_file_path
+        self.writing_process = None
+        self.held_frame = None
+        self.held_frame_count = 0
 
-        fps = self.scene.camera.frame_rate
-        height = self.scene.camera.pixel_height
-        width = self.scene.camera.pixel_width
+    def get_ffmpeg_command(self, input_args):
+        """
+        Returns the FFMPEG command encoding the given input into the
+        temporary partial movie file.
+
+        Parameters
+        ----------
+        input_args : list
+            The FFMPEG arguments describing the input.
 
+        Returns
+        -------
+        list
+            The command, as a list of arguments.
+        """
         command = [
             FFMPEG_BIN,
             "-y",  # overwrite output file if it exists
-            "-f",
-            "rawvideo",
-            "-s",
-            "%dx%d" % (width, height),  # size of one frame
-            "-pix_fmt",
-            "rgba",
-            "-r",
-            str(fps),  # frames per second
-            "-i",
-            "-",  # The imput comes from a pipe
+            *input_args,
             "-an",  # Tells FFMPEG not to expect any audio
             "-loglevel",
             file_writer_config["ffmpeg_loglevel"],
+            *self.get_codec_args(),
+            self.temp_partial_movie_file_path,
         ]
+        return command
+
+    def get_codec_args(self):
+        """
+        Returns the FFMPEG arguments selecting the codec of the partial
+        movie files.
+
+        Returns
+        -------
+        list
+            The arguments.
+        """
         # TODO, the test for a transparent background should not be based on
         # the file extension.
         if file_writer_config["movie_file_extension"] == ".mov":
             # This is if the background of the exported
             # video should be transparent.
-            command += [
+            return [
                 "-vcodec",
                 "qtrle",
             ]
-        else:
-            command += [
-                "-vcodec",
-                "libx264",
+        return [
+            "-vcodec",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+
+    def start_movie_pipe(self):
+        """
+        Used internally by Manim to initalise
+        FFMPEG and begin writing to FFMPEG's input
+        buffer.
+        """
+        fps = self.scene.camera.frame_rate
+        height = self.scene.camera.pixel_height
+        width = self.scene.camera.pixel_width
+
+        command = self.get_ffmpeg_command(
+            [
+                "-f",
+                "rawvideo",
+                "-s",
+                "%dx%d" % (width, height),  # size of one frame
                 "-pix_fmt",
-                "yuv420p",
+                "rgba",
+                "-r",
+                str(fps),  # frames per second
+                "-i",
+                "-",  # The imput comes from a pipe
             ]
-        command += [temp_file_path]
+        )
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.start_frame_writer()
+
+    def encode_held_frame(self):
+        """
+        Encodes a partial movie made of the held frame only: the frame is
+        saved once, and FFMPEG loops over it for as many frames as it was
+        held, instead of receiving every copy through the pipe.
+        """
+        still_path = os.path.splitext(self.temp_partial_movie_file_path)[0] + ".png"
+        Image.fromarray(self.held_frame).save(still_path, compress_level=1)
+        command = self.get_ffmpeg_command(
+            [
+                "-loop",
+                "1",
+                "-framerate",
+                str(self.scene.camera.frame_rate),
+                "-i",
+                still_path,
+                "-frames:v",
+                str(self.held_frame_count),
+            ]
+        )
+        try:
+            subprocess.run(command, check=True)
+        finally:
+            os.remove(still_path)
+        logger.debug(
+            f"Animation {self.scene.num_plays} : {self.held_frame_count} frames "
+            "encoded from a single held frame"
+        )
+        self.held_frame = None
+        self.held_frame_count = 0
+
+    def start_frame_writer(self):
+        """
+        Starts the thread that feeds the queued frames to FFMPEG, so that
+        encoding overlaps with the rendering of the next frames. The queue
+        is bounded by ``frame_queue_size``: when FFMPEG can't keep up,
+        write_frame blocks until a slot frees up.
+        """
+        self.frame_queue = queue.Queue(maxsize=file_writer_config["frame_queue_size"])
+        self.frame_writer_error = None
+        self.frame_queue_stats = {
+            "frames": 0,
+            "total_depth": 0,
+            "max_depth": 0,
+            "render_wait": 0.0,
+            "encode_wait": 0.0,
+        }
+        self.frame_writer_thread = threading.Thread(
+            target=self.write_queued_frames, daemon=True
+        )
+        self.frame_writer_thread.start()
+
+    def queue_frame(self, frame, release=None):
+        """
+        Hands a frame over to the frame writer thread.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+        release : Callable[[np.array], None], optional
+            Called with the frame, from the frame writer thread, once the
+            frame has been written.
+        """
+        if self.writing_process is None:
+            self.start_movie_pipe()
+        if self.frame_writer_error is not None:
+            raise self.frame_writer_error
+        stats = self.frame_queue_stats
+        depth = self.frame_queue.qsize()
+        stats["frames"] += 1
+        stats["total_depth"] += depth
+        stats["max_depth"] = max(stats["max_depth"], depth)
+        start = perf_counter()
+        self.frame_queue.put((frame, release))
+        stats["render_wait"] += perf_counter() - start
+
+    def write_queued_frames(self):
+        """
+        Body of the frame writer thread: writes queued frames to FFMPEG's
+        input until it gets None. After an error the remaining frames are
+        still consumed, so that write_frame never blocks on a full queue.
+        """
+        stats = self.frame_queue_stats
+        while True:
+            start = perf_counter()
+            item = self.frame_queue.get()
+            stats["encode_wait"] += perf_counter() - start
+            if item is None:
+                return
+            frame, release = item
+            if self.frame_writer_error is None:
+                try:
+                    # Write the frame's buffer directly, without a bytes copy
+                    self.writing_process.stdin.write(np.ascontiguousarray(frame).data)
+                except Exception as error:
+                    self.frame_writer_error = error
+            if release is not None:
+                release(frame)
+
+    def stop_frame_writer(self):
+        """
+        Waits for the frame writer thread to write every queued frame,
+        stops it, and logs how the rendering and the encoding kept up with
+        each other.
+        """
+        self.frame_queue.put(None)
+        self.frame_writer_thread.join()
+        stats = self.frame_queue_stats
+        if stats["frames"] > 0:
+            logger.debug(
+                f"Animation {self.scene.num_plays} : {stats['frames']} frames queued, "
+                f"average queue depth {stats['total_depth'] / stats['frames']:.1f} "
+                f"(max {stats['max_depth']}/{self.frame_queue.maxsize}), "
+                f"rendering waited {stats['render_wait']:.2f}s for the encoder, "
+                f"encoder waited {stats['encode_wait']:.2f}s for frames"
+            )
 
     def close_movie_pipe(self):
         """
@@ -441,8 +740,19 @@ class SceneFileWriter(object):
         input buffer, and move the temporary files into their permananant
         locations
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        if self.writing_process is None and self.held_frame is not None:
+            self.encode_held_frame()
+        else:
+            self.flush_held_frame()
+            if self.writing_process is None:
+                # No frame at all, still let FFMPEG write its (empty) file
+                self.start_movie_pipe()
+            self.stop_frame_writer()
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
+            self.writing_process = None
+            if self.frame_writer_error is not None:
+                raise self.frame_writer_error
         shutil.move(
             self.temp_partial_movie_file_path, self.partial_movie_file_path,
         )
@@ -463,11 +773,11 @@ class SceneFileWriter(object):
         :class:`bool`
             Whether the file exists.
         """
-        path = os.path.join(
-            self.partial_movie_directory,
-            "{}{}".format(hash_invocation, self.movie_file_extension),
-        )
-        return os.path.exists(path)
+        path = self.get_partial_movie_path(hash_invocation)
+        if os.path.exists(path):
+            self.cached_partial_movie_files.add(path)
+            return True
+        return False
 
     def combine_movie_files(self):
         """
@@ -483,10 +793,7 @@ class SceneFileWriter(object):
         # the scene as a whole, one of course wants to see it as a
         # single piece.
         partial_movie_files = [
-            os.path.join(
-                self.partial_movie_directory,
-                "{}{}".format(hash_play, file_writer_config["movie_file_extension"]),
-            )
+            self.get_partial_movie_path(hash_play)
             for hash_play in self.scene.play_hashes_list
         ]
         if len(partial_movie_files) == 0:
@@ -571,31 +878,32 @@ class SceneFileWriter(object):
             self.gif_file_path if self.save_as_gif else movie_file_path
         )
         if file_writer_config["write_to_movie"]:
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Record the use of the partial movie files, so that cleaning the cache removes the ones used the longest ago.
+            self.partial_movie_cache.record_use(
+                partial_movie_files, hits=self.cached_partial_movie_files
+            )
 
     def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > file_writer_config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - file_writer_config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                [partial_movie_file for partial_movie_file in cached_partial_movies],
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        """Will clean the cache by removing the partial_movie_files used by manim the longest ago.
+
+        Files are removed until the partial movie directory has at most
+        max_files_cached files, and until all the partial movie files of the
+        media directory take at most max_cache_size.  max_files_cached doesn't
+        apply to the partial movie store, which is shared by all scenes.
+        """
+        number_files_deleted, size_deleted = self.partial_movie_cache.evict(
+            max_size=file_writer_config["max_cache_size"],
+            max_files=file_writer_config["max_files_cached"],
+            directory=(
+                None
+                if file_writer_config["partial_movie_store"]
+                else self.partial_movie_directory
+            ),
+        )
+        if number_files_deleted > 0:
             logger.info(
-                f"The partial movie directory is full (> {file_writer_config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The partial movie cache is full (> {file_writer_config['max_files_cached']} files in this directory, or > {file_writer_config['max_cache_size'] / 2 ** 20:.0f} MB in total). Therefore, manim has removed {number_files_deleted} file(s) ({size_deleted / 2 ** 20:.1f} MB) used by it the longest ago."
+                + "You can change this behaviour by changing max_files_cached and max_cache_size in config."
             )
 
     def flush_cache_directory(self):
@@ -605,8 +913,19 @@ class SceneFileWriter(object):
             for file_name in os.listdir(self.partial_movie_directory)
             if file_name != "partial_movie_file_list.txt"
         ]
+        if file_writer_config["partial_movie_store"]:
+            # Only remove the partial movies of this scene from the store.
+            cached_partial_movies += [
+                path
+                for path in map(
+                    self.get_partial_movie_path, self.scene.play_hashes_list
+                )
+                if path.startswith(self.partial_movie_store_directory)
+                and os.path.exists(path)
+            ]
         for f in cached_partial_movies:
             os.remove(f)
+        self.partial_movie_cache.forget(cached_partial_movies)
         logger.info(
             f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in {self.partial_movie_directory}."
         )
@@ -1,101 +1,242 @@
-import json
-import zlib
+"""Utilities for computing the hashes used to cache partial movie files."""
+
+
+__all__ = [
+    "StructuralHasher",
+    "get_hash",
+    "get_camera_dict_for_hashing",
+    "get_hash_from_play_call",
+    "get_hash_from_wait_call",
+]
+
+
+import hashlib
 import inspect
 import copy
-import dis
 import numpy as np
-from types import ModuleType
+from types import CodeType, FunctionType, MethodType, ModuleType
+from weakref import WeakKeyDictionary, ref
 
-from .. import logger
+from ..mobject.mobject import Mobject, is_state_attribute
 
 
-class CustomEncoder(json.JSONEncoder):
-    def default(self, obj):
-        """
-        This method is used to serialize objects to JSON format.
+class StructuralHasher(object):
+    """Streams a binary description of arbitrary objects into a blake2b hash.
 
-        If obj is a function, then it will return a dict with two keys : 'code', for the code source, and 'nonlocals' for all nonlocalsvalues. (including nonlocals functions, that will be serialized as this is recursive.)
-        if obj is a np.darray, it converts it into a list.
-        if obj is an object with __dict__ attribute, it returns its __dict__.
-        Else, will let the JSONEncoder do the stuff, and throw an error if the type is not suitable for JSONEncoder.
+    This replaces serializing objects to JSON and hashing the resulting
+    string: numpy arrays are hashed from their raw buffers (along with their
+    dtype and shape), and nothing is converted to text.  The rules mirror
+    the ones of the JSON encoding:
 
-        Parameters
-        ----------
-        obj : Any
-            Arbitrary object to convert
+    - functions are described by their bytecode and constants, and by the
+      values of the global and nonlocal variables they use (modules left
+      out),
+    - objects with a ``__dict__`` are described by their type and their
+      ``__dict__``,
+    - objects that can't be described are replaced by the name of their type.
 
-        Returns
-        -------
-        Any
-            Python object that JSON encoder will recognize
+    Objects met several times (including reference cycles) are only
+    described once, and then referred to by their position.
 
-        """
-        if inspect.isfunction(obj) and not isinstance(obj, ModuleType):
-            cvars = inspect.getclosurevars(obj)
-            cvardict = {**copy.copy(cvars.globals), **copy.copy(cvars.nonlocals)}
-            for i in list(cvardict):
-                # NOTE : All module types objects are removed, because otherwise it throws ValueError: Circular reference detected if not. TODO
-                if isinstance(cvardict[i], ModuleType):
-                    del cvardict[i]
-            return {"code": inspect.getsource(obj), "nonlocals": cvardict}
-        elif isinstance(obj, np.ndarray):
-            return list(obj)
-        elif hasattr(obj, "__dict__"):
-            temp = getattr(obj, "__dict__")
-            return self._encode_dict(temp)
-        elif isinstance(obj, np.uint8):
-            return int(obj)
-        try:
-            return json.JSONEncoder.default(self, obj)
-        except TypeError:
-            # This is used when the user enters an unknown type in CONFIG. Rather than throwing an error, we transform
-            # it into a string "Unsupported type for hashing" so that it won't affect the hash.
-            return "Unsupported type for hashing"
+    The state of a mobject (its attributes, except its submobjects and its
+    updaters) is hashed on its own and memoized until the mobject's
+    :attr:`~.Mobject.version` changes, so unchanged mobjects are not hashed
+    again.  Their submobjects, updaters and the mobjects their state refers
+    to are always added to the hash, which keeps the hash of a family correct
+    when only some of its members change.
+
+    Parameters
+    ----------
+    digest_size : :class:`int`, optional
+        The size of the digest, in bytes.
+    deferred_mobjects : :class:`list`, optional
+        If given, mobjects are not hashed but appended to this list, and only
+        their position in it is added to the hash.
+    """
+
+    # Mobject -> (version, digest of its state, references to the mobjects
+    # the state refers to)
+    mobject_states = WeakKeyDictionary()
 
-    def _encode_dict(self, obj):
-        """Clean dicts to be serialized : As dict keys must be of the type (str, int, float, bool), we have to change them when they are not of the right type.
-        To do that, if one is not of the good type we turn it into its hash using the same
-        method as all the objects here.
+    def __init__(self, digest_size=8, deferred_mobjects=None):
+        self.hasher = hashlib.blake2b(digest_size=digest_size)
+        # id -> (position, object). The object is kept alive so that its id
+        # can't be reused by another object while hashing.
+        self.memo = {}
+        self.deferred_mobjects = deferred_mobjects
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+    def write(self, tag, data=b""):
+        self.hasher.update(tag)
+        self.hasher.update(len(data).to_bytes(8, "little"))
+        self.hasher.update(data)
+
+    def update(self, obj):
+        """Adds `obj` to the hash.
 
         Parameters
         ----------
         obj : Any
-            The obj to be cleaned.
+            The object to hash.
+        """
+        if obj is None or isinstance(obj, (bool, int, float, complex)):
+            self.write(b"s", f"{type(obj).__name__}:{obj!r}".encode())
+        elif isinstance(obj, str):
+            self.write(b"u", obj.encode("utf-8", "surrogatepass"))
+        elif isinstance(obj, bytes):
+            self.write(b"b", obj)
+        elif isinstance(obj, np.generic):
+            self.write(b"g", obj.dtype.str.encode() + obj.tobytes())
+        elif id(obj) in self.memo:
+            self.write(b"r", str(self.memo[id(obj)][0]).encode())
+        else:
+            self.memo[id(obj)] = (len(self.memo), obj)
+            if isinstance(obj, Mobject):
+                self.update_mobject(obj)
+            else:
+                self.update_container_or_object(obj)
+
+    def update_mobject(self, mobject):
+        if self.deferred_mobjects is not None:
+            self.write(b"M", str(len(self.deferred_mobjects)).encode())
+            self.deferred_mobjects.append(mobject)
+            return
+        digest, referred_mobjects = self.get_mobject_state(mobject)
+        self.write(b"M", digest)
+        for referred_mobject in referred_mobjects:
+            self.update(referred_mobject)
+        self.update(mobject.updaters)
+        self.update(mobject.submobjects)
+
+    def get_mobject_state(self, mobject):
+        """Returns the digest of the state of `mobject`, and the mobjects this
+        state refers to.
+
+        Parameters
+        ----------
+        mobject : :class:`~.Mobject`
+            The mobject.
 
         Returns
         -------
-        Any
-            The object cleaned following the processus above.
+        Tuple[:class:`bytes`, List[:class:`~.Mobject`]]
+            The digest and the mobjects.
         """
-
-        def key_to_hash(key):
-            if not isinstance(key, (str, int, float, bool)) and key is not None:
-                # print('called')
-                return zlib.crc32(json.dumps(key, cls=CustomEncoder).encode())
-            return key
-
-        if isinstance(obj, dict):
-            return {key_to_hash(k): self._encode_dict(v) for k, v in obj.items()}
-        return obj
-
-    def encode(self, obj):
-        return super().encode(self._encode_dict(obj))
+        state = self.mobject_states.get(mobject)
+        if state is not None and state[0] == mobject.version:
+            referred_mobjects = [reference() for reference in state[2]]
+            if None not in referred_mobjects:
+                return state[1], referred_mobjects
+        version = mobject.version
+        referred_mobjects = []
+        hasher = StructuralHasher(deferred_mobjects=referred_mobjects)
+        hasher.memo[id(mobject)] = (0, mobject)
+        hasher.write(
+            b"o", f"{type(mobject).__module__}.{type(mobject).__qualname__}".encode()
+        )
+        hasher.update(
+            {
+                key: value
+                for key, value in mobject.__dict__.items()
+                if key not in ("submobjects", "updaters") and is_state_attribute(key)
+            }
+        )
+        digest = hasher.hasher.digest()
+        self.mobject_states[mobject] = (
+            version,
+            digest,
+            [ref(referred_mobject) for referred_mobject in referred_mobjects],
+        )
+        return digest, referred_mobjects
+
+    def update_container_or_object(self, obj):
+        if isinstance(obj, np.ndarray):
+            self.write(b"a", f"{obj.dtype.str}{obj.shape}".encode())
+            if obj.dtype == object:
+                for item in obj.flat:
+                    self.update(item)
+            else:
+                self.hasher.update(np.ascontiguousarray(obj).data)
+        elif isinstance(obj, (list, tuple)):
+            self.write(b"l" if isinstance(obj, list) else b"t", str(len(obj)).encode())
+            for item in obj:
+                self.update(item)
+        elif isinstance(obj, dict):
+            self.write(b"d", str(len(obj)).encode())
+            for key, value in obj.items():
+                self.update(key)
+                self.update(value)
+        elif isinstance(obj, (set, frozenset)):
+            # Sets have no order: hash each item on its own, and sort these.
+            self.write(b"e", str(len(obj)).encode())
+            for digest in sorted(get_hash(item) for item in obj):
+                self.write(b"h", digest.encode())
+        elif isinstance(obj, FunctionType):
+            self.update_function(obj)
+        elif isinstance(obj, MethodType):
+            # A bound method is described by its function and the class of
+            # the object it is bound to, except for mobjects, which are part
+            # of the scene.  Hashing any other object (e.g. the camera, whose
+            # display_funcs are bound methods) would pull in all its state.
+            self.write(b"m", obj.__qualname__.encode())
+            self.update(obj.__func__)
+            if isinstance(obj.__self__, Mobject):
+                self.update(obj.__self__)
+            else:
+                self.update(type(obj.__self__))
+        elif isinstance(obj, CodeType):
+            self.write(b"c", obj.co_code)
+            self.update(obj.co_consts)
+            self.update(obj.co_names)
+        elif isinstance(obj, (type, ModuleType)) or not hasattr(obj, "__dict__"):
+            # Classes, modules, builtins and the like are identified by name.
+            name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+            self.write(
+                b"n",
+                f"{type(obj).__module__}.{type(obj).__qualname__}:{name}".encode(),
+            )
+        else:
+            self.write(
+                b"o", f"{type(obj).__module__}.{type(obj).__qualname__}".encode()
+            )
+            self.update(obj.__dict__)
+
+    def update_function(self, function):
+        self.write(b"f", function.__qualname__.encode())
+        self.update(function.__code__)
+        self.update(function.__defaults__)
+        try:
+            cvars = inspect.getclosurevars(function)
+        except (TypeError, ValueError):
+            return
+        cvardict = {**cvars.globals, **cvars.nonlocals}
+        self.update(
+            {
+                name: value
+                for name, value in cvardict.items()
+                if not isinstance(value, ModuleType)
+            }
+        )
 
 
-def get_json(obj):
-    """Recursively serialize `object` to JSON using the :class:`CustomEncoder` class.
+def get_hash(obj):
+    """Returns the hex digest of `obj`, as computed by :class:`StructuralHasher`.
 
-    Paramaters
+    Parameters
     ----------
-    dict_config : :class:`dict`
-        The dict to flatten
+    obj : Any
+        The object to hash.
 
     Returns
     -------
     :class:`str`
-        The flattened object
+        The hash.
     """
-    return json.dumps(obj, cls=CustomEncoder)
+    hasher = StructuralHasher()
+    hasher.update(obj)
+    return hasher.hexdigest()
 
 
 def get_camera_dict_for_hashing(camera_object):
@@ -115,7 +256,21 @@ def get_camera_dict_for_hashing(camera_object):
     # We have to clean a little bit of camera_dict, as pixel_array and background are two very big numpy arrays.
     # They are not essential to caching process.
     # We also have to remove pixel_array_to_cairo_context as it contains used memory adress (set randomly). See l.516 get_cached_cairo_context in camera.py
-    for to_clean in ["background", "pixel_array", "pixel_array_to_cairo_context"]:
+    # The pixel array buffers and dirty rectangles are rendering state, not configuration.
+    # The raster threads don't change the frames, only how fast they are drawn.
+    # The display functions are bound methods of the camera itself.
+    for to_clean in [
+        "background",
+        "background_version",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "pixel_array_buffers",
+        "free_pixel_arrays",
+        "dirty_rectangles",
+        "raster_threads",
+        "raster_executor",
+        "display_funcs",
+    ]:
         camera_object_dict.pop(to_clean, None)
     return camera_object_dict
 
@@ -139,17 +294,11 @@ def get_hash_from_play_call(camera_object, animations_list, current_mobjects_lis
     :class:`str`
         A string concatenation of the respective hashes of `camera_object`, `animations_list` and `current_mobjects_list`, separated by `_`.
     """
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    animations_list_json = [
-        get_json(x) for x in sorted(animations_list, key=lambda obj: str(obj))
-    ]
-    current_mobjects_list_json = [
-        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
-    ]
-    hash_camera, hash_animations, hash_current_mobjects = [
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    ]
+    hash_camera = get_hash(get_camera_dict_for_hashing(camera_object))
+    hash_animations = get_hash(sorted(animations_list, key=lambda obj: str(obj)))
+    hash_current_mobjects = get_hash(
+        sorted(current_mobjects_list, key=lambda obj: str(obj))
+    )
     return "{}_{}_{}".format(hash_camera, hash_animations, hash_current_mobjects)
 
 
@@ -171,14 +320,12 @@ def get_hash_from_wait_call(
     :class:`str`
         A concatenation of the respective hashes of `animations_list and `current_mobjects_list`, separated by `_`.
     """
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    current_mobjects_list_json = [
-        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
-    ]
-    hash_current_mobjects = zlib.crc32(repr(current_mobjects_list_json).encode())
-    hash_camera = zlib.crc32(repr(camera_json).encode())
+    hash_current_mobjects = get_hash(
+        sorted(current_mobjects_list, key=lambda obj: str(obj))
+    )
+    hash_camera = get_hash(get_camera_dict_for_hashing(camera_object))
     if stop_condition_function is not None:
-        hash_function = zlib.crc32(get_json(stop_condition_function).encode())
+        hash_function = get_hash(stop_condition_function)
         return "{}_{}{}_{}".format(
             hash_camera,
             str(wait_time).replace(".", "-"),
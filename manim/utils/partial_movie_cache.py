@@ -0,0 +1,219 @@
+"""Index of the cached partial movie files, used to evict them by size."""
+
+
+__all__ = ["PartialMovieCache", "get_partial_movie_cache"]
+
+
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from .. import file_writer_config
+
+
+class PartialMovieCache(object):
+    """An sqlite index of the partial movie files of a media directory.
+
+    For each partial movie file, the index records its size, when it was last
+    used in a rendered scene, and how many times it was reused instead of
+    being rendered again.  This lets the cache be kept under a byte budget,
+    removing the files used the longest ago first, without listing the cache
+    directories nor relying on access times.
+
+    Partial movie files written by versions of manim without an index are not
+    known until :meth:`synchronize` is called (e.g. by ``manim cache prune``).
+
+    Parameters
+    ----------
+    index_path : :class:`str`
+        The path of the sqlite database.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+
+    def connect(self):
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS partial_movies ("
+            "path TEXT PRIMARY KEY, "
+            "directory TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "last_used REAL NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        return connection
+
+    def record_use(self, file_paths, hits=()):
+        """Records that partial movie files were used to render a scene.
+
+        Parameters
+        ----------
+        file_paths : Iterable[:class:`str`]
+            The paths of the partial movie files.
+        hits : Iterable[:class:`str`], optional
+            The paths, among `file_paths`, of the files that were already
+            cached.
+        """
+        hits = {os.path.abspath(path) for path in hits}
+        now = time.time()
+        rows = []
+        for path in file_paths:
+            path = os.path.abspath(path)
+            if os.path.exists(path):
+                rows.append(
+                    (
+                        os.path.dirname(path),
+                        os.path.getsize(path),
+                        now,
+                        int(path in hits),
+                        path,
+                    )
+                )
+        with closing(self.connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO partial_movies "
+                "(directory, size, last_used, hits, path) VALUES (?, ?, ?, 0, ?)",
+                [row[:3] + row[4:] for row in rows],
+            )
+            connection.executemany(
+                "UPDATE partial_movies SET directory = ?, size = ?, last_used = ?, "
+                "hits = hits + ? WHERE path = ?",
+                rows,
+            )
+
+    def forget(self, file_paths):
+        """Removes partial movie files from the index.
+
+        Parameters
+        ----------
+        file_paths : Iterable[:class:`str`]
+            The paths of the files, which have been deleted.
+        """
+        with closing(self.connect()) as connection, connection:
+            connection.executemany(
+                "DELETE FROM partial_movies WHERE path = ?",
+                [(os.path.abspath(path),) for path in file_paths],
+            )
+
+    def synchronize(self, root):
+        """Makes the index match the partial movie files found under `root`.
+
+        Files missing from the index are added, using their modification time
+        as their last use, and the entries of deleted files are removed.
+
+        Parameters
+        ----------
+        root : :class:`str`
+            The directory to search for ``partial_movie_files`` and
+            ``partial_movie_store`` directories.
+        """
+        found = {}
+        for directory, _, file_names in os.walk(os.path.abspath(root)):
+            parts = directory.split(os.sep)
+            if (
+                "partial_movie_files" not in parts
+                and "partial_movie_store" not in parts
+            ):
+                continue
+            for file_name in file_names:
+                if file_name == "partial_movie_file_list.txt":
+                    continue
+                path = os.path.join(directory, file_name)
+                found[path] = (directory, os.path.getsize(path), os.path.getmtime(path))
+        with closing(self.connect()) as connection, connection:
+            indexed = {
+                path
+                for (path,) in connection.execute("SELECT path FROM partial_movies")
+            }
+            connection.executemany(
+                "DELETE FROM partial_movies WHERE path = ?",
+                [(path,) for path in indexed if not os.path.exists(path)],
+            )
+            connection.executemany(
+                "INSERT INTO partial_movies (path, directory, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [(path, *found[path]) for path in found.keys() - indexed],
+            )
+
+    def get_stats(self):
+        """Returns the number of files, their size and their hits by directory.
+
+        Returns
+        -------
+        List[Tuple[:class:`str`, :class:`int`, :class:`int`, :class:`int`]]
+            One (directory, number of files, size in bytes, hits) tuple per
+            directory, the largest directories first.
+        """
+        with closing(self.connect()) as connection:
+            return connection.execute(
+                "SELECT directory, COUNT(*), SUM(size), SUM(hits) "
+                "FROM partial_movies GROUP BY directory ORDER BY SUM(size) DESC"
+            ).fetchall()
+
+    def evict(self, max_size=float("inf"), max_files=float("inf"), directory=None):
+        """Removes the partial movie files used the longest ago, until their
+        total size is at most `max_size`, and until `directory` has at most
+        `max_files` files.
+
+        Parameters
+        ----------
+        max_size : :class:`float`, optional
+            The maximum total size of the indexed files, in bytes.
+        max_files : :class:`float`, optional
+            The maximum number of files in `directory`.
+        directory : :class:`str`, optional
+            The directory to which `max_files` applies.
+
+        Returns
+        -------
+        Tuple[:class:`int`, :class:`int`]
+            The number of files removed and their total size.
+        """
+        to_remove = []
+        with closing(self.connect()) as connection:
+            if directory is not None and max_files != float("inf"):
+                rows = connection.execute(
+                    "SELECT path, size FROM partial_movies WHERE directory = ? "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?",
+                    (os.path.abspath(directory), int(max_files)),
+                ).fetchall()
+                to_remove.extend(rows)
+            if max_size != float("inf"):
+                removed_paths = {path for path, _ in to_remove}
+                (total_size,) = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM partial_movies"
+                ).fetchone()
+                total_size -= sum(size for _, size in to_remove)
+                rows = connection.execute(
+                    "SELECT path, size FROM partial_movies ORDER BY last_used"
+                )
+                for path, size in rows:
+                    if total_size <= max_size:
+                        break
+                    if path not in removed_paths:
+                        to_remove.append((path, size))
+                        total_size -= size
+            for path, _ in to_remove:
+                if os.path.exists(path):
+                    os.remove(path)
+            with connection:
+                connection.executemany(
+                    "DELETE FROM partial_movies WHERE path = ?",
+                    [(path,) for path, _ in to_remove],
+                )
+        return len(to_remove), sum(size for _, size in to_remove)
+
+
+def get_partial_movie_cache():
+    """Returns the index of the partial movie files of the media directory.
+
+    Returns
+    -------
+    :class:`PartialMovieCache`
+        The index.
+    """
+    return PartialMovieCache(
+        os.path.join(file_writer_config["media_dir"], "partial_movie_cache.db")
+    )
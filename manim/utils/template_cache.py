@@ -0,0 +1,140 @@
+"""In-memory cache of constructed mobjects, copied to build identical ones."""
+
+
+__all__ = ["TemplateCache", "template_cache"]
+
+
+import copy
+from collections import OrderedDict
+
+import numpy as np
+
+from .. import config
+from .hashing import get_hash
+
+
+# Rough size of a mobject without its arrays, in bytes.
+MOBJECT_OVERHEAD = 2048
+
+
+class TemplateCache(object):
+    """A least recently used cache of fully constructed mobjects.
+
+    Building a :class:`~.SingleStringMathTex` or a :class:`~.Text` checks for
+    its svg file, parses it and builds its points, even when an identical
+    mobject was built a moment before.  Instead, the constructor of these
+    classes looks for a template of the mobject in this cache, and if there is
+    one, gives the new mobject a deep copy of its attributes.
+
+    Templates are identified by the class of the mobject, its attributes as
+    set by :func:`~.digest_config` before it is built (which include its
+    string and all its ``CONFIG`` values) and any other value the result
+    depends on, such as the tex template.  The least recently used templates
+    are removed once their total size exceeds ``config["max_template_cache_size"]``
+    bytes.
+    """
+
+    def __init__(self):
+        self.templates = OrderedDict()
+        self.sizes = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, mobject, *args):
+        """Returns the key of the template of a mobject about to be built.
+
+        Parameters
+        ----------
+        mobject : :class:`~.Mobject`
+            The mobject, whose attributes have been set by
+            :func:`~.digest_config`.
+        args
+            Other values the constructed mobject depends on.
+
+        Returns
+        -------
+        Optional[Tuple[:class:`type`, :class:`str`]]
+            The key, or ``None`` if the cache is disabled.
+        """
+        if config.get("max_template_cache_size", 0) <= 0:
+            return None
+        state = {
+            key: value for key, value in mobject.__dict__.items() if key != "version"
+        }
+        return type(mobject), get_hash((args, state))
+
+    def __contains__(self, key):
+        """Whether there is a template for `key`, returned by :meth:`get_key`."""
+        return key is not None and key in self.templates
+
+    def restore(self, mobject, key):
+        """Gives `mobject` the attributes of a copy of its template, if cached.
+
+        Parameters
+        ----------
+        mobject : :class:`~.Mobject`
+            The mobject.
+        key : Optional[Tuple[:class:`type`, :class:`str`]]
+            The key returned by :meth:`get_key`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the template was found.
+        """
+        if key is None:
+            return False
+        template = self.templates.get(key)
+        if template is None:
+            self.misses += 1
+            return False
+        self.templates.move_to_end(key)
+        self.hits += 1
+        mobject.__dict__.update(copy.deepcopy(template).__dict__)
+        return True
+
+    def store(self, mobject, key):
+        """Saves a copy of a newly built mobject as the template for `key`.
+
+        Parameters
+        ----------
+        mobject : :class:`~.Mobject`
+            The mobject.
+        key : Optional[Tuple[:class:`type`, :class:`str`]]
+            The key returned by :meth:`get_key`.
+        """
+        if key is None or key in self.templates:
+            return
+        max_size = config["max_template_cache_size"]
+        size = self.get_size(mobject)
+        if size > max_size:
+            return
+        self.templates[key] = copy.deepcopy(mobject)
+        self.sizes[key] = size
+        self.size += size
+        while self.size > max_size:
+            old_key, _ = self.templates.popitem(last=False)
+            self.size -= self.sizes.pop(old_key)
+
+    def clear(self):
+        """Removes all the templates."""
+        self.templates.clear()
+        self.sizes.clear()
+        self.size = 0
+
+    @staticmethod
+    def get_size(mobject):
+        """Estimates the memory used by a mobject and its family, in bytes."""
+        return sum(
+            MOBJECT_OVERHEAD
+            + sum(
+                value.nbytes
+                for value in submob.__dict__.values()
+                if isinstance(value, np.ndarray)
+            )
+            for submob in mobject.get_family()
+        )
+
+
+template_cache = TemplateCache()
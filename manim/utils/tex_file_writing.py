@@ -1,8 +1,13 @@
 import os
+import copy
 import hashlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 from .. import file_writer_config, config, logger
+from .tex import TexTemplate
 
 
 def tex_hash(expression):
@@ -13,24 +18,253 @@ def tex_hash(expression):
     return hasher.hexdigest()[:16]
 
 
+# The svg files being compiled in the background by prefetch_tex, and the
+# futures of their compilation.
+prefetched_svg_files = {}
+prefetch_pool = None
+# The number of worker threads of prefetch_pool
+prefetch_workers = 0
+
+
 def tex_to_svg_file(expression, source_type):
     tex_template = config["tex_template"]
+    svg_file = get_svg_file_path(expression, tex_template, source_type)
+    future = prefetched_svg_files.pop(svg_file, None)
+    if future is not None:
+        # Errors are reported by compiling the expression again below.
+        wait([future])
+    if os.path.exists(svg_file):
+        return svg_file
+    return compile_tex_to_svg(expression, tex_template, source_type)
+
+
+def compile_tex_to_svg(expression, tex_template, source_type):
     tex_file = generate_tex_file(expression, tex_template, source_type)
     dvi_file = tex_to_dvi(tex_file, tex_template.use_ctex)
     return dvi_to_svg(dvi_file, use_ctex=tex_template.use_ctex)
 
 
-def generate_tex_file(expression, tex_template, source_type):
+def prefetch_tex(expressions, source_type):
+    """Starts compiling expressions in the background.
+
+    The uncached expressions are split among as many workers as there are
+    CPUs, each typesetting its share with a single LaTeX run when possible
+    (see :func:`tex_to_svg_files`).  :func:`tex_to_svg_file` then waits for
+    the compilation of an expression instead of starting its own.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        The expressions.
+    source_type : :class:`str`
+        Either "tex" or "text".
+
+    Returns
+    -------
+    List[:class:`concurrent.futures.Future`]
+        The futures of the compilations that were started.
+    """
+    global prefetch_pool, prefetch_workers
+    tex_template = config["tex_template"]
+    pending = {}
+    for expression in expressions:
+        svg_file = get_svg_file_path(expression, tex_template, source_type)
+        if not os.path.exists(svg_file) and svg_file not in prefetched_svg_files:
+            pending.setdefault(svg_file, expression)
+    if not pending:
+        return []
+    if prefetch_pool is None:
+        prefetch_workers = os.cpu_count() or 1
+        prefetch_pool = ThreadPoolExecutor(max_workers=prefetch_workers)
+    items = list(pending.items())
+    if source_type == "tex" and get_batch_template(tex_template) is not None:
+        chunk_size = -(-len(items) // prefetch_workers)
+    else:
+        chunk_size = 1
+    futures = []
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start : start + chunk_size]
+        future = prefetch_pool.submit(
+            compile_tex_chunk, chunk, tex_template, source_type
+        )
+        for svg_file, _ in chunk:
+            prefetched_svg_files[svg_file] = future
+        futures.append(future)
+    return futures
+
+
+def shutdown_prefetch_pool():
+    """Waits for the background compilations, and stops the worker threads.
+
+    The next call to :func:`prefetch_tex` starts new ones.
+    """
+    global prefetch_pool
+    if prefetch_pool is not None:
+        prefetch_pool.shutdown(wait=True)
+        prefetch_pool = None
+
+
+def compile_tex_chunk(chunk, tex_template, source_type):
+    batch_template = get_batch_template(tex_template)
+    if len(chunk) > 1 and source_type == "tex" and batch_template is not None:
+        try:
+            batch_to_svg_files(
+                [expression for _, expression in chunk],
+                [svg_file for svg_file, _ in chunk],
+                batch_template,
+            )
+            return
+        except Exception as error:
+            logger.debug(f"Batch LaTeX compilation failed: {error}")
+    for svg_file, expression in chunk:
+        if not os.path.exists(svg_file):
+            compile_tex_to_svg(expression, tex_template, source_type)
+
+
+def tex_to_svg_files(expressions, source_type):
+    """Compiles several expressions, typesetting the ones that aren't cached
+    yet as the pages of a single document.
+
+    This takes one LaTeX run and one dvisvgm run, instead of one of each per
+    expression.  The pages are then saved where :func:`tex_to_svg_file` would
+    have saved the svg file of each expression.  Only math mode expressions
+    typeset with a :class:`~.TexTemplate` using the default document class are
+    compiled together; the others are compiled one by one.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        The expressions.
+    source_type : :class:`str`
+        Either "tex" or "text".
+
+    Returns
+    -------
+    List[:class:`str`]
+        The paths of the svg files of the expressions.
+    """
+    tex_template = config["tex_template"]
+    pending = {}
+    for expression in expressions:
+        svg_file = get_svg_file_path(expression, tex_template, source_type)
+        if not os.path.exists(svg_file) and svg_file not in prefetched_svg_files:
+            pending.setdefault(svg_file, expression)
+    batch_template = get_batch_template(tex_template)
+    if len(pending) > 1 and source_type == "tex" and batch_template is not None:
+        try:
+            batch_to_svg_files(list(pending.values()), list(pending), batch_template)
+        except Exception as error:
+            # Compiling the expressions one by one reports which one fails.
+            logger.debug(f"Batch LaTeX compilation failed: {error}")
+    return [tex_to_svg_file(expression, source_type) for expression in expressions]
+
+
+def get_text_for_source_type(expression, tex_template, source_type):
     if source_type == "text":
-        output = tex_template.get_text_for_text_mode(expression)
+        return tex_template.get_text_for_text_mode(expression)
     elif source_type == "tex":
-        output = tex_template.get_text_for_tex_mode(expression)
+        return tex_template.get_text_for_tex_mode(expression)
 
+
+def get_svg_file_path(expression, tex_template, source_type):
+    output = get_text_for_source_type(expression, tex_template, source_type)
+    return os.path.join(file_writer_config["tex_dir"], tex_hash(output)) + ".svg"
+
+
+def get_batch_template(tex_template):
+    """Returns a copy of `tex_template` typesetting each page on its own page.
+
+    The default document class, standalone with the preview option, puts the
+    whole document on a single page.  As dvisvgm crops each page to its
+    content anyway, the batch template uses the article class (which
+    standalone is based on) without page numbers instead.
+
+    Parameters
+    ----------
+    tex_template : :class:`~.TexTemplateFromFile`
+        The template.
+
+    Returns
+    -------
+    Optional[:class:`~.TexTemplate`]
+        The batch template, or None if `tex_template` can't be adapted.
+    """
+    if not isinstance(tex_template, TexTemplate) or tex_template.documentclass != [
+        "standalone",
+        ["preview"],
+    ]:
+        return None
+    batch_template = copy.deepcopy(tex_template)
+    batch_template.documentclass = ["article", []]
+    batch_template.common_preamble_text += "\\pagestyle{empty}\n"
+    batch_template.rebuild_cache()
+    return batch_template
+
+
+def batch_to_svg_files(expressions, svg_files, batch_template):
+    """Typesets math mode expressions as the pages of a single document, and
+    saves each page as the svg file of the corresponding expression.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        The expressions.
+    svg_files : List[:class:`str`]
+        Where to save the svg file of each expression.
+    batch_template : :class:`~.TexTemplate`
+        The template, as returned by :func:`get_batch_template`.
+    """
+    pages = "\n\\clearpage\n".join(
+        "\\begin{align*}\n" + expression + "\n\\end{align*}"
+        for expression in expressions
+    )
+    output = batch_template.get_text_for_text_mode(pages)
+    tex_file = (
+        os.path.join(file_writer_config["tex_dir"], "batch_" + tex_hash(output))
+        + ".tex"
+    )
+    logger.info(f"Writing {len(expressions)} expressions to {tex_file}")
+    write_file_atomically(tex_file, output)
+    dvi_file = tex_to_dvi(tex_file, batch_template.use_ctex)
+    page_directory = tempfile.mkdtemp(dir=file_writer_config["tex_dir"])
+    try:
+        page_files = dvi_to_svg_pages(dvi_file, page_directory)
+        if len(page_files) != len(expressions):
+            raise Exception(
+                f"Expected {len(expressions)} pages in {dvi_file}, found {len(page_files)}"
+            )
+        for page_file, svg_file in zip(page_files, svg_files):
+            os.replace(page_file, svg_file)
+    finally:
+        shutil.rmtree(page_directory, ignore_errors=True)
+
+
+def write_file_atomically(file_path, text):
+    """Writes `text` to `file_path` through a temporary file, so that other
+    processes sharing the tex directory never read a partially written file.
+
+    Parameters
+    ----------
+    file_path : :class:`str`
+        The path of the file.
+    text : :class:`str`
+        The content of the file.
+    """
+    directory, file_name = os.path.split(file_path)
+    file_descriptor, temp_file_path = tempfile.mkstemp(
+        prefix=file_name, suffix=".tmp", dir=directory
+    )
+    with os.fdopen(file_descriptor, "w", encoding="utf-8") as outfile:
+        outfile.write(text)
+    os.replace(temp_file_path, file_path)
+
+
+def generate_tex_file(expression, tex_template, source_type):
+    output = get_text_for_source_type(expression, tex_template, source_type)
     result = os.path.join(file_writer_config["tex_dir"], tex_hash(output)) + ".tex"
     if not os.path.exists(result):
         logger.info('Writing "%s" to %s' % ("".join(expression), result))
-        with open(result, "w", encoding="utf-8") as outfile:
-            outfile.write(output)
+        write_file_atomically(result, output)
     return result
 
 
@@ -40,12 +274,15 @@ def tex_to_dvi(tex_file, use_ctex=False):
     tex_file = Path(tex_file).as_posix()
     tex_dir = Path(file_writer_config["tex_dir"]).as_posix()
     if not os.path.exists(result):
+        # LaTeX writes into a directory of its own, as concurrent renders
+        # sharing the tex directory may compile the same file.
+        output_dir = Path(tempfile.mkdtemp(dir=tex_dir)).as_posix()
         commands = (
             [
                 "latex",
                 "-interaction=batchmode",
                 "-halt-on-error",
-                '-output-directory="{}"'.format(tex_dir),
+                '-output-directory="{}"'.format(output_dir),
                 '"{}"'.format(tex_file),
                 ">",
                 os.devnull,
@@ -56,23 +293,30 @@ def tex_to_dvi(tex_file, use_ctex=False):
                 "-no-pdf",
                 "-interaction=batchmode",
                 "-halt-on-error",
-                '-output-directory="{}"'.format(tex_dir),
+                '-output-directory="{}"'.format(output_dir),
                 '"{}"'.format(tex_file),
                 ">",
                 os.devnull,
             ]
         )
-        exit_code = os.system(" ".join(commands))
-        if exit_code != 0:
+        try:
+            exit_code = os.system(" ".join(commands))
             log_file = tex_file.replace(".tex", ".log")
-            raise Exception(
-                (
-                    "LaTeX error converting to dvi. "
-                    if not use_ctex
-                    else "XeLaTeX error converting to xdv. "
+            output_log_file = os.path.join(output_dir, os.path.basename(log_file))
+            if os.path.exists(output_log_file):
+                os.replace(output_log_file, log_file)
+            if exit_code != 0:
+                raise Exception(
+                    (
+                        "LaTeX error converting to dvi. "
+                        if not use_ctex
+                        else "XeLaTeX error converting to xdv. "
+                    )
+                    + f"See log output above or the log file: {log_file}"
                 )
-                + f"See log output above or the log file: {log_file}"
-            )
+            os.replace(os.path.join(output_dir, os.path.basename(result)), result)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
     return result
 
 
@@ -87,6 +331,8 @@ def dvi_to_svg(dvi_file, use_ctex=False, regen_if_exists=False):
     result = Path(result).as_posix()
     dvi_file = Path(dvi_file).as_posix()
     if not os.path.exists(result):
+        output_dir = tempfile.mkdtemp(dir=file_writer_config["tex_dir"])
+        output_file = Path(output_dir, os.path.basename(result)).as_posix()
         commands = [
             "dvisvgm",
             '"{}"'.format(dvi_file),
@@ -94,9 +340,51 @@ def dvi_to_svg(dvi_file, use_ctex=False, regen_if_exists=False):
             "-v",
             "0",
             "-o",
-            '"{}"'.format(result),
+            '"{}"'.format(output_file),
             ">",
             os.devnull,
         ]
-        os.system(" ".join(commands))
+        try:
+            os.system(" ".join(commands))
+            if os.path.exists(output_file):
+                os.replace(output_file, result)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
     return result
+
+
+def dvi_to_svg_pages(dvi_file, output_dir):
+    """Converts each page of a dvi (or xdv) file into an svg file.
+
+    Parameters
+    ----------
+    dvi_file : :class:`str`
+        The path of the dvi file.
+    output_dir : :class:`str`
+        The directory to write the svg files to.
+
+    Returns
+    -------
+    List[:class:`str`]
+        The paths of the svg files, in the order of the pages.
+    """
+    commands = [
+        "dvisvgm",
+        '"{}"'.format(Path(dvi_file).as_posix()),
+        "-n",
+        "-p",
+        "1-",
+        "-v",
+        "0",
+        "-o",
+        '"{}"'.format(Path(output_dir, "%p.svg").as_posix()),
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+    pages = {}
+    for file_name in os.listdir(output_dir):
+        page, extension = os.path.splitext(file_name)
+        if extension == ".svg" and page.isdigit():
+            pages[int(page)] = os.path.join(output_dir, file_name)
+    return [pages[page] for page in sorted(pages)]
@@ -0,0 +1,149 @@
+"""Compare the JSON + CRC32 hashing of play calls to the structural blake2b hashing.
+
+Usage: python scripts/benchmark_hashing.py [number of mobjects]
+"""
+import copy
+import inspect
+import json
+import sys
+import zlib
+from time import perf_counter
+from types import ModuleType
+
+import numpy as np
+
+from manim import Camera, Square, VGroup, FadeIn, RIGHT
+from manim.utils.hashing import get_camera_dict_for_hashing, get_hash_from_play_call
+
+
+# The JSON encoding that StructuralHasher replaced, kept here for comparison.
+class CustomEncoder(json.JSONEncoder):
+    def default(self, obj):
+        """
+        This method is used to serialize objects to JSON format.
+
+        If obj is a function, then it will return a dict with two keys : 'code', for the code source, and 'nonlocals' for all nonlocalsvalues. (including nonlocals functions, that will be serialized as this is recursive.)
+        if obj is a np.darray, it converts it into a list.
+        if obj is an object with __dict__ attribute, it returns its __dict__.
+        Else, will let the JSONEncoder do the stuff, and throw an error if the type is not suitable for JSONEncoder.
+
+        Parameters
+        ----------
+        obj : Any
+            Arbitrary object to convert
+
+        Returns
+        -------
+        Any
+            Python object that JSON encoder will recognize
+
+        """
+        if inspect.isfunction(obj) and not isinstance(obj, ModuleType):
+            cvars = inspect.getclosurevars(obj)
+            cvardict = {**copy.copy(cvars.globals), **copy.copy(cvars.nonlocals)}
+            for i in list(cvardict):
+                # NOTE : All module types objects are removed, because otherwise it throws ValueError: Circular reference detected if not. TODO
+                if isinstance(cvardict[i], ModuleType):
+                    del cvardict[i]
+            return {"code": inspect.getsource(obj), "nonlocals": cvardict}
+        elif isinstance(obj, np.ndarray):
+            return list(obj)
+        elif hasattr(obj, "__dict__"):
+            temp = getattr(obj, "__dict__")
+            return self._encode_dict(temp)
+        elif isinstance(obj, np.uint8):
+            return int(obj)
+        try:
+            return json.JSONEncoder.default(self, obj)
+        except TypeError:
+            # This is used when the user enters an unknown type in CONFIG. Rather than throwing an error, we transform
+            # it into a string "Unsupported type for hashing" so that it won't affect the hash.
+            return "Unsupported type for hashing"
+
+    def _encode_dict(self, obj):
+        """Clean dicts to be serialized : As dict keys must be of the type (str, int, float, bool), we have to change them when they are not of the right type.
+        To do that, if one is not of the good type we turn it into its hash using the same
+        method as all the objects here.
+
+        Parameters
+        ----------
+        obj : Any
+            The obj to be cleaned.
+
+        Returns
+        -------
+        Any
+            The object cleaned following the processus above.
+        """
+
+        def key_to_hash(key):
+            if not isinstance(key, (str, int, float, bool)) and key is not None:
+                # print('called')
+                return zlib.crc32(json.dumps(key, cls=CustomEncoder).encode())
+            return key
+
+        if isinstance(obj, dict):
+            return {key_to_hash(k): self._encode_dict(v) for k, v in obj.items()}
+        return obj
+
+    def encode(self, obj):
+        return super().encode(self._encode_dict(obj))
+
+
+def get_json(obj):
+    """Recursively serialize `object` to JSON using the :class:`CustomEncoder` class.
+
+    Paramaters
+    ----------
+    dict_config : :class:`dict`
+        The dict to flatten
+
+    Returns
+    -------
+    :class:`str`
+        The flattened object
+    """
+    return json.dumps(obj, cls=CustomEncoder)
+
+
+def get_hash_from_play_call_json(camera_object, animations_list, current_mobjects_list):
+    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
+    animations_list_json = [
+        get_json(x) for x in sorted(animations_list, key=lambda obj: str(obj))
+    ]
+    current_mobjects_list_json = [
+        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
+    ]
+    return "{}_{}_{}".format(
+        zlib.crc32(repr(camera_json).encode()),
+        zlib.crc32(repr(animations_list_json).encode()),
+        zlib.crc32(repr(current_mobjects_list_json).encode()),
+    )
+
+
+def time_it(function, *args):
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def main(n_mobjects):
+    camera = Camera()
+    group = VGroup(*[Square().shift(i * 0.001 * RIGHT) for i in range(n_mobjects)])
+    animations = [FadeIn(group)]
+    for name, function in [
+        ("json + crc32", get_hash_from_play_call_json),
+        ("blake2b", get_hash_from_play_call),
+    ]:
+        duration = time_it(function, camera, animations, [group])
+        print(f"{name:>14}: {duration:.3f}s for {n_mobjects} mobjects")
+    # The states of the unchanged mobjects are memoized
+    duration = time_it(get_hash_from_play_call, camera, animations, [group])
+    print(f"{'blake2b again':>14}: {duration:.3f}s for {n_mobjects} mobjects")
+    group[0].shift(RIGHT)
+    duration = time_it(get_hash_from_play_call, camera, animations, [group])
+    print(f"{'one changed':>14}: {duration:.3f}s for {n_mobjects} mobjects")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,100 @@
+"""Compare the time taken to capture frames on one thread and in bands on several.
+
+The frames are made of the kind of mobjects drawn by the graphical unit tests,
+many times over, at 4K by default.
+
+Usage: python scripts/benchmark_raster_threads.py [pixel height] [numbers of threads...]
+
+The numbers of threads default to 1, 2 and 4.
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from manim import (
+    Camera,
+    Circle,
+    NumberPlane,
+    RegularPolygon,
+    Square,
+    VGroup,
+    DOWN,
+    LEFT,
+    RIGHT,
+    UP,
+)
+
+
+def get_scenes():
+    grid = [
+        (x * RIGHT + y * UP)
+        for x in np.arange(-6, 6.5, 1)
+        for y in np.arange(-3, 3.5, 1)
+    ]
+    return {
+        "shapes": [
+            VGroup(
+                Circle(radius=0.4).set_fill(opacity=0.5).move_to(point),
+                Square(side_length=0.5).set_stroke(width=8).move_to(point),
+            )
+            for point in grid
+        ],
+        "polygons": [
+            RegularPolygon(n=8, start_angle=i * 0.1)
+            .scale(3)
+            .set_fill(opacity=0.2)
+            .set_stroke(width=2)
+            for i in range(100)
+        ],
+        "triangles": [
+            RegularPolygon(n=3).scale(0.5).set_fill(opacity=1).move_to(point + DOWN / 2)
+            for point in grid
+        ]
+        + [RegularPolygon(n=5).scale(3).set_fill(opacity=0.3).shift(2 * LEFT)],
+        "plane": [NumberPlane()],
+        "dots": [
+            Circle(radius=0.05).set_fill(opacity=1).move_to(x * RIGHT + y * UP)
+            for x in np.arange(-7, 7, 0.2)
+            for y in np.arange(-4, 4, 0.2)
+        ],
+    }
+
+
+def time_capture(camera, mobjects, n_frames):
+    camera.capture_mobjects(mobjects)
+    start = perf_counter()
+    for _ in range(n_frames):
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+    return (perf_counter() - start) / n_frames
+
+
+def main(pixel_height, thread_counts, n_frames=5):
+    pixel_width = pixel_height * 16 // 9
+    for name, mobjects in get_scenes().items():
+        n_vmobjects = len(VGroup(*mobjects).family_members_with_points())
+        results = []
+        for threads in thread_counts:
+            camera = Camera(
+                pixel_height=pixel_height,
+                pixel_width=pixel_width,
+                raster_threads=threads,
+            )
+            duration = time_capture(camera, mobjects, n_frames)
+            results.append((threads, duration, camera.pixel_array.astype(int)))
+        _, reference, reference_array = results[0]
+        print(f"{name} ({n_vmobjects} vmobjects):")
+        for threads, duration, pixel_array in results:
+            difference = np.abs(pixel_array - reference_array).max()
+            print(
+                f"{threads:>4} thread(s): {1000 * duration:8.1f} ms per frame "
+                f"(x{reference / duration:.2f}, max pixel difference {difference})"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2160,
+        [int(arg) for arg in sys.argv[2:]] or [1, 2, 4],
+    )
@@ -1,5 +1,18 @@
 import pytest
-from manim import Camera, tempconfig, config
+import numpy as np
+from PIL import Image
+from manim import (
+    Camera,
+    Circle,
+    ImageMobject,
+    PMobject,
+    Square,
+    LEFT,
+    RIGHT,
+    ORIGIN,
+    tempconfig,
+    config,
+)
 
 
 def test_camera():
@@ -14,3 +27,137 @@ def test_camera():
         assert Camera().frame_width == 100
         # ..init args still override new config
         assert Camera(frame_width=10).frame_width == 10
+
+
+def test_capture_mobjects_over_background():
+    """Test that restoring only the dirty region gives the same frame as a full redraw."""
+    static_camera = Camera()
+    static_camera.capture_mobjects([Circle()])
+    background = static_camera.pixel_array.copy()
+
+    camera = Camera()
+    square = Square()
+    for _ in range(3):
+        square.shift(RIGHT)
+        camera.capture_mobjects_over_background([square], background)
+
+    expected = Camera()
+    expected.set_pixel_array(background)
+    expected.capture_mobjects([square])
+    np.testing.assert_array_equal(camera.pixel_array, expected.pixel_array)
+
+
+def test_cull_offscreen_mobjects():
+    """Test that only the mobjects outside of the frame are left out."""
+    camera = Camera()
+    inside = Square()
+    partly_inside = Square().move_to(RIGHT * config["frame_x_radius"])
+    outside = Circle().shift(RIGHT * 2 * config["frame_width"])
+    mobjects = [inside, partly_inside, outside]
+    assert camera.get_mobjects_to_display(mobjects) == [inside, partly_inside]
+
+    # The cached bounds follow the mobjects as they move
+    outside.move_to(inside)
+    inside.shift(LEFT * 2 * config["frame_width"])
+    assert camera.get_mobjects_to_display(mobjects) == [partly_inside, outside]
+    assert not camera.is_in_frame(inside)
+
+
+def test_raster_threads():
+    """Test that drawing the frame in bands gives the same frame as drawing it at once."""
+    mobjects = [
+        Circle(radius=3).set_fill(opacity=0.5),
+        Square(side_length=1.5).set_stroke(width=20),
+        Square().shift(LEFT * 4).rotate(0.3),
+    ]
+    expected = Camera()
+    expected.capture_mobjects(mobjects)
+    camera = Camera(raster_threads=4)
+    camera.capture_mobjects(mobjects)
+    # Cairo may round the antialiased edges differently in each band
+    np.testing.assert_allclose(
+        camera.pixel_array.astype(int), expected.pixel_array.astype(int), atol=1
+    )
+
+
+def test_point_cloud_alpha_blending():
+    """Test that overlapping translucent points are blended in order."""
+    camera = Camera()
+    pmobject = PMobject()
+    pmobject.add_points(
+        [ORIGIN, ORIGIN], rgbas=np.array([[1, 0, 0, 0.5], [0, 0, 1, 0.5]])
+    )
+    background = camera.pixel_array.copy()
+    camera.capture_mobjects([pmobject])
+    x, y = camera.points_to_pixel_coords(pmobject, np.array([ORIGIN]))[0]
+    # Red over the black background, then blue over both
+    np.testing.assert_array_equal(camera.pixel_array[y, x], [63, 0, 127, 255])
+    # Only the pixels around the points are painted
+    changed = np.any(camera.pixel_array != background, axis=2)
+    assert 0 < changed.sum() <= 25
+
+
+def test_overlay_rgba_array():
+    """Test that overlaying an array composites only where it is not transparent."""
+    camera = Camera()
+    random = np.random.default_rng(0)
+    background = random.integers(0, 256, camera.pixel_array.shape, dtype=np.uint8)
+    new_array = np.zeros_like(background)
+    new_array[100:200, 300:500] = random.integers(0, 256, (100, 200, 4))
+    expected = np.array(
+        Image.alpha_composite(camera.get_image(background), camera.get_image(new_array))
+    )
+    camera.overlay_rgba_array(background, new_array)
+    np.testing.assert_array_equal(background, expected)
+
+
+def test_image_mobject_out_of_frame():
+    """Test that an image partly out of the frame is clipped to it."""
+    camera = Camera()
+    image = ImageMobject(np.full((10, 10, 4), 255, dtype=np.uint8)).scale(2)
+    image.move_to(RIGHT * config["frame_x_radius"])
+    camera.capture_mobjects([image])
+    white = np.all(camera.pixel_array == 255, axis=2)
+    columns = np.flatnonzero(white.any(axis=0))
+    assert columns[-1] == camera.pixel_width - 1
+    assert abs(len(columns) - camera.pixel_width * 2 / config["frame_width"]) <= 2
+
+
+def test_pixel_array_buffers():
+    """Test that a pixel array handed over is only drawn into again once released."""
+    camera = Camera(n_pixel_array_buffers=3)
+    handed_over = []
+    for _ in range(3):
+        handed_over.append(camera.pixel_array)
+        if len(handed_over) < 3:
+            camera.swap_pixel_array()
+    # Three distinct buffers, none of them is free
+    assert len({id(buffer) for buffer in handed_over}) == 3
+    assert camera.free_pixel_arrays.empty()
+
+    camera.release_pixel_array(handed_over[1])
+    camera.swap_pixel_array()
+    assert camera.pixel_array is handed_over[1]
+
+    # Buffers left from before the pixel array was replaced are not reused
+    camera.reset_pixel_shape(camera.pixel_height // 2, camera.pixel_width // 2)
+    camera.release_pixel_array(handed_over[0])
+    camera.swap_pixel_array()
+    assert all(camera.pixel_array is not buffer for buffer in handed_over)
+
+
+def test_display_key():
+    """Test that the display key changes with the background and the mobjects."""
+    camera = Camera()
+    square = Square()
+    key = camera.get_display_key([square])
+    assert camera.get_display_key([square]) == key
+    camera.set_background(camera.background.copy())
+    assert camera.get_display_key([square]) != key
+    key = camera.get_display_key([square])
+    camera.background[:10] = 255
+    camera.increment_background_version()
+    assert camera.get_display_key([square]) != key
+    key = camera.get_display_key([square])
+    square.shift(RIGHT)
+    assert camera.get_display_key([square]) != key
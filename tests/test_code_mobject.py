@@ -0,0 +1,38 @@
+import numpy as np
+
+from manim import Code, file_writer_config
+
+
+def test_code_cache(tmp_path, monkeypatch):
+    """Test that a Code mobject is loaded from the cache until its file is edited."""
+    monkeypatch.setitem(file_writer_config, "text_dir", str(tmp_path))
+    built = []
+    gen_html_string = Code.gen_html_string
+
+    def counting_gen_html_string(self):
+        built.append(self)
+        gen_html_string(self)
+
+    monkeypatch.setattr(Code, "gen_html_string", counting_gen_html_string)
+    code_file = tmp_path / "code.py"
+    code_file.write_text("def f(x):\n    return x + 1\n")
+
+    code = Code(str(code_file), language="python")
+    assert len(built) == 1
+    assert len(list(tmp_path.glob("code_*.npz"))) == 1
+
+    cached = Code(str(code_file), language="python")
+    assert len(built) == 1
+    for mob, cached_mob in zip(code.get_family(), cached.get_family()):
+        assert len(cached_mob) == len(mob)
+        np.testing.assert_allclose(cached_mob.points, mob.points)
+        np.testing.assert_allclose(cached_mob.fill_rgbas, mob.fill_rgbas)
+        np.testing.assert_allclose(cached_mob.stroke_rgbas, mob.stroke_rgbas)
+    assert len(cached.get_family()) == len(code.get_family())
+    assert len(cached.code) == len(code.code)
+    assert cached.code_json == code.code_json
+
+    code_file.write_text("def f(x):\n    return x + 2\n")
+    Code(str(code_file), language="python")
+    assert len(built) == 2
+    assert len(list(tmp_path.glob("code_*.npz"))) == 2
@@ -0,0 +1,94 @@
+import subprocess
+import sys
+
+import numpy as np
+from manim import Camera, Circle, Square, VGroup, ValueTracker, RIGHT
+from manim.utils.hashing import get_camera_dict_for_hashing, get_hash
+
+
+def test_hash_is_deterministic():
+    assert get_hash(Circle()) == get_hash(Circle())
+    assert get_hash([1, "a", None, (2.5,)]) == get_hash([1, "a", None, (2.5,)])
+
+
+def test_hash_depends_on_array_content():
+    array = np.zeros((3, 3))
+    assert get_hash(array) != get_hash(np.ones((3, 3)))
+    assert get_hash(array) != get_hash(np.zeros((3, 3), dtype=np.float32))
+    assert get_hash(array) != get_hash(np.zeros(9))
+    assert get_hash(Square()) != get_hash(Square().shift(0.001))
+
+
+def test_hash_handles_cycles_and_shared_objects():
+    a = []
+    a.append(a)
+    b = []
+    b.append(b)
+    assert get_hash(a) == get_hash(b)
+    circle = Circle()
+    assert get_hash(VGroup(circle, circle)) != get_hash(VGroup(circle, Circle()))
+
+
+def test_hash_of_functions():
+    def f(x):
+        return x + 1
+
+    def g(x):
+        return x + 2
+
+    assert get_hash(f) != get_hash(g)
+
+
+def test_mutations_change_version_and_hash():
+    square = Square()
+    version = square.version
+    group = VGroup(square, Circle())
+    group_hash = get_hash(group)
+    assert get_hash(group) == group_hash
+    square.shift(RIGHT)
+    assert square.version != version
+    assert get_hash(group) != group_hash
+
+    tracker = ValueTracker(0)
+    tracker_hash = get_hash(tracker)
+    tracker.set_value(1)
+    assert get_hash(tracker) != tracker_hash
+
+
+def test_bookkeeping_attributes_keep_version_and_hash():
+    square = Square()
+    version = square.version
+    square_hash = get_hash(square)
+    square.suspend_updating()
+    square._cached_value = 1
+    assert square.version == version
+    assert get_hash(square) == square_hash
+    square.stroke_width = 10
+    assert square.version != version
+    assert get_hash(square) != square_hash
+
+
+CAMERA_HASH_SCRIPT = """
+from manim import Camera, Square
+from manim.utils.hashing import get_camera_dict_for_hashing, get_hash
+camera = Camera()
+camera.capture_mobjects_over_background([Square()], camera.pixel_array.copy())
+print(get_hash(get_camera_dict_for_hashing(camera)))
+"""
+
+
+def test_camera_hash_is_stable():
+    camera = Camera()
+    camera_hash = get_hash(get_camera_dict_for_hashing(camera))
+    # Rendering a frame records rendering state (dirty rectangles, cairo
+    # contexts keyed by id) which must not be part of the hash
+    camera.capture_mobjects_over_background([Square()], camera.pixel_array.copy())
+    assert get_hash(get_camera_dict_for_hashing(camera)) == camera_hash
+    for _ in range(2):
+        output = subprocess.run(
+            [sys.executable, "-c", CAMERA_HASH_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert output.strip().splitlines()[-1] == camera_hash
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from manim import BackgroundRectangle, DecimalNumber, LEFT, RED
+from manim.utils.color import color_to_rgb
+
+
+def test_set_value_from_glyphs():
+    """Test that updating the characters in place gives the number built from scratch."""
+    number = DecimalNumber(9.99).scale(2).set_color(RED)
+    fixed_point = number.get_left()
+    for value, num_string in [(10, "10.00"), (-1, "-1.00")]:
+        assert number.set_value_from_glyphs(value)
+        assert number.num_string == num_string
+        expected = DecimalNumber(value).scale(2).move_to(fixed_point, LEFT)
+        assert len(number) == len(expected)
+        for char, expected_char in zip(number, expected):
+            np.testing.assert_allclose(char.get_height(), expected_char.get_height())
+        np.testing.assert_allclose(
+            number.get_all_points(), expected.get_all_points(), atol=1e-6
+        )
+        np.testing.assert_allclose(number.get_left(), fixed_point, atol=1e-6)
+        # The characters that were added have the style of the number
+        for char in number.family_members_with_points():
+            np.testing.assert_allclose(
+                color_to_rgb(char.get_fill_color()), color_to_rgb(RED)
+            )
+
+
+def test_set_value_fallback():
+    """Test that numbers whose characters can't be updated in place are rebuilt."""
+    number = DecimalNumber(1, include_background_rectangle=True)
+    assert not number.set_value_from_glyphs(2)
+    number.set_value(20)
+    assert number.num_string == "20.00"
+    assert isinstance(number[0], BackgroundRectangle)
+
+    removed = DecimalNumber(1)
+    removed.remove(*removed[1:])
+    assert not removed.set_value_from_glyphs(2)
+    removed.set_value(2)
+    assert removed.num_string == "2.00"
+    assert len(removed) == 4
+    # After being rebuilt, the number is updated in place again
+    assert removed.set_value_from_glyphs(-3)
+    assert removed.num_string == "-3.00"
+    assert len(removed) == 5
+
+
+def test_set_value_flattened():
+    """Test that flattened characters are replaced by copies of their glyphs."""
+    number = DecimalNumber(1)
+    fixed_point = number.get_left()
+    number.submobjects = number.family_members_with_points()
+    assert number.set_value_from_glyphs(2)
+    assert number.num_string == "2.00"
+    expected = DecimalNumber(2).move_to(fixed_point, LEFT)
+    np.testing.assert_allclose(
+        number.get_all_points(), expected.get_all_points(), atol=1e-6
+    )
+
+
+def test_glyph_atlas_size(monkeypatch):
+    """Test that the glyphs used the longest ago are forgotten past the size."""
+    monkeypatch.setattr("manim.mobject.numbers.GLYPH_ATLAS_SIZE", 2)
+    monkeypatch.setattr(DecimalNumber, "glyph_atlas", OrderedDict())
+    number = DecimalNumber(1)
+    one = number.get_glyph("1", number.glyph_atlas_key)
+    number.get_glyph("2", number.glyph_atlas_key)
+    assert number.get_glyph("1", number.glyph_atlas_key) is one
+    number.get_glyph("3", number.glyph_atlas_key)
+    assert [char for _, char in DecimalNumber.glyph_atlas] == ["1", "3"]
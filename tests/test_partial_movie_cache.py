@@ -0,0 +1,103 @@
+import itertools
+import os
+
+import pytest
+
+from manim import file_writer_config
+from manim.config import cache_subcmds
+from manim.utils import partial_movie_cache
+from manim.utils.partial_movie_cache import PartialMovieCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Makes each use recorded by the cache one second later than the previous one."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(partial_movie_cache.time, "time", lambda: next(ticks))
+
+
+def write_movies(directory, sizes):
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, size in enumerate(sizes):
+        path = os.path.join(directory, f"movie{index}.mp4")
+        with open(path, "wb") as file:
+            file.write(b"\0" * size)
+        paths.append(path)
+    return paths
+
+
+def test_record_use(tmp_path, clock):
+    """Test that the index records the size and the hits of the files used."""
+    cache = PartialMovieCache(str(tmp_path / "cache.db"))
+    directory = str(tmp_path / "partial_movie_files" / "Scene")
+    paths = write_movies(directory, [10, 20])
+    cache.record_use(paths)
+    assert cache.get_stats() == [(directory, 2, 30, 0)]
+
+    # Only the files that were already cached count as hits
+    cache.record_use(paths, hits=paths[:1])
+    cache.record_use(paths, hits=paths[:1])
+    assert cache.get_stats() == [(directory, 2, 30, 2)]
+
+    # Missing files are not recorded
+    cache.record_use([os.path.join(directory, "missing.mp4")])
+    cache.forget(paths[1:])
+    assert cache.get_stats() == [(directory, 1, 10, 2)]
+
+
+def test_evict(tmp_path, clock):
+    """Test that the files used the longest ago are removed first."""
+    cache = PartialMovieCache(str(tmp_path / "cache.db"))
+    directory = str(tmp_path / "partial_movie_files" / "Scene")
+    paths = write_movies(directory, [10, 10, 10, 10])
+    for path in paths:
+        cache.record_use([path])
+    # Using the first file again makes the second one the oldest
+    cache.record_use(paths[:1], hits=paths[:1])
+
+    assert cache.evict(max_size=25) == (2, 20)
+    assert [os.path.exists(path) for path in paths] == [True, False, False, True]
+    assert cache.get_stats() == [(directory, 2, 20, 1)]
+
+    assert cache.evict(max_files=1, directory=directory) == (1, 10)
+    assert [os.path.exists(path) for path in paths] == [True, False, False, False]
+    assert cache.evict(max_size=10) == (0, 0)
+
+
+def test_synchronize(tmp_path, clock):
+    """Test that the index is made to match the partial movie files on disk."""
+    cache = PartialMovieCache(str(tmp_path / "cache.db"))
+    directory = str(tmp_path / "partial_movie_files" / "Scene")
+    indexed = write_movies(directory, [10, 20])
+    cache.record_use(indexed)
+    os.remove(indexed[1])
+    # Written without the index, e.g. by an older version of manim
+    unindexed = os.path.join(directory, "unindexed.mp4")
+    with open(unindexed, "wb") as file:
+        file.write(b"\0" * 5)
+    os.utime(unindexed, (0, 0))
+    with open(os.path.join(directory, "partial_movie_file_list.txt"), "w") as file:
+        file.write("file 'movie0.mp4'")
+    write_movies(str(tmp_path / "images"), [100])
+
+    cache.synchronize(str(tmp_path))
+    assert cache.get_stats() == [(directory, 2, 15, 0)]
+    # The file only found on disk has never been used since it was written
+    assert cache.evict(max_size=10) == (1, 5)
+    assert not os.path.exists(unindexed)
+    assert os.path.exists(indexed[0])
+
+
+def test_prune(tmp_path, monkeypatch, clock):
+    """Test that ``manim cache prune`` indexes the files and prunes the oldest ones."""
+    monkeypatch.setitem(file_writer_config, "media_dir", str(tmp_path))
+    monkeypatch.setitem(file_writer_config, "video_dir", str(tmp_path / "videos"))
+    paths = write_movies(
+        str(tmp_path / "videos" / "partial_movie_files" / "Scene"), [2 ** 20] * 3
+    )
+    for index, path in enumerate(paths):
+        os.utime(path, (index, index))
+    cache_subcmds.stats()
+    cache_subcmds.prune(max_size=1)
+    assert [os.path.exists(path) for path in paths] == [False, False, True]
@@ -6,3 +6,18 @@ class SquareToCircle(Scene):
         square = Square()
         circle = Circle()
         self.play(Transform(square, circle))
+
+
+class SceneWithSeveralSegments(Scene):
+    def construct(self):
+        square = Square()
+        self.play(ShowCreation(square))
+        self.wait(0.5)
+        self.play(square.shift, RIGHT)
+        self.play(Transform(square, Circle()))
+
+
+class SceneWithStaticWait(Scene):
+    def construct(self):
+        self.add(Square())
+        self.wait(1)
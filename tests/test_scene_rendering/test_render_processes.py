@@ -0,0 +1,91 @@
+import os
+import subprocess
+
+from ..utils.commands import capture
+
+
+def render(simple_scenes_path, media_dir, *flags):
+    command = [
+        "python",
+        "-m",
+        "manim",
+        simple_scenes_path,
+        "SceneWithSeveralSegments",
+        "-l",
+        "--media_dir",
+        str(media_dir),
+        *flags,
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+    return os.path.join(str(media_dir), "videos", "simple_scenes", "480p15")
+
+
+def decode_frames(path):
+    return subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-i",
+            path,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+
+
+def test_render_processes(tmp_path, simple_scenes_path):
+    """Test that rendering the segments in parallel gives the same partial movies
+    and the same movie as rendering them one after another."""
+    serial_dir = render(simple_scenes_path, tmp_path / "serial")
+    parallel_dir = render(
+        simple_scenes_path, tmp_path / "parallel", "--render_processes", "2"
+    )
+
+    partial_movies = os.path.join("partial_movie_files", "SceneWithSeveralSegments")
+    serial_files = sorted(
+        name
+        for name in os.listdir(os.path.join(serial_dir, partial_movies))
+        if name.endswith(".mp4")
+    )
+    parallel_files = sorted(
+        name
+        for name in os.listdir(os.path.join(parallel_dir, partial_movies))
+        if name.endswith(".mp4")
+    )
+    assert len(serial_files) == 4
+    assert parallel_files == serial_files
+    for name in serial_files:
+        assert decode_frames(
+            os.path.join(parallel_dir, partial_movies, name)
+        ) == decode_frames(os.path.join(serial_dir, partial_movies, name))
+
+    movie = "SceneWithSeveralSegments.mp4"
+    assert decode_frames(os.path.join(parallel_dir, movie)) == decode_frames(
+        os.path.join(serial_dir, movie)
+    )
+
+
+def test_render_processes_save_pngs(tmp_path, simple_scenes_path):
+    """Test that the pngs written by several processes are numbered as the
+    frames of the scene."""
+    pngs = {}
+    for name, flags in [("serial", []), ("parallel", ["--render_processes", "2"])]:
+        render(simple_scenes_path, tmp_path / name, "--save_pngs", *flags)
+        image_dir = os.path.join(str(tmp_path / name), "simple_scenes")
+        pngs[name] = {}
+        for file_name in os.listdir(image_dir):
+            with open(os.path.join(image_dir, file_name), "rb") as file:
+                pngs[name][file_name] = file.read()
+    # 1s of ShowCreation, 0.5s of waiting and two 1s animations at 15 fps
+    expected_names = {
+        f"SceneWithSeveralSegments{number}.png" for number in range(15 + 7 + 15 + 15)
+    }
+    assert set(pngs["serial"]) == expected_names
+    assert pngs["parallel"] == pngs["serial"]
@@ -0,0 +1,45 @@
+import os
+import subprocess
+
+from ..utils.commands import capture
+
+
+def test_static_wait(tmp_path, simple_scenes_path):
+    """Test that a wait without updaters is encoded from a single held frame
+    repeated for the whole wait."""
+    command = [
+        "python",
+        "-m",
+        "manim",
+        simple_scenes_path,
+        "SceneWithStaticWait",
+        "-l",
+        "-v",
+        "DEBUG",
+        "--media_dir",
+        str(tmp_path),
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+    assert "15 frames encoded from a single held frame" in " ".join((out + err).split())
+
+    movie = os.path.join(
+        str(tmp_path), "videos", "simple_scenes", "480p15", "SceneWithStaticWait.mp4"
+    )
+    frames = subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-i",
+            movie,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    assert len(frames) == 15 * 854 * 480 * 3
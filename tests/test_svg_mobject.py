@@ -0,0 +1,56 @@
+import numpy as np
+from manim import SVGMobject, VMobjectFromSVGPathstring
+from manim.mobject.svg.svg_path import path_string_to_points
+
+SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
+<defs>
+<path id="g0" d="M 0 0 L 10 0 C 10 5 5 10 0 10 Z"/>
+</defs>
+<use x="3" y="4" xlink:href="#g0"/>
+<rect x="1" y="2" width="8" height="1"/>
+</svg>
+"""
+
+
+def test_geometry_cache(tmp_path):
+    svg_file = tmp_path / "shape.svg"
+    svg_file.write_text(SVG)
+    parsed = SVGMobject(str(svg_file), cache_geometry=True)
+    assert len(list(tmp_path.glob("shape_*.npz"))) == 1
+    loaded = SVGMobject(str(svg_file), cache_geometry=True)
+    assert len(loaded.submobjects) == len(parsed.submobjects)
+    for parsed_submob, loaded_submob in zip(parsed.submobjects, loaded.submobjects):
+        np.testing.assert_allclose(parsed_submob.points, loaded_submob.points)
+
+
+def test_parsed_path_cache():
+    path_string = "M 0 0 L 10 0 C 10 5 5 10 0 10 Z"
+    first = VMobjectFromSVGPathstring(path_string)
+    second = VMobjectFromSVGPathstring(path_string)
+    np.testing.assert_allclose(first.points, second.points)
+    second.shift(np.array([1, 0, 0]))
+    assert not np.allclose(first.points, second.points)
+
+
+def test_path_string_to_points():
+    # Relative and implicit commands, closing line
+    np.testing.assert_allclose(
+        path_string_to_points("m1 1 2 0v2z")[[0, 3, 7, 11]],
+        [[1, 1], [3, 1], [3, 3], [1, 1]],
+    )
+    # Quadratic curves are converted exactly, and T reflects the control point
+    np.testing.assert_allclose(
+        path_string_to_points("M0 0Q1 1 2 0T4 0"),
+        [[0, 0], [2 / 3, 2 / 3], [4 / 3, 2 / 3], [2, 0]]
+        + [[2, 0], [8 / 3, -2 / 3], [10 / 3, -2 / 3], [4, 0]],
+    )
+    # A half circle, with flags written without separators
+    curves = path_string_to_points("M1 0A1 1 0 01-1 0").reshape((-1, 4, 2))
+    assert len(curves) == 2
+    np.testing.assert_allclose(curves[-1, -1], [-1, 0])
+    for t in np.linspace(0, 1, 5):
+        weights = [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3]
+        points = np.einsum("i,cij->cj", weights, curves)
+        np.testing.assert_allclose(np.linalg.norm(points, axis=1), 1, atol=1e-3)
+        assert np.all(points[:, 1] >= -1e-9)
@@ -0,0 +1,31 @@
+import numpy as np
+from manim import Square, Circle, tempconfig
+from manim.utils.template_cache import TemplateCache
+
+
+def test_template_cache():
+    cache = TemplateCache()
+    square = Square()
+    key = cache.get_key(square, "square")
+    assert cache.get_key(Square(), "square") == key
+    assert cache.get_key(Square(), "other") != key
+    assert not cache.restore(Circle(), key)
+    cache.store(square, key)
+    circle = Circle()
+    assert cache.restore(circle, key)
+    np.testing.assert_allclose(circle.points, square.points)
+    circle.shift(np.array([1, 0, 0]))
+    assert not np.allclose(circle.points, square.points)
+
+
+def test_template_cache_size():
+    cache = TemplateCache()
+    size = TemplateCache.get_size(Square())
+    with tempconfig({"max_template_cache_size": 2 * size}):
+        for side_length in range(3):
+            square = Square(side_length=side_length)
+            cache.store(square, cache.get_key(square))
+        assert len(cache.templates) == 2
+        assert cache.size == 2 * size
+    with tempconfig({"max_template_cache_size": 0}):
+        assert cache.get_key(Square()) is None
@@ -0,0 +1,211 @@
+import os
+import sys
+
+import pytest
+
+from manim import MathTex, Tex, config, file_writer_config
+from manim.mobject.svg import tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.template_cache import TemplateCache
+from manim.utils.tex import TexTemplate
+from manim.utils.tex_file_writing import (
+    get_batch_template,
+    get_svg_file_path,
+    tex_to_svg_files,
+)
+
+# Stand-ins for latex and dvisvgm: the "dvi" file is a copy of the tex file, and
+# each page of the svg output is the text of a page of the document.
+FAKE_LATEX = r"""
+import os, shutil, sys
+output_dir = next(
+    arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("-output-directory=")
+)
+tex_file = sys.argv[-1]
+with open(os.environ["FAKE_TEX_LOG"], "a") as log:
+    log.write("latex " + os.path.basename(tex_file) + "\n")
+with open(tex_file) as infile:
+    text = infile.read()
+if "\\clearpage" in text and os.environ.get("FAKE_TEX_FAIL") == "batch":
+    sys.exit(1)
+name = os.path.splitext(os.path.basename(tex_file))[0]
+shutil.copy(tex_file, os.path.join(output_dir, name + ".dvi"))
+"""
+
+FAKE_DVISVGM = r"""
+import os, sys
+dvi_file = sys.argv[1]
+output = sys.argv[sys.argv.index("-o") + 1]
+with open(os.environ["FAKE_TEX_LOG"], "a") as log:
+    log.write("dvisvgm " + os.path.basename(dvi_file) + "\n")
+with open(dvi_file) as infile:
+    text = infile.read()
+body = text.split("\\begin{document}")[1].split("\\end{document}")[0]
+if "-p" in sys.argv:
+    pages = body.split("\\clearpage")
+    if os.environ.get("FAKE_TEX_FAIL") == "pages":
+        pages = pages[:-1]
+    for number, page in enumerate(pages, 1):
+        with open(output.replace("%p", str(number)), "w") as outfile:
+            outfile.write(page.strip())
+else:
+    with open(output, "w") as outfile:
+        outfile.write(body.strip())
+"""
+
+SCENE_SOURCE = r"""
+from manim import *
+
+
+class Formulas(Scene):
+    def construct(self):
+        self.play(Write(MathTex("x^2", "+1")))
+        self.add(Tex("Hello", color=RED), TexMobject("\\pi"))
+        self.add(manim.Tex("World"), MathTex("e", tex_to_color_map={"e": RED}))
+        self.add(MathTex(some_string), Tex(), Text("not tex"))
+"""
+
+
+@pytest.fixture
+def fake_tex(tmp_path, monkeypatch):
+    """Puts fake latex and dvisvgm commands on the PATH, and returns the path of
+    the file logging their calls."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, script in [("latex", FAKE_LATEX), ("dvisvgm", FAKE_DVISVGM)]:
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{script}")
+        path.chmod(0o755)
+    tex_dir = tmp_path / "Tex"
+    tex_dir.mkdir()
+    log_file = tmp_path / "calls.log"
+    log_file.write_text("")
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_TEX_LOG", str(log_file))
+    monkeypatch.setitem(file_writer_config, "tex_dir", str(tex_dir))
+    monkeypatch.setitem(config, "tex_template", TexTemplate())
+    return log_file
+
+
+def read_svg_files(expressions):
+    svg_files = tex_to_svg_files(expressions, "tex")
+    assert svg_files == [
+        get_svg_file_path(expression, config["tex_template"], "tex")
+        for expression in expressions
+    ]
+    contents = []
+    for svg_file in svg_files:
+        with open(svg_file) as infile:
+            contents.append(infile.read())
+    return contents
+
+
+def test_batch_to_svg_files(fake_tex):
+    """Test that the expressions are typeset as the pages of a single document."""
+    expressions = ["x", "y^2", "\\frac{1}{z}"]
+    contents = read_svg_files(expressions)
+    for expression, content in zip(expressions, contents):
+        assert content == "\\begin{align*}\n" + expression + "\n\\end{align*}"
+    calls = fake_tex.read_text().splitlines()
+    assert len(calls) == 2
+    assert calls[0].startswith("latex batch_")
+    assert calls[1].startswith("dvisvgm batch_")
+    tex_dir = file_writer_config["tex_dir"]
+    # Nothing is left from the temporary directories of latex and dvisvgm
+    assert all(
+        os.path.isfile(os.path.join(tex_dir, name)) for name in os.listdir(tex_dir)
+    )
+
+    # The cached expressions are not compiled again
+    assert read_svg_files(expressions[:2] + ["w"])[:2] == contents[:2]
+    assert len(fake_tex.read_text().splitlines()) == 4
+
+
+@pytest.mark.parametrize("failure", ["batch", "pages"])
+def test_batch_to_svg_files_fallback(fake_tex, monkeypatch, failure):
+    """Test that the expressions are compiled one by one when the batch fails."""
+    monkeypatch.setenv("FAKE_TEX_FAIL", failure)
+    expressions = ["a", "b", "c"]
+    contents = read_svg_files(expressions)
+    for expression, content in zip(expressions, contents):
+        assert content == "\\begin{align*}\n" + expression + "\n\\end{align*}"
+    calls = fake_tex.read_text().splitlines()
+    individual_calls = [call for call in calls if "batch_" not in call]
+    assert len(individual_calls) == 2 * len(expressions)
+
+
+def test_get_batch_template():
+    """Test that only the templates using the default document class are batched."""
+    batch_template = get_batch_template(TexTemplate())
+    assert "\\documentclass{article}" in batch_template.body
+    assert "\\pagestyle{empty}" in batch_template.body
+    assert get_batch_template(TexTemplate(documentclass=["beamer", []])) is None
+
+
+def test_write_file_atomically(tmp_path):
+    """Test that the file is replaced at once, without leaving temporary files."""
+    file_path = str(tmp_path / "expression.tex")
+    tex_file_writing.write_file_atomically(file_path, "first")
+    tex_file_writing.write_file_atomically(file_path, "second")
+    assert os.listdir(str(tmp_path)) == ["expression.tex"]
+    with open(file_path, encoding="utf-8") as infile:
+        assert infile.read() == "second"
+
+
+def test_prefetch_tex_from_file(tmp_path, monkeypatch):
+    """Test which tex strings of a scene are found for prefetching."""
+    prefetched = {}
+    monkeypatch.setattr(
+        tex_mobject,
+        "prefetch_tex_strings",
+        lambda strings, tex_class: prefetched.setdefault(tex_class, []).extend(strings),
+    )
+    scene_file = tmp_path / "scene.py"
+    scene_file.write_text(SCENE_SOURCE)
+    tex_mobject.prefetch_tex_from_file(str(scene_file))
+    assert sorted(prefetched[MathTex]) == [["\\pi"], ["x^2", "+1"]]
+    assert sorted(prefetched[Tex]) == [["Hello"], ["World"]]
+    assert len(prefetched) == 2
+
+
+class Typeset(Exception):
+    """Raised instead of typesetting an expression on its own."""
+
+
+def test_math_tex_compiled_at_once(monkeypatch):
+    """Test that a MathTex compiles its whole expression with its parts, except
+    the mobjects found in the template cache."""
+    cache = TemplateCache()
+    keys = []
+    get_key = cache.get_key
+
+    def recording_get_key(mobject, *args):
+        keys.append((mobject.tex_string, get_key(mobject, *args)))
+        return keys[-1][1]
+
+    def tex_to_svg_file(expression, source_type):
+        raise Typeset
+
+    batches = []
+    monkeypatch.setattr(cache, "get_key", recording_get_key)
+    monkeypatch.setattr(tex_mobject, "template_cache", cache)
+    monkeypatch.setattr(
+        tex_mobject,
+        "tex_to_svg_files",
+        lambda expressions, _: batches.append(expressions),
+    )
+    monkeypatch.setattr(tex_mobject, "tex_to_svg_file", tex_to_svg_file)
+
+    with pytest.raises(Typeset):
+        MathTex("x^2", "+", "y")
+    assert batches == [["x^2", "+", "y", "x^2 + y"]]
+    with pytest.raises(Typeset):
+        MathTex("z")
+    assert batches[1] == ["z", "z"]
+
+    for tex_string, key in keys:
+        if tex_string in ("+", "x^2 + y"):
+            cache.templates[key] = None
+    with pytest.raises(Typeset):
+        MathTex("x^2", "+", "y")
+    assert batches[2] == ["x^2", "y"]
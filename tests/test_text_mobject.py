@@ -0,0 +1,13 @@
+import numpy as np
+
+from manim import Text
+
+
+def test_outline_backend():
+    """Test that the outline backend draws the same glyphs as the svg backend."""
+    svg_text = Text("Manim", backend="svg")
+    outline_text = Text("Manim", backend="outline")
+    assert len(outline_text) == len(svg_text)
+    for outline_glyph, svg_glyph in zip(outline_text, svg_text):
+        assert outline_glyph.points.shape == svg_glyph.points.shape
+        np.testing.assert_allclose(outline_glyph.points, svg_glyph.points, atol=1e-3)